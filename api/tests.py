@@ -0,0 +1,158 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import date
+from unittest import mock
+from artists.models import Artist
+from artworks.models import Artwork
+from exhibitions.models import Exhibition, ExhibitionArtwork
+from . import views
+import json
+
+
+class ApiTestCase(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(username='apiartist', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='API작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='api@example.com',
+            phone_number='010-1234-5678'
+        )
+        self.artworks = [
+            Artwork.objects.create(
+                artist=self.artist,
+                title=f'API작품{i}',
+                price=10000 * (i + 1),
+                size_number=i + 1
+            )
+            for i in range(5)
+        ]
+        self.exhibition = Exhibition.objects.create(
+            artist=self.artist,
+            title='API전시',
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 2, 1)
+        )
+        for artwork in self.artworks[:3]:
+            ExhibitionArtwork.objects.create(exhibition=self.exhibition, artwork=artwork)
+
+
+class ApiListTest(ApiTestCase):
+    """JSON API 목록 테스트"""
+    
+    def test_artwork_list(self):
+        """작품 목록은 최신순 JSON으로 반환되어야 함"""
+        response = self.client.get(reverse('api:artwork_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        
+        data = json.loads(response.content)
+        self.assertEqual([row['title'] for row in data['results']],
+                         [f'API작품{i}' for i in range(4, -1, -1)])
+        self.assertEqual(data['results'][0]['artist_name'], 'API작가')
+        self.assertEqual(data['results'][0]['price'], 50000)
+        self.assertIsNone(data['next_cursor'])
+    
+    def test_sparse_fieldset(self):
+        """fields로 요청한 필드만 응답에 포함되어야 함"""
+        response = self.client.get(reverse('api:artwork_list'), {'fields': 'title,price'})
+        data = json.loads(response.content)
+        self.assertEqual(set(data['results'][0]), {'title', 'price'})
+    
+    def test_unknown_field(self):
+        """허용되지 않은 필드는 400 오류여야 함"""
+        response = self.client.get(reverse('api:artist_list'), {'fields': 'name,user__password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('user__password', json.loads(response.content)['error'])
+    
+    def test_invalid_limit(self):
+        """잘못된 limit은 400 오류여야 함"""
+        for limit in ('abc', '0', str(views.MAX_LIMIT + 1)):
+            response = self.client.get(reverse('api:artwork_list'), {'limit': limit})
+            self.assertEqual(response.status_code, 400)
+    
+    def test_cursor_pagination(self):
+        """커서로 모든 작품을 중복 없이 순회할 수 있어야 함"""
+        url = reverse('api:artwork_list')
+        seen = []
+        params = {'limit': 2, 'fields': 'id'}
+        while True:
+            data = json.loads(self.client.get(url, params).content)
+            seen.extend(row['id'] for row in data['results'])
+            if not data['next_cursor']:
+                break
+            params['cursor'] = data['next_cursor']
+        
+        self.assertEqual(seen, [artwork.id for artwork in reversed(self.artworks)])
+    
+    def test_cursor_past_deleted_rows(self):
+        """커서 이후 행이 삭제되면 첫 페이지가 아니라 빈 결과를 반환해야 함"""
+        url = reverse('api:artwork_list')
+        data = json.loads(self.client.get(url, {'limit': 2, 'fields': 'id'}).content)
+        Artwork.objects.filter(id__in=[artwork.id for artwork in self.artworks[:3]]).delete()
+        
+        data = json.loads(self.client.get(
+            url, {'limit': 2, 'fields': 'id', 'cursor': data['next_cursor']}
+        ).content)
+        self.assertEqual(data['results'], [])
+        self.assertIsNone(data['next_cursor'])
+    
+    def test_invalid_cursor(self):
+        """해석할 수 없는 커서는 400 오류여야 함"""
+        response = self.client.get(reverse('api:artwork_list'), {'cursor': 'zzz'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('cursor', json.loads(response.content)['error'])
+    
+    def test_exhibition_artwork_count(self):
+        """전시 목록은 작품 수 컬럼을 집계 없이 그대로 반환해야 함"""
+        with CaptureQueriesContext(connection) as queries:
+            data = json.loads(self.client.get(reverse('api:exhibition_list')).content)
+        self.assertEqual(data['results'][0]['artwork_count'], 3)
+        self.assertNotIn('exhibitions_exhibitionartwork', queries[-1]['sql'])
+    
+    def test_search(self):
+        """검색어로 작가를 찾을 수 있어야 함"""
+        data = json.loads(self.client.get(reverse('api:artist_list'), {'search': 'API작'}).content)
+        self.assertEqual([row['name'] for row in data['results']], ['API작가'])
+    
+    def test_single_query_per_page(self):
+        """페이지당 쿼리 한 번으로 응답해야 함"""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('api:artwork_list'))
+        self.assertEqual(len(queries), 1)
+    
+    def test_get_only(self):
+        """읽기 전용이므로 POST는 허용되지 않아야 함"""
+        response = self.client.post(reverse('api:artwork_list'))
+        self.assertEqual(response.status_code, 405)
+    
+    def test_artist_birthday_is_not_public(self):
+        """공개 API는 작가 생년월일을 반환하지 않아야 함"""
+        data = json.loads(self.client.get(reverse('api:artist_list')).content)
+        self.assertNotIn('birthday', data['results'][0])
+        
+        response = self.client.get(reverse('api:artist_list'), {'fields': 'name,birthday'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_datetime_format_does_not_depend_on_serializer(self):
+        """orjson 유무와 관계없이 날짜/시간 형식이 같아야 함"""
+        url = reverse('api:exhibition_list')
+        params = {'fields': 'created_at,start_date'}
+        data = json.loads(self.client.get(url, params).content)
+        with mock.patch.object(views, 'orjson', None):
+            fallback = json.loads(self.client.get(url, params).content)
+        self.assertEqual(data['results'], fallback['results'])
+        self.assertTrue(data['results'][0]['created_at'].endswith('Z'))
+    
+    def test_json_fallback_without_orjson(self):
+        """orjson이 없어도 표준 json으로 같은 형식을 반환해야 함"""
+        with mock.patch.object(views, 'orjson', None):
+            response = self.client.get(reverse('api:exhibition_list'), {'fields': 'title,start_date'})
+        data = json.loads(response.content)
+        self.assertEqual(data['results'], [{'title': 'API전시', 'start_date': '2024-01-01'}])
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+app_name = 'api'
+
+urlpatterns = [
+    path('artists/', views.artist_list, name='artist_list'),
+    path('artworks/', views.artwork_list, name='artwork_list'),
+    path('exhibitions/', views.exhibition_list, name='exhibition_list'),
+]
@@ -0,0 +1,172 @@
+"""작가/작품/전시 읽기 전용 JSON API
+
+HTML 목록과 같은 데이터를 values() 프로젝션(모델 인스턴스 생성 없음), 커서 페이지네이션,
+fields= 부분 필드 선택으로 제공한다. orjson이 설치되어 있으면 orjson으로 직렬화하되,
+날짜/시간은 두 경우 모두 DjangoJSONEncoder 형식(밀리초, UTC는 Z)으로 맞춘다.
+
+    GET /api/artworks/?fields=id,title,artist_name&search=풍경&limit=50&cursor=...
+"""
+import json
+from functools import wraps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from artists.models import Artist
+from artworks.models import Artwork
+from exhibitions.models import Exhibition
+from opengallery.pagination import CursorPaginator, decode_cursor
+from search import index as search_index
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈 사용
+    orjson = None
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+# 응답 필드명 -> 조회 경로 (values()에 그대로 쓰이므로 여기 있는 필드만 노출된다)
+# 인증 없이 공개되므로 HTML 목록에 보이는 필드만 둔다 (작가 생년월일 등은 제외)
+ARTIST_FIELDS = {
+    'id': 'id',
+    'name': 'name',
+    'gender': 'gender',
+    'email': 'email',
+    'phone_number': 'phone_number',
+    'created_at': 'created_at',
+}
+ARTWORK_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'price': 'price',
+    'size_number': 'size_number',
+    'artist_id': 'artist_id',
+    'artist_name': 'artist__name',
+    'created_at': 'created_at',
+}
+EXHIBITION_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'start_date': 'start_date',
+    'end_date': 'end_date',
+    'artist_id': 'artist_id',
+    'artist_name': 'artist__name',
+    'artwork_count': 'artwork_count',
+    'created_at': 'created_at',
+}
+# 커서 계산에 필요해 요청하지 않아도 항상 조회하는 필드
+CURSOR_FIELDS = ('id', 'created_at')
+
+
+class ApiError(Exception):
+    pass
+
+
+def dumps(data):
+    if orjson is not None:
+        # 날짜/시간을 orjson 기본 형식 대신 DjangoJSONEncoder로 변환해 형식을 통일
+        return orjson.dumps(
+            data, default=DjangoJSONEncoder().default, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+
+
+def json_response(data, status=200):
+    return HttpResponse(dumps(data), content_type='application/json', status=status)
+
+
+def parse_fields(request, available):
+    value = request.GET.get('fields', '')
+    if not value:
+        return list(available)
+    fields = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise ApiError(
+            f'알 수 없는 필드입니다: {", ".join(unknown)} '
+            f'(사용 가능: {", ".join(available)})'
+        )
+    return list(dict.fromkeys(fields))
+
+
+def parse_limit(request):
+    value = request.GET.get('limit')
+    if value is None:
+        return DEFAULT_LIMIT
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ApiError('limit은 숫자여야 합니다.')
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ApiError(f'limit은 1 이상 {MAX_LIMIT} 이하여야 합니다.')
+    return limit
+
+
+def project(queryset, fields, available):
+    """요청 필드(+ 커서 필드)만 values()로 조회하는 쿼리셋"""
+    selected = list(dict.fromkeys([*fields, *CURSOR_FIELDS]))
+    plain = [available[name] for name in selected if available[name] == name]
+    aliased = {name: F(available[name]) for name in selected if available[name] != name}
+    return queryset.values(*plain, **aliased)
+
+
+def parse_cursor(request):
+    cursor = request.GET.get('cursor')
+    if cursor and decode_cursor(cursor) is None:
+        raise ApiError('잘못된 cursor입니다.')
+    return cursor
+
+
+def paginated_response(request, queryset, fields, available):
+    paginator = CursorPaginator(project(queryset, fields, available), parse_limit(request))
+    # next_cursor를 따라가는 클라이언트가 같은 행을 다시 받지 않도록, 커서 이후에 행이 없으면
+    # 첫 페이지가 아니라 빈 결과를 돌려준다
+    page = paginator.get_page(parse_cursor(request), fallback_to_first=False)
+    return json_response({
+        'results': [{name: row[name] for name in fields} for row in page],
+        'next_cursor': page.next_cursor,
+        'previous_cursor': page.previous_cursor,
+    })
+
+
+def api_view(available):
+    """GET 전용, 필드 검증 오류를 400 JSON 응답으로 바꾸는 데코레이터"""
+    def decorator(view_func):
+        @require_GET
+        @wraps(view_func)
+        def wrapper(request):
+            try:
+                fields = parse_fields(request, available)
+                return view_func(request, fields)
+            except ApiError as exc:
+                return json_response({'error': str(exc)}, status=400)
+        return wrapper
+    return decorator
+
+
+@api_view(ARTIST_FIELDS)
+def artist_list(request, fields):
+    """작가 목록 (최신순)"""
+    artists = Artist.objects.all()
+    search_query = request.GET.get('search', '')
+    if search_query:
+        artists = search_index.search_artists(artists, search_query)
+    return paginated_response(request, artists, fields, ARTIST_FIELDS)
+
+
+@api_view(ARTWORK_FIELDS)
+def artwork_list(request, fields):
+    """작품 목록 (최신순)"""
+    artworks = Artwork.objects.all()
+    search_query = request.GET.get('search', '')
+    if search_query:
+        artworks = search_index.search_artworks(artworks, search_query)
+    return paginated_response(request, artworks, fields, ARTWORK_FIELDS)
+
+
+@api_view(EXHIBITION_FIELDS)
+def exhibition_list(request, fields):
+    """전시 목록 (최신순)"""
+    exhibitions = Exhibition.objects.all()
+    return paginated_response(request, exhibitions, fields, EXHIBITION_FIELDS)
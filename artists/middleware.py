@@ -0,0 +1,32 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.utils.functional import SimpleLazyObject
+from .utils import get_user_artist
+
+
+class CurrentArtistMiddleware:
+    """request.artist에 현재 사용자의 작가 정보를 지연 로딩 객체로 추가
+
+    request.user와 마찬가지로 실제로 사용될 때 한 번만 조회된다.
+    작가가 아닌 사용자의 경우 거짓으로 평가된다.
+    ASGI에서 요청마다 스레드 전환이 일어나지 않도록 동기/비동기 모두 지원한다.
+    """
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+    
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.process_request(request)
+        return self.get_response(request)
+    
+    async def __acall__(self, request):
+        self.process_request(request)
+        return await self.get_response(request)
+    
+    def process_request(self, request):
+        request.artist = SimpleLazyObject(lambda: get_user_artist(request.user))
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Avg, Count, Max, Min, Q
+
+
+def populate_artist_stats(apps, schema_editor):
+    Artist = apps.get_model('artists', 'Artist')
+    ArtistStats = apps.get_model('artists', 'ArtistStats')
+    rows = Artist.objects.annotate(
+        total=Count('artwork'),
+        small=Count('artwork', filter=Q(artwork__size_number__lte=100)),
+        avg=Avg('artwork__price'),
+        lowest=Min('artwork__price'),
+        highest=Max('artwork__price'),
+        last=Max('artwork__created_at'),
+    ).values_list('pk', 'total', 'small', 'avg', 'lowest', 'highest', 'last')
+    ArtistStats.objects.bulk_create(
+        [
+            ArtistStats(
+                artist_id=pk,
+                artwork_count=total,
+                small_artwork_count=small,
+                avg_price=avg,
+                min_price=lowest,
+                max_price=highest,
+                last_artwork_at=last,
+            )
+            for pk, total, small, avg, lowest, highest, last in rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artists', '0001_initial'),
+        ('artworks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArtistStats',
+            fields=[
+                ('artist', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='artists.artist')),
+                ('artwork_count', models.PositiveIntegerField(default=0)),
+                ('small_artwork_count', models.PositiveIntegerField(default=0)),
+                ('avg_price', models.FloatField(blank=True, null=True)),
+                ('min_price', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('max_price', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('last_artwork_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_artist_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artists', '0002_artiststats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artist',
+            index=models.Index(fields=['-created_at', '-id'], name='artist_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['-applied_at', '-id'], name='application_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['status', 'applied_at', 'id'], name='application_status_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artists', '0004_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['name', 'id'], name='application_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['gender', 'id'], name='application_gender_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['birthday', 'id'], name='application_birthday_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['email', 'id'], name='application_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['phone_number', 'id'], name='application_phone_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artistapplication',
+            index=models.Index(fields=['processed_at', 'id'], name='application_processed_idx'),
+        ),
+    ]
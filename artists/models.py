@@ -1,7 +1,11 @@
 from django.db import models
+from django.db.models import Avg, Count, Max, Min, Q
 from django.contrib.auth.models import User
 from django.core.validators import RegexValidator
 
+# 통계에서 '소품'으로 분류하는 최대 호수
+SMALL_ARTWORK_MAX_SIZE = 100
+
 class Artist(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     name = models.CharField(max_length=16)
@@ -16,6 +20,14 @@ class Artist(models.Model):
     
     def __str__(self):
         return self.name
+    
+    class Meta:
+        indexes = [
+            # 작가 목록 (최신순, 커서 페이지네이션)
+            models.Index(fields=['-created_at', '-id'], name='artist_created_idx'),
+            # 목록 조건부 응답의 MAX(updated_at)
+            models.Index(fields=['updated_at'], name='artist_updated_idx'),
+        ]
 
 class ArtistApplication(models.Model):
     """작가 등록 신청 모델"""
@@ -42,3 +54,75 @@ class ArtistApplication(models.Model):
     
     class Meta:
         ordering = ['-applied_at']
+        indexes = [
+            # 신청 내역 관리 (최신순)
+            models.Index(fields=['-applied_at', '-id'], name='application_applied_idx'),
+            # 상태 필터 + 신청일 정렬 (대시보드 대기 건수, 관리 목록 상태 필터), 상태 정렬
+            models.Index(fields=['status', 'applied_at', 'id'], name='application_status_idx'),
+            # 관리 목록의 열별 정렬 (views.APPLICATION_SORTS)
+            models.Index(fields=['name', 'id'], name='application_name_idx'),
+            models.Index(fields=['gender', 'id'], name='application_gender_idx'),
+            models.Index(fields=['birthday', 'id'], name='application_birthday_idx'),
+            models.Index(fields=['email', 'id'], name='application_email_idx'),
+            models.Index(fields=['phone_number', 'id'], name='application_phone_idx'),
+            models.Index(fields=['processed_at', 'id'], name='application_processed_idx'),
+        ]
+
+
+class ArtistStats(models.Model):
+    """작가별 작품 통계
+
+    통계 페이지가 작품 테이블 전체를 집계하지 않도록 작가 단위로 미리 계산해 둔 값.
+    작품이 추가/수정/삭제될 때 해당 작가의 행만 다시 계산된다 (artworks.signals 참고).
+    """
+    artist = models.OneToOneField(Artist, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    artwork_count = models.PositiveIntegerField(default=0)
+    small_artwork_count = models.PositiveIntegerField(default=0)
+    avg_price = models.FloatField(null=True, blank=True)
+    min_price = models.PositiveBigIntegerField(null=True, blank=True)
+    max_price = models.PositiveBigIntegerField(null=True, blank=True)
+    last_artwork_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.artist_id} 작가 통계"
+    
+    @classmethod
+    def refresh(cls, artist_ids=None):
+        """작가들의 통계를 작품 테이블에서 다시 계산해 저장 (artist_ids가 없으면 전체)"""
+        artists = Artist.objects.all()
+        if artist_ids is not None:
+            artists = artists.filter(pk__in=artist_ids)
+        
+        rows = artists.annotate(
+            total=Count('artwork'),
+            small=Count('artwork', filter=Q(artwork__size_number__lte=SMALL_ARTWORK_MAX_SIZE)),
+            avg=Avg('artwork__price'),
+            lowest=Min('artwork__price'),
+            highest=Max('artwork__price'),
+            last=Max('artwork__created_at'),
+        ).values_list('pk', 'total', 'small', 'avg', 'lowest', 'highest', 'last')
+        
+        stats = [
+            cls(
+                artist_id=pk,
+                artwork_count=total,
+                small_artwork_count=small,
+                avg_price=avg,
+                min_price=lowest,
+                max_price=highest,
+                last_artwork_at=last,
+            )
+            for pk, total, small, avg, lowest, highest, last in rows
+        ]
+        cls.objects.bulk_create(
+            stats,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['artist'],
+            update_fields=[
+                'artwork_count', 'small_artwork_count', 'avg_price',
+                'min_price', 'max_price', 'last_artwork_at', 'updated_at',
+            ],
+        )
+        return len(stats)
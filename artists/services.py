@@ -0,0 +1,81 @@
+from django.db import transaction
+from django.utils import timezone
+from opengallery import counters, generations
+from .models import Artist, ArtistApplication
+from .signals import artists_bulk_created
+
+APPLICATION_ACTIONS = ('approve', 'reject')
+
+
+def process_application_batch(application_ids, action):
+    """선택된 작가 등록 신청들을 한 트랜잭션 안에서 일괄 승인/반려
+
+    승인 시 작가는 bulk_create 한 번으로, 신청 상태는 update 한 번으로 저장한다.
+    처리할 수 없는 항목(대기중이 아닌 신청, 이미 작가인 사용자 등)은 전체를 중단하지 않고
+    conflicts에 사유와 함께 담아 반환하며 해당 신청은 그대로 남겨 둔다.
+    """
+    if action not in APPLICATION_ACTIONS:
+        raise ValueError(f'알 수 없는 처리 방식입니다: {action}')
+    
+    conflicts = []
+    requested_ids = []
+    for application_id in application_ids:
+        try:
+            requested_ids.append(int(application_id))
+        except (TypeError, ValueError):
+            conflicts.append({'id': application_id, 'reason': '잘못된 신청 번호입니다.'})
+    
+    with transaction.atomic():
+        applications = list(
+            ArtistApplication.objects.select_for_update()
+            .filter(id__in=requested_ids, status='pending')
+            .order_by('applied_at', 'id')
+        )
+        found_ids = {application.id for application in applications}
+        for application_id in requested_ids:
+            if application_id not in found_ids:
+                conflicts.append({'id': application_id, 'reason': '대기중인 신청이 아닙니다.'})
+        
+        accepted = applications
+        if action == 'approve':
+            accepted = []
+            existing_user_ids = set(
+                Artist.objects.filter(
+                    user_id__in={application.user_id for application in applications}
+                ).values_list('user_id', flat=True)
+            )
+            for application in applications:
+                if application.user_id in existing_user_ids:
+                    conflicts.append({'id': application.id, 'reason': '이미 작가로 등록된 사용자입니다.'})
+                    continue
+                # 같은 사용자의 신청이 여러 건 선택된 경우 가장 먼저 신청한 건만 승인
+                existing_user_ids.add(application.user_id)
+                accepted.append(application)
+            
+            artists = Artist.objects.bulk_create([
+                Artist(
+                    user_id=application.user_id,
+                    name=application.name,
+                    gender=application.gender,
+                    birthday=application.birthday,
+                    email=application.email,
+                    phone_number=application.phone_number
+                )
+                for application in accepted
+            ], batch_size=500)
+            artists_bulk_created.send(sender=Artist, instances=artists)
+        
+        processed_count = ArtistApplication.objects.filter(
+            id__in=[application.id for application in accepted]
+        ).update(
+            status='approved' if action == 'approve' else 'rejected',
+            processed_at=timezone.now()
+        )
+        # update()는 post_save를 보내지 않으므로 신청 세대와 대기중 신청 수를 직접 갱신
+        generations.bump_on_commit(ArtistApplication)
+        counters.shift('pending_applications', -processed_count)
+    
+    return {
+        'processed_count': processed_count,
+        'conflicts': conflicts,
+    }
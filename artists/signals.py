@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# bulk_create는 post_save를 보내지 않으므로 일괄 생성 후 직접 알린다 (인자: instances)
+artists_bulk_created = Signal()
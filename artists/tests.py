@@ -1,11 +1,17 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.contrib.auth.models import User
 from django.urls import reverse
+from django.core.cache import cache
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from datetime import date, datetime
-from .models import Artist, ArtistApplication
+from .models import Artist, ArtistApplication, ArtistStats
+from .views import APPLICATIONS_PER_PAGE, APPLICATION_SORTS, DASHBOARD_ARTWORKS_PER_PAGE
 from artworks.models import Artwork
+from exhibitions.models import Exhibition, ExhibitionArtwork
+from opengallery.tests import LOCMEM_CACHES
 import json
 
 
@@ -148,6 +154,452 @@ class ArtistViewTest(TestCase):
         response = self.client.get(reverse('artists:artist_list'), {'search': '없는작가'})
         self.assertEqual(response.status_code, 200)
         self.assertNotContains(response, '김작가')
+    
+    def _count_artist_lookups(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return sum(
+            1 for query in ctx.captured_queries
+            if 'FROM "artists_artist"' in query['sql'] and '"artists_artist"."user_id" =' in query['sql']
+        )
+    
+    def test_current_artist_lookup_once_per_request(self):
+        """요청당 현재 작가 조회가 한 번만 실행되는지 테스트"""
+        self.client.login(username='artist', password='artistpass123')
+        
+        self.assertEqual(self._count_artist_lookups(reverse('auth_management:home')), 1)
+        self.assertEqual(self._count_artist_lookups(reverse('artists:artist_dashboard')), 1)
+        self.assertEqual(self._count_artist_lookups(reverse('artworks:create_artwork')), 1)
+    
+    def test_current_artist_lookup_for_non_artist(self):
+        """작가가 아닌 사용자도 조회가 한 번만 실행되는지 테스트"""
+        self.client.login(username='testuser', password='testpass123')
+        
+        self.assertEqual(self._count_artist_lookups(reverse('auth_management:home')), 1)
+
+
+class ProcessApplicationsTest(TestCase):
+    """작가 등록 신청 일괄 처리 테스트"""
+    
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.client.login(username='admin', password='adminpass123')
+    
+    def _create_application(self, username, user=None):
+        user = user or User.objects.create_user(username=username, password='testpass123')
+        return ArtistApplication.objects.create(
+            user=user,
+            name=username[:16],
+            gender='남자',
+            birthday=date(1990, 1, 1),
+            email=f'{username}@example.com',
+            phone_number='010-1234-5678'
+        )
+    
+    def _post(self, action, ids):
+        return self.client.post(reverse('artists:process_applications'), {
+            'action': action,
+            'application_ids': [str(i) for i in ids],
+        })
+    
+    def test_bulk_approve(self):
+        """여러 신청 일괄 승인 테스트"""
+        applications = [self._create_application(f'applicant{i}') for i in range(5)]
+        
+        response = self._post('approve', [a.id for a in applications])
+        
+        data = json.loads(response.content)
+        self.assertTrue(data['success'])
+        self.assertEqual(data['processed_count'], 5)
+        self.assertEqual(data['conflicts'], [])
+        self.assertEqual(Artist.objects.count(), 5)
+        self.assertFalse(ArtistApplication.objects.exclude(status='approved').exists())
+        self.assertFalse(ArtistApplication.objects.filter(processed_at__isnull=True).exists())
+    
+    def test_bulk_approve_query_count_is_constant(self):
+        """신청 수와 관계없이 일괄 승인 쿼리 수가 일정한지 테스트"""
+        small = [self._create_application(f'small{i}') for i in range(2)]
+        with CaptureQueriesContext(connection) as small_ctx:
+            self._post('approve', [a.id for a in small])
+        
+        large = [self._create_application(f'large{i}') for i in range(20)]
+        with CaptureQueriesContext(connection) as large_ctx:
+            self._post('approve', [a.id for a in large])
+        
+        self.assertEqual(len(small_ctx.captured_queries), len(large_ctx.captured_queries))
+    
+    def test_bulk_approve_reports_conflicts(self):
+        """이미 작가인 사용자 등 충돌 항목은 보고하고 나머지는 처리하는지 테스트"""
+        artist_user = User.objects.create_user(username='existing', password='testpass123')
+        Artist.objects.create(
+            user=artist_user,
+            name='기존작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='existing@example.com',
+            phone_number='010-1234-5678'
+        )
+        conflicting = self._create_application('existing', user=artist_user)
+        first = self._create_application('twice')
+        duplicate = self._create_application('twice', user=first.user)
+        ok = self._create_application('fresh')
+        processed = self._create_application('processed')
+        processed.status = 'rejected'
+        processed.save()
+        
+        response = self._post('approve', [conflicting.id, first.id, duplicate.id, ok.id, processed.id])
+        
+        data = json.loads(response.content)
+        self.assertEqual(data['processed_count'], 2)
+        self.assertEqual(
+            sorted(conflict['id'] for conflict in data['conflicts']),
+            sorted([conflicting.id, duplicate.id, processed.id])
+        )
+        self.assertEqual(ArtistApplication.objects.get(id=conflicting.id).status, 'pending')
+        self.assertEqual(ArtistApplication.objects.get(id=first.id).status, 'approved')
+        self.assertEqual(ArtistApplication.objects.get(id=ok.id).status, 'approved')
+        self.assertEqual(Artist.objects.filter(user=first.user).count(), 1)
+    
+    def test_bulk_reject(self):
+        """여러 신청 일괄 반려 테스트"""
+        applications = [self._create_application(f'reject{i}') for i in range(3)]
+        
+        response = self._post('reject', [a.id for a in applications])
+        
+        data = json.loads(response.content)
+        self.assertEqual(data['processed_count'], 3)
+        self.assertEqual(ArtistApplication.objects.filter(status='rejected').count(), 3)
+        self.assertFalse(Artist.objects.exists())
+    
+    def test_invalid_action(self):
+        """잘못된 처리 방식 요청 테스트"""
+        application = self._create_application('invalid')
+        
+        response = self._post('delete', [application.id])
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(ArtistApplication.objects.get(id=application.id).processed_at)
+
+
+class ApplicationsCsvDownloadTest(TestCase):
+    """작가 등록 신청 CSV 다운로드 테스트"""
+    
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.applicant = User.objects.create_user(username='applicant', password='testpass123')
+        self.application = ArtistApplication.objects.create(
+            user=self.applicant,
+            name='신청자',
+            gender='여자',
+            birthday=date(1995, 5, 15),
+            email='applicant@example.com',
+            phone_number='010-9876-5432'
+        )
+    
+    def test_csv_download_streams_rows(self):
+        """CSV가 BOM, 헤더, 데이터 행과 함께 스트리밍되는지 테스트"""
+        self.client.login(username='admin', password='adminpass123')
+        
+        response = self.client.get(reverse('artists:download_applications_csv'))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('attachment; filename="artist_applications_', response['Content-Disposition'])
+        
+        content = b''.join(response.streaming_content).decode('utf-8')
+        self.assertTrue(content.startswith('\ufeffID,이름,성별,생년월일,이메일,연락처,신청일시,상태,처리일시,신청자 사용자명'))
+        lines = content.strip().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith(f'{self.application.id},신청자,여자,1995-05-15,'))
+        self.assertTrue(lines[1].endswith(',대기중,,applicant'))
+    
+    def test_csv_download_requires_staff(self):
+        """관리자가 아닌 사용자의 CSV 다운로드 차단 테스트"""
+        self.client.login(username='applicant', password='testpass123')
+        
+        response = self.client.get(reverse('artists:download_applications_csv'))
+        
+        self.assertEqual(response.status_code, 302)
+
+
+class AdminApplicationsTableTest(TestCase):
+    """신청 내역 관리 표의 서버 페이지네이션/필터/정렬 테스트"""
+    
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        users = User.objects.bulk_create(
+            [User(username=f'applicant{i}', password='!') for i in range(APPLICATIONS_PER_PAGE + 10)]
+        )
+        ArtistApplication.objects.bulk_create([
+            ArtistApplication(
+                user=user,
+                name=f'신청자{i:03d}',
+                gender='여자' if i % 2 else '남자',
+                birthday=date(1990, 1, 1),
+                email=f'applicant{i}@example.com',
+                phone_number='010-0000-0000',
+                status='approved' if i % 3 == 0 else 'pending',
+            )
+            for i, user in enumerate(users)
+        ])
+        self.client.login(username='admin', password='adminpass123')
+        self.url = reverse('artists:admin_applications')
+    
+    def names(self, response):
+        return [application.name for application in response.context['page_obj']]
+    
+    def test_paginated(self):
+        """한 페이지에 APPLICATIONS_PER_PAGE개만 렌더링되는지 테스트"""
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.context['page_obj']), APPLICATIONS_PER_PAGE)
+        self.assertEqual(response.context['page_obj'].paginator.count, APPLICATIONS_PER_PAGE + 10)
+        
+        response = self.client.get(self.url, {'page': 2})
+        self.assertEqual(len(response.context['page_obj']), 10)
+    
+    def test_status_filter(self):
+        """상태 필터 테스트 (알 수 없는 상태는 무시)"""
+        response = self.client.get(self.url, {'status': 'approved'})
+        page_obj = response.context['page_obj']
+        self.assertEqual(page_obj.paginator.count, 20)
+        self.assertTrue(all(application.status == 'approved' for application in page_obj))
+        
+        response = self.client.get(self.url, {'status': 'unknown'})
+        self.assertEqual(response.context['status_filter'], '')
+        self.assertEqual(response.context['page_obj'].paginator.count, APPLICATIONS_PER_PAGE + 10)
+    
+    def test_sort(self):
+        """정렬 파라미터로 오름차순/내림차순 정렬되는지 테스트"""
+        response = self.client.get(self.url, {'sort': 'name'})
+        self.assertEqual(self.names(response)[:2], ['신청자000', '신청자001'])
+        
+        response = self.client.get(self.url, {'sort': '-name'})
+        self.assertEqual(self.names(response)[:2], ['신청자059', '신청자058'])
+    
+    def test_every_sort_renders(self):
+        """모든 정렬 값이 오류 없이 동작하는지 테스트"""
+        for field in APPLICATION_SORTS:
+            for sort in (field, f'-{field}'):
+                response = self.client.get(self.url, {'sort': sort})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.context['sort'], sort)
+    
+    def test_invalid_sort_uses_default(self):
+        """허용되지 않은 정렬 값은 기본 정렬(최신 신청순)로 처리되는지 테스트"""
+        response = self.client.get(self.url, {'sort': 'user__password'})
+        self.assertEqual(response.context['sort'], '-applied_at')
+    
+    def test_pagination_links_keep_parameters(self):
+        """페이지 링크가 검색/필터/정렬 파라미터를 유지하는지 테스트"""
+        response = self.client.get(self.url, {'sort': 'email', 'search': 'applicant'})
+        self.assertContains(response, '?sort=email&amp;search=applicant&amp;page=2')
+        self.assertContains(response, 'data-sort-current="email"')
+
+
+class ArtistDashboardTest(TestCase):
+    """작가 대시보드 (작품 통계, 페이지네이션, 출품 전시 수) 테스트"""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(username='artist', password='artistpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='대시보드작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='dashboard@example.com',
+            phone_number='010-1234-5678'
+        )
+        # 호수 5, 20, 50, 200을 번갈아 가며 가격 1000~25000
+        sizes = [5, 20, 50, 200]
+        self.artworks = Artwork.objects.bulk_create([
+            Artwork(artist=self.artist, title=f'작품{i:02d}', price=1000 * (i + 1), size_number=sizes[i % 4])
+            for i in range(DASHBOARD_ARTWORKS_PER_PAGE + 5)
+        ])
+        self.exhibitions = [
+            Exhibition.objects.create(
+                artist=self.artist,
+                title=f'전시{i}',
+                start_date=date(2024, i + 1, 1),
+                end_date=date(2024, i + 1, 28),
+            )
+            for i in range(2)
+        ]
+        newest = self.artworks[-1]
+        for exhibition in self.exhibitions:
+            ExhibitionArtwork.objects.create(exhibition=exhibition, artwork=newest)
+        ExhibitionArtwork.objects.create(exhibition=self.exhibitions[0], artwork=self.artworks[-2])
+        
+        self.client.login(username='artist', password='artistpass123')
+        self.url = reverse('artists:artist_dashboard')
+    
+    def test_portfolio_stats(self):
+        """작품 수, 총/평균 가격, 호수 분포 테스트"""
+        response = self.client.get(self.url)
+        stats = response.context['stats']
+        
+        self.assertEqual(stats['count'], 25)
+        self.assertEqual(stats['total_price'], 1000 * 25 * 26 // 2)
+        self.assertEqual(stats['avg_price'], 13000)
+        self.assertEqual([bucket['count'] for bucket in stats['size_distribution']], [7, 6, 6, 6])
+        self.assertContains(response, '₩325,000')
+    
+    def test_paginated_artworks_with_exhibition_count(self):
+        """작품이 페이지로 나뉘고 작품별 출품 전시 수가 표시되는지 테스트"""
+        response = self.client.get(self.url)
+        page_obj = response.context['page_obj']
+        self.assertEqual(len(page_obj), DASHBOARD_ARTWORKS_PER_PAGE)
+        self.assertEqual(page_obj.paginator.num_pages, 2)
+        self.assertEqual(
+            [artwork.exhibition_count for artwork in page_obj[:3]], [2, 1, 0]
+        )
+        
+        response = self.client.get(self.url, {'page': 2})
+        self.assertEqual([artwork.title for artwork in response.context['page_obj']][-1], '작품00')
+    
+    def test_exhibitions_listed(self):
+        """작가의 전시가 최근 시작일 순으로 표시되는지 테스트"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['exhibition_count'], 2)
+        self.assertEqual([exhibition.title for exhibition in response.context['exhibitions']], ['전시1', '전시0'])
+        self.assertContains(response, '내 전시 (2개)')
+    
+    def test_query_count_does_not_grow(self):
+        """작품/전시 연결 수와 관계없이 쿼리 수가 일정한지 테스트"""
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url)
+        before = len(ctx.captured_queries)
+        
+        more = Artwork.objects.bulk_create([
+            Artwork(artist=self.artist, title=f'추가{i}', price=1000, size_number=10) for i in range(30)
+        ])
+        ExhibitionArtwork.objects.bulk_create([
+            ExhibitionArtwork(exhibition=self.exhibitions[1], artwork=artwork) for artwork in more
+        ])
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url)
+        self.assertEqual(len(ctx.captured_queries), before)
+        
+        # 전체 개수는 집계 쿼리에서 구하므로 별도의 COUNT 쿼리가 없어야 함
+        artwork_counts = [
+            query for query in ctx.captured_queries
+            if query['sql'].startswith('SELECT COUNT(*)') and 'artworks_artwork' in query['sql']
+        ]
+        self.assertEqual(artwork_counts, [])
+
+
+class ArtistStatsTest(TestCase):
+    """작가별 통계 테이블 및 통계 페이지 테스트"""
+    
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.artist = self._create_artist('stats_artist', '통계작가')
+    
+    def _create_artist(self, username, name):
+        user = User.objects.create_user(username=username, password='artistpass123')
+        return Artist.objects.create(
+            user=user,
+            name=name,
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email=f'{username}@example.com',
+            phone_number='010-1234-5678'
+        )
+    
+    def test_stats_follow_artwork_changes(self):
+        """작품 추가/수정/삭제 시 통계 갱신 테스트"""
+        small = Artwork.objects.create(artist=self.artist, title='소품', price=1000000, size_number=50)
+        Artwork.objects.create(artist=self.artist, title='대작', price=3000000, size_number=200)
+        
+        stats = ArtistStats.objects.get(artist=self.artist)
+        self.assertEqual(stats.artwork_count, 2)
+        self.assertEqual(stats.small_artwork_count, 1)
+        self.assertEqual(stats.avg_price, 2000000)
+        self.assertEqual(stats.min_price, 1000000)
+        self.assertEqual(stats.max_price, 3000000)
+        self.assertIsNotNone(stats.last_artwork_at)
+        
+        small.size_number = 300
+        small.save()
+        stats.refresh_from_db()
+        self.assertEqual(stats.small_artwork_count, 0)
+        
+        small.delete()
+        stats.refresh_from_db()
+        self.assertEqual(stats.artwork_count, 1)
+        self.assertEqual(stats.avg_price, 3000000)
+    
+    def test_stats_move_with_artwork_artist(self):
+        """작품의 작가 변경 시 이전/새 작가 통계 모두 갱신 테스트"""
+        other = self._create_artist('other_artist', '다른작가')
+        artwork = Artwork.objects.create(artist=self.artist, title='이동 작품', price=1000, size_number=10)
+        
+        artwork.artist = other
+        artwork.save()
+        
+        self.assertEqual(ArtistStats.objects.get(artist=self.artist).artwork_count, 0)
+        self.assertEqual(ArtistStats.objects.get(artist=other).artwork_count, 1)
+    
+    def test_artist_deletion_removes_stats(self):
+        """작가 삭제 시 통계 행도 함께 삭제되는지 테스트"""
+        Artwork.objects.create(artist=self.artist, title='작품', price=1000, size_number=10)
+        
+        self.artist.user.delete()
+        
+        self.assertFalse(ArtistStats.objects.exists())
+    
+    def test_statistics_page_query_count_is_constant(self):
+        """작가 수와 관계없이 통계 페이지 쿼리 수가 일정한지 테스트"""
+        self.client.login(username='admin', password='adminpass123')
+        Artwork.objects.create(artist=self.artist, title='작품', price=1000, size_number=10)
+        
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(reverse('artists:admin_statistics'))
+        self.assertContains(response, '통계작가')
+        
+        for i in range(5):
+            artist = self._create_artist(f'artist{i}', f'작가{i}')
+            Artwork.objects.create(artist=artist, title=f'작품{i}', price=1000, size_number=10)
+        self._create_artist('no_artworks', '신인작가')
+        
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(reverse('artists:admin_statistics'))
+        self.assertContains(response, '신인작가')
+        
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+    
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_statistics_cached_until_artworks_change(self):
+        """통계 목록은 캐시되고 작품이 바뀌면 다시 조회되는지 테스트"""
+        cache.clear()
+        self.client.login(username='admin', password='adminpass123')
+        self.client.get(reverse('artists:admin_statistics'))
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('artists:admin_statistics'))
+        self.assertFalse([q for q in queries.captured_queries if 'artists_artiststats' in q['sql']])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Artwork.objects.create(artist=self.artist, title='새 작품', price=1000, size_number=10)
+        response = self.client.get(reverse('artists:admin_statistics'))
+        self.assertEqual(response.context['artists'][0].stats.artwork_count, 1)
+        cache.clear()
 
 
 class ArtistIntegrationTest(TestCase):
@@ -1,10 +1,11 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'artists'
 
 urlpatterns = [
-    path('artists/', views.artist_list, name='artist_list'),
+    path('artists/', views.artist_list_async if settings.ASYNC_VIEWS else views.artist_list, name='artist_list'),
     path('artists/apply/', views.apply_artist, name='apply_artist'),
     path('artist/dashboard/', views.artist_dashboard, name='artist_dashboard'),
     path('admin/dashboard/', views.admin_dashboard, name='admin_dashboard'),
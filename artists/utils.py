@@ -0,0 +1,29 @@
+from .models import Artist
+
+_ARTIST_CACHE_ATTR = '_cached_artist'
+
+
+def get_user_artist(user):
+    """사용자의 작가 정보를 반환 (작가가 아니면 None)
+
+    조회 결과를 사용자 객체에 저장해 두므로 같은 요청 안에서 컨텍스트 프로세서,
+    템플릿 필터, 뷰가 여러 번 호출해도 쿼리는 한 번만 실행된다.
+    """
+    if not user.is_authenticated:
+        return None
+    if not hasattr(user, _ARTIST_CACHE_ATTR):
+        setattr(user, _ARTIST_CACHE_ATTR, Artist.objects.filter(user=user).first())
+    return getattr(user, _ARTIST_CACHE_ATTR)
+
+
+async def aget_user_artist(user):
+    """get_user_artist의 비동기 버전 (같은 속성에 저장하므로 이후 동기 호출은 쿼리 없이 반환)"""
+    if not user.is_authenticated:
+        return None
+    if not hasattr(user, _ARTIST_CACHE_ATTR):
+        try:
+            artist = await Artist.objects.aget(user=user)
+        except Artist.DoesNotExist:
+            artist = None
+        setattr(user, _ARTIST_CACHE_ATTR, artist)
+    return getattr(user, _ARTIST_CACHE_ATTR)
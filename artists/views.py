@@ -1,34 +1,70 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect, get_object_or_404
+from django.template.loader import render_to_string
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
 from django.core.paginator import Paginator
-from django.db.models import Q, Count, Avg
+from django.http import JsonResponse, StreamingHttpResponse
+from django.db.models import Avg, Count, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
-from .models import Artist, ArtistApplication
+from .models import Artist, ArtistApplication, ArtistStats
+from .services import APPLICATION_ACTIONS, process_application_batch
+from .utils import get_user_artist
 from artworks.models import Artwork
+from exhibitions.models import Exhibition, ExhibitionArtwork
+from search import index as search_index
+from opengallery import counters, generations, listing_cache
+from opengallery.conditional import alisting_condition, listing_condition
+from opengallery.pagination import CursorPaginator, LISTING_COUNT_LIMIT
 import csv
 
-def artist_list(request):
-    search_query = request.GET.get('search', '')
+ARTISTS_PER_PAGE = 12
+
+def artist_paginator(search_query):
+    """작가 목록 페이지네이터 (동기/비동기 목록 뷰 공용)"""
     artists = Artist.objects.all().order_by('-created_at')
     
     if search_query:
-        artists = artists.filter(
-            Q(name__icontains=search_query) |
-            Q(email__icontains=search_query) |
-            Q(phone_number__icontains=search_query)
-        )
-    
-    paginator = Paginator(artists, 12)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+        artists = search_index.search_artists(artists, search_query)
     
-    return render(request, 'gallery/artist_list.html', {
+    return CursorPaginator(artists, ARTISTS_PER_PAGE, count_limit=LISTING_COUNT_LIMIT)
+
+def render_artist_listing(request, search_query, page_obj):
+    return render_to_string('gallery/partials/artist_listing.html', {
         'page_obj': page_obj,
         'search_query': search_query
+    }, request=request)
+
+def render_artist_page(request, search_query, listing_html):
+    return render(request, 'gallery/artist_list.html', {
+        'listing_html': listing_html,
+        'search_query': search_query
     })
 
+@listing_condition('artists')
+def artist_list(request):
+    search_query = request.GET.get('search', '')
+    
+    def render_listing():
+        page_obj = artist_paginator(search_query).get_page(request.GET.get('cursor'))
+        return render_artist_listing(request, search_query, page_obj)
+    
+    listing_html = listing_cache.get_or_render('artists', request, render_listing)
+    return render_artist_page(request, search_query, listing_html)
+
+@alisting_condition('artists')
+async def artist_list_async(request):
+    """artist_list의 비동기 버전 (ASGI 프로필에서 사용, 조회만 비동기 ORM으로 바꾼다)"""
+    search_query = request.GET.get('search', '')
+    
+    async def render_listing():
+        page_obj = await artist_paginator(search_query).aget_page(request.GET.get('cursor'))
+        return await sync_to_async(render_artist_listing)(request, search_query, page_obj)
+    
+    listing_html = await listing_cache.aget_or_render('artists', request, render_listing)
+    return await sync_to_async(render_artist_page)(request, search_query, listing_html)
+
 @login_required
 def apply_artist(request):
     # 관리자는 작가 신청할 수 없음
@@ -37,12 +73,9 @@ def apply_artist(request):
         return redirect('auth_management:home')
     
     # 이미 작가로 승인된 사용자는 접근 불가
-    try:
-        artist = Artist.objects.get(user=request.user)
+    if get_user_artist(request.user) is not None:
         messages.warning(request, '이미 작가로 등록되어 있습니다.')
         return redirect('artists:artist_dashboard')
-    except Artist.DoesNotExist:
-        pass
     
     # 이미 신청한 사용자는 접근 불가
     existing_application = ArtistApplication.objects.filter(user=request.user, status='pending').first()
@@ -79,19 +112,82 @@ def apply_artist(request):
     
     return render(request, 'artist/apply.html')
 
+DASHBOARD_ARTWORKS_PER_PAGE = 20
+DASHBOARD_EXHIBITION_COUNT = 5
+# 대시보드 호수 분포 구간 (표시 이름, 최소 호수, 최대 호수)
+ARTWORK_SIZE_BUCKETS = (
+    ('1~10호', 1, 10),
+    ('11~30호', 11, 30),
+    ('31~100호', 31, 100),
+    ('101~500호', 101, 500),
+)
+
+
+def artwork_portfolio_stats(artist):
+    """작가 작품의 개수, 총/평균 가격, 호수 분포를 한 번의 집계 쿼리로 계산"""
+    buckets = {
+        f'size_{index}': Count('pk', filter=Q(size_number__range=(low, high)))
+        for index, (_, low, high) in enumerate(ARTWORK_SIZE_BUCKETS)
+    }
+    result = Artwork.objects.filter(artist=artist).aggregate(
+        count=Count('pk'),
+        total_price=Sum('price'),
+        avg_price=Avg('price'),
+        **buckets,
+    )
+    count = result['count']
+    return {
+        'count': count,
+        'total_price': result['total_price'] or 0,
+        'avg_price': round(result['avg_price']) if result['avg_price'] is not None else 0,
+        'size_distribution': [
+            {
+                'label': label,
+                'count': result[f'size_{index}'],
+                'percent': round(result[f'size_{index}'] * 100 / count) if count else 0,
+            }
+            for index, (label, _, _) in enumerate(ARTWORK_SIZE_BUCKETS)
+        ],
+    }
+
+
 @login_required
 def artist_dashboard(request):
-    try:
-        artist = Artist.objects.get(user=request.user)
-    except Artist.DoesNotExist:
+    artist = get_user_artist(request.user)
+    if artist is None:
         messages.error(request, '작가로 등록되지 않은 사용자입니다.')
         return redirect('auth_management:home')
     
-    artworks = Artwork.objects.filter(artist=artist).order_by('-created_at')
+    stats = artwork_portfolio_stats(artist)
+    
+    # 작품별 출품 전시 수는 페이지에 보이는 작품에 대해서만 상관 서브쿼리로 센다 (artwork_id 인덱스 사용)
+    exhibition_count = Coalesce(Subquery(
+        ExhibitionArtwork.objects.filter(artwork=OuterRef('pk'))
+        .order_by()
+        .values('artwork')
+        .annotate(count=Count('pk'))
+        .values('count')
+    ), 0)
+    artworks = (
+        Artwork.objects.filter(artist=artist)
+        .annotate(exhibition_count=exhibition_count)
+        .order_by('-created_at', '-id')
+    )
+    paginator = Paginator(artworks, DASHBOARD_ARTWORKS_PER_PAGE)
+    # 전체 개수는 위 집계에서 이미 구했으므로 COUNT 쿼리를 다시 실행하지 않음
+    paginator.count = stats['count']
+    page_obj = paginator.get_page(request.GET.get('page'))
+    
+    exhibitions = Exhibition.objects.filter(artist=artist).order_by('-start_date', '-id')
     
     return render(request, 'artist/dashboard.html', {
         'artist': artist,
-        'artworks': artworks
+        'stats': stats,
+        'page_obj': page_obj,
+        'page_range': paginator.get_elided_page_range(page_obj.number, on_each_side=2, on_ends=1),
+        'artworks': page_obj,
+        'exhibitions': exhibitions[:DASHBOARD_EXHIBITION_COUNT],
+        'exhibition_count': exhibitions.count(),
     })
 
 @login_required
@@ -100,17 +196,40 @@ def admin_dashboard(request):
         messages.error(request, '관리자만 접근할 수 있습니다.')
         return redirect('auth_management:home')
     
-    # 통계 데이터 계산
-    total_artists = Artist.objects.count()
-    total_artworks = Artwork.objects.count()
-    pending_applications = ArtistApplication.objects.filter(status='pending').count()
+    # 전체 합계는 COUNT(*) 대신 시그널로 갱신되는 카운터 테이블에서 한 번에 조회
+    totals = counters.get_counts('artists', 'artworks', 'pending_applications')
     
     return render(request, 'admin/dashboard.html', {
-        'total_artists': total_artists,
-        'total_artworks': total_artworks,
-        'pending_applications': pending_applications,
+        'total_artists': totals['artists'],
+        'total_artworks': totals['artworks'],
+        'pending_applications': totals['pending_applications'],
     })
 
+APPLICATIONS_PER_PAGE = 50
+# 정렬 파라미터 -> ORDER BY 필드 (각각 ArtistApplication.Meta.indexes의 인덱스로 정렬된다)
+# "-"를 붙이면 모든 필드를 역순으로 정렬한다.
+APPLICATION_SORTS = {
+    'name': ('name', 'id'),
+    'gender': ('gender', 'id'),
+    'birthday': ('birthday', 'id'),
+    'email': ('email', 'id'),
+    'phone_number': ('phone_number', 'id'),
+    'applied_at': ('applied_at', 'id'),
+    'status': ('status', 'applied_at', 'id'),
+    'processed_at': ('processed_at', 'id'),
+}
+DEFAULT_APPLICATION_SORT = '-applied_at'
+
+
+def application_ordering(sort):
+    """정렬 파라미터를 (정규화된 정렬 값, order_by 필드 목록)으로 변환 (알 수 없는 값은 기본 정렬)"""
+    descending = sort.startswith('-')
+    fields = APPLICATION_SORTS.get(sort.lstrip('-'))
+    if fields is None:
+        return application_ordering(DEFAULT_APPLICATION_SORT)
+    return sort, [f'-{field}' if descending else field for field in fields]
+
+
 @login_required
 def admin_applications(request):
     if not request.user.is_staff:
@@ -118,8 +237,14 @@ def admin_applications(request):
         return redirect('auth_management:home')
     
     search_query = request.GET.get('search', '')
-    applications = ArtistApplication.objects.all().order_by('-applied_at')
+    status_filter = request.GET.get('status', '')
+    if status_filter not in dict(ArtistApplication.STATUS_CHOICES):
+        status_filter = ''
+    sort, ordering = application_ordering(request.GET.get('sort', DEFAULT_APPLICATION_SORT))
     
+    applications = ArtistApplication.objects.order_by(*ordering)
+    if status_filter:
+        applications = applications.filter(status=status_filter)
     if search_query:
         applications = applications.filter(
             Q(name__icontains=search_query) |
@@ -127,9 +252,17 @@ def admin_applications(request):
             Q(phone_number__icontains=search_query)
         )
     
+    paginator = Paginator(applications, APPLICATIONS_PER_PAGE)
+    page_obj = paginator.get_page(request.GET.get('page'))
+    
     return render(request, 'admin/applications.html', {
-        'applications': applications,
-        'search_query': search_query
+        'page_obj': page_obj,
+        'page_range': paginator.get_elided_page_range(page_obj.number, on_each_side=2, on_ends=1),
+        'applications': page_obj,
+        'search_query': search_query,
+        'status_filter': status_filter,
+        'status_choices': ArtistApplication.STATUS_CHOICES,
+        'sort': sort,
     })
 
 @login_required
@@ -138,14 +271,30 @@ def admin_statistics(request):
         messages.error(request, '관리자만 접근할 수 있습니다.')
         return redirect('auth_management:home')
     
-    # 작가별 통계 계산
-    artists = Artist.objects.annotate(
-        small_artwork_count=Count('artwork', filter=Q(artwork__size_number__lte=100)),
-        avg_price=Avg('artwork__price')
-    ).order_by('name')
+    # 미리 계산된 작가별 통계를 작가 정보와 함께 한 번에 조회
+    # (통계 행은 작품이 바뀔 때 갱신되므로 작품 세대도 캐시 키에 포함)
+    artists = generations.cached_queryset(
+        Artist.objects.select_related('stats').order_by('name'),
+        models=(Artist, Artwork),
+    )
+    
+    gender_counts = {'남자': 0, '여자': 0}
+    for artist in artists:
+        # 아직 작품이 없어 통계 행이 없는 작가는 빈 통계로 표시
+        if not hasattr(artist, 'stats'):
+            artist.stats = ArtistStats(artist=artist)
+        if artist.gender in gender_counts:
+            gender_counts[artist.gender] += 1
+    
+    chart_data = {
+        'labels': [artist.name for artist in artists],
+        'small_artwork_counts': [artist.stats.small_artwork_count for artist in artists],
+        'gender_counts': [gender_counts['남자'], gender_counts['여자']],
+    }
     
     return render(request, 'admin/statistics.html', {
-        'artists': artists
+        'artists': artists,
+        'chart_data': chart_data,
     })
 
 @login_required
@@ -160,85 +309,86 @@ def process_applications(request):
         if not application_ids:
             return JsonResponse({'error': '선택된 신청이 없습니다.'}, status=400)
         
-        applications = ArtistApplication.objects.filter(
-            id__in=application_ids, 
-            status='pending'
-        )
+        if action not in APPLICATION_ACTIONS:
+            return JsonResponse({'error': '잘못된 처리 방식입니다.'}, status=400)
+        
+        result = process_application_batch(application_ids, action)
+        count = result['processed_count']
         
-        count = 0
-        for application in applications:
-            if action == 'approve':
-                # Artist 객체 생성
-                Artist.objects.create(
-                    user=application.user,
-                    name=application.name,
-                    gender=application.gender,
-                    birthday=application.birthday,
-                    email=application.email,
-                    phone_number=application.phone_number
-                )
-                application.status = 'approved'
-            elif action == 'reject':
-                application.status = 'rejected'
-            
-            application.processed_at = timezone.now()
-            application.save()
-            count += 1
+        message = f'{count}개의 신청이 처리되었습니다.'
+        if result['conflicts']:
+            message += f' ({len(result["conflicts"])}개 항목은 처리되지 않았습니다.)'
         
         return JsonResponse({
             'success': True,
-            'message': f'{count}개의 신청이 처리되었습니다.',
-            'processed_count': count
+            'message': message,
+            'processed_count': count,
+            'conflicts': result['conflicts']
         })
     
     return JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
 
-@login_required
-def download_applications_csv(request):
-    """작가 등록 신청 데이터를 CSV 파일로 다운로드"""
-    if not request.user.is_staff:
-        messages.error(request, '관리자만 접근할 수 있습니다.')
-        return redirect('auth_management:home')
+class Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 의사 버퍼 (스트리밍 응답용)"""
     
-    # HttpResponse 생성 (CSV 파일 형태)
-    response = HttpResponse(content_type='text/csv; charset=utf-8')
-    response['Content-Disposition'] = f'attachment; filename="artist_applications_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    def write(self, value):
+        return value
+
+
+CSV_HEADER = [
+    'ID',
+    '이름',
+    '성별',
+    '생년월일',
+    '이메일',
+    '연락처',
+    '신청일시',
+    '상태',
+    '처리일시',
+    '신청자 사용자명'
+]
+CSV_CHUNK_SIZE = 2000
+
+
+def iter_applications_csv():
+    """작가 등록 신청 데이터를 CSV 한 줄씩 생성
+
+    모델 인스턴스를 만들지 않고 필요한 컬럼만 chunk 단위로 읽어 메모리 사용량을 일정하게 유지한다.
+    """
+    writer = csv.writer(Echo())
+    status_labels = dict(ArtistApplication.STATUS_CHOICES)
     
     # BOM 추가 (Excel에서 한글이 제대로 보이도록)
-    response.write('\ufeff')
-    
-    writer = csv.writer(response)
-    
-    # CSV 헤더 작성
-    writer.writerow([
-        'ID',
-        '이름',
-        '성별', 
-        '생년월일',
-        '이메일',
-        '연락처',
-        '신청일시',
-        '상태',
-        '처리일시',
-        '신청자 사용자명'
-    ])
+    yield '\ufeff' + writer.writerow(CSV_HEADER)
     
     # 모든 신청 데이터 가져오기 (최신순 정렬)
-    applications = ArtistApplication.objects.select_related('user').order_by('-applied_at')
-    
-    # 데이터 행 작성
-    for application in applications:
-        writer.writerow([
-            application.id,
-            application.name,
-            application.gender,
-            application.birthday.strftime('%Y-%m-%d'),
-            application.email,
-            application.phone_number,
-            application.applied_at.strftime('%Y-%m-%d %H:%M:%S'),
-            application.get_status_display(),
-            application.processed_at.strftime('%Y-%m-%d %H:%M:%S') if application.processed_at else '',
-            application.user.username
+    rows = ArtistApplication.objects.order_by('-applied_at').values_list(
+        'id', 'name', 'gender', 'birthday', 'email', 'phone_number',
+        'applied_at', 'status', 'processed_at', 'user__username'
+    )
+    for (application_id, name, gender, birthday, email, phone_number,
+         applied_at, status, processed_at, username) in rows.iterator(chunk_size=CSV_CHUNK_SIZE):
+        yield writer.writerow([
+            application_id,
+            name,
+            gender,
+            birthday.strftime('%Y-%m-%d'),
+            email,
+            phone_number,
+            applied_at.strftime('%Y-%m-%d %H:%M:%S'),
+            status_labels.get(status, status),
+            processed_at.strftime('%Y-%m-%d %H:%M:%S') if processed_at else '',
+            username
         ])
+
+
+@login_required
+def download_applications_csv(request):
+    """작가 등록 신청 데이터를 CSV 파일로 다운로드 (스트리밍)"""
+    if not request.user.is_staff:
+        messages.error(request, '관리자만 접근할 수 있습니다.')
+        return redirect('auth_management:home')
     
+    response = StreamingHttpResponse(iter_applications_csv(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="artist_applications_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
     return response
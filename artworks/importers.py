@@ -0,0 +1,121 @@
+"""작품 일괄 등록 (CSV / JSON)
+
+파일의 모든 행을 메모리에서 먼저 검증한 뒤, 오류가 없으면(또는 skip_invalid이면 올바른 행만)
+한 트랜잭션 안에서 bulk_create로 나누어 저장한다. bulk_create는 post_save를 보내지 않으므로
+저장 후 artworks_bulk_created 시그널로 통계/검색 색인/작품 수/캐시 세대를 갱신한다.
+
+CSV는 title, price, size_number 헤더를 가진 UTF-8 파일,
+JSON은 같은 키를 가진 객체의 배열이다. 가격의 천 단위 콤마는 허용된다.
+"""
+import csv
+import io
+import json
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from .models import Artwork
+from .signals import artworks_bulk_created
+
+IMPORT_FIELDS = ('title', 'price', 'size_number')
+IMPORT_FORMATS = ('csv', 'json')
+IMPORT_BATCH_SIZE = 500
+# 한 번에 등록할 수 있는 최대 행 수
+MAX_IMPORT_ROWS = 5000
+
+
+class ArtworkImportError(Exception):
+    """파일 자체를 읽을 수 없는 경우 (형식 오류, 헤더 누락, 행 수 초과 등)"""
+
+
+def detect_format(filename):
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension not in IMPORT_FORMATS:
+        raise ArtworkImportError('CSV(.csv) 또는 JSON(.json) 파일만 등록할 수 있습니다.')
+    return extension
+
+
+def read_rows(content, file_format):
+    """파일 내용(bytes 또는 str)을 행(dict) 목록으로 변환"""
+    if isinstance(content, bytes):
+        try:
+            content = content.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            raise ArtworkImportError('UTF-8 인코딩 파일만 등록할 수 있습니다.')
+
+    if file_format == 'csv':
+        reader = csv.DictReader(io.StringIO(content))
+        missing = [name for name in IMPORT_FIELDS if name not in (reader.fieldnames or [])]
+        if missing:
+            raise ArtworkImportError(f'CSV 헤더에 다음 열이 없습니다: {", ".join(missing)}')
+        rows = list(reader)
+    elif file_format == 'json':
+        try:
+            rows = json.loads(content)
+        except ValueError:
+            raise ArtworkImportError('올바른 JSON 파일이 아닙니다.')
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ArtworkImportError('JSON은 작품 객체의 배열이어야 합니다.')
+    else:
+        raise ArtworkImportError(f'지원하지 않는 형식입니다: {file_format}')
+
+    if not rows:
+        raise ArtworkImportError('등록할 작품이 없습니다.')
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise ArtworkImportError(f'한 번에 최대 {MAX_IMPORT_ROWS:,}개까지 등록할 수 있습니다.')
+    return rows
+
+
+def clean_row(row):
+    """행 하나를 모델 필드 규칙으로 검증해 (값 dict, 오류 메시지 목록)을 반환"""
+    values = {}
+    errors = []
+
+    raw = {name: row.get(name) for name in IMPORT_FIELDS}
+    if isinstance(raw['price'], str):
+        # 가격에서 콤마 제거
+        raw['price'] = raw['price'].replace(',', '')
+    for name, value in raw.items():
+        if isinstance(value, str):
+            value = value.strip()
+        field = Artwork._meta.get_field(name)
+        if value in (None, ''):
+            errors.append(f'{name}: 값이 없습니다.')
+            continue
+        try:
+            # 모델 필드의 변환/검증 규칙(최대 길이, 0 이상, 1~500호)을 그대로 적용
+            values[name] = field.clean(value, None)
+        except ValidationError as exc:
+            errors.extend(f'{name}: {message}' for message in exc.messages)
+    return values, errors
+
+
+def validate_rows(rows):
+    """모든 행을 검증해 (올바른 행 값 목록, 오류 목록)을 반환. 오류의 row는 1부터 시작하는 데이터 행 번호"""
+    valid = []
+    errors = []
+    for number, row in enumerate(rows, start=1):
+        values, row_errors = clean_row(row)
+        if row_errors:
+            errors.append({'row': number, 'errors': row_errors})
+        else:
+            valid.append(values)
+    return valid, errors
+
+
+def import_artworks(artist, rows, skip_invalid=False, batch_size=IMPORT_BATCH_SIZE):
+    """작가의 작품을 일괄 등록하고 {'created': 등록 수, 'errors': 행별 오류}를 반환
+
+    오류가 있는 행이 하나라도 있으면 skip_invalid가 아닌 한 아무것도 저장하지 않는다.
+    """
+    valid, errors = validate_rows(rows)
+    if errors and not skip_invalid:
+        return {'created': 0, 'errors': errors}
+    if not valid:
+        return {'created': 0, 'errors': errors}
+
+    with transaction.atomic():
+        artworks = Artwork.objects.bulk_create(
+            [Artwork(artist=artist, **values) for values in valid],
+            batch_size=batch_size,
+        )
+        artworks_bulk_created.send(sender=Artwork, instances=artworks)
+    return {'created': len(artworks), 'errors': errors}
@@ -0,0 +1,45 @@
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from artists.models import Artist
+from artworks import importers
+
+
+class Command(BaseCommand):
+    help = 'CSV/JSON 파일의 작품들을 작가의 작품으로 일괄 등록합니다.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='작품 파일 경로 (.csv 또는 .json)')
+        parser.add_argument('--artist', required=True, help='작가 ID 또는 사용자명')
+        parser.add_argument('--format', choices=importers.IMPORT_FORMATS, help='파일 형식 (기본값: 확장자로 판단)')
+        parser.add_argument('--skip-invalid', action='store_true', help='오류가 있는 행은 건너뛰고 나머지만 등록')
+        parser.add_argument('--batch-size', type=int, default=importers.IMPORT_BATCH_SIZE,
+                            help=f'bulk_create 배치 크기 (기본값: {importers.IMPORT_BATCH_SIZE})')
+    
+    def get_artist(self, value):
+        artists = Artist.objects.filter(pk=value) if value.isdigit() else Artist.objects.filter(user__username=value)
+        artist = artists.first()
+        if artist is None:
+            raise CommandError(f'작가를 찾을 수 없습니다: {value}')
+        return artist
+    
+    def handle(self, *args, **options):
+        artist = self.get_artist(options['artist'])
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'파일이 없습니다: {path}')
+        
+        try:
+            file_format = options['format'] or importers.detect_format(path.name)
+            rows = importers.read_rows(path.read_bytes(), file_format)
+        except importers.ArtworkImportError as e:
+            raise CommandError(str(e))
+        
+        result = importers.import_artworks(
+            artist, rows, skip_invalid=options['skip_invalid'], batch_size=options['batch_size'],
+        )
+        for error in result['errors']:
+            self.stderr.write(f'{error["row"]}행: {", ".join(error["errors"])}')
+        
+        if result['errors'] and not result['created']:
+            raise CommandError(f'오류가 있는 행이 {len(result["errors"])}개 있어 등록하지 않았습니다.')
+        self.stdout.write(self.style.SUCCESS(f'{artist.name} 작가의 작품 {result["created"]}개를 등록했습니다.'))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artworks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['-created_at', '-id'], name='artwork_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['artist', '-created_at'], name='artwork_artist_created_idx'),
+        ),
+    ]
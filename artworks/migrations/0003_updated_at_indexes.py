@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artworks', '0002_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['updated_at'], name='artwork_updated_idx'),
+        ),
+    ]
@@ -21,3 +21,11 @@ class Artwork(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # 작품 목록 (최신순, 커서 페이지네이션)
+            models.Index(fields=['-created_at', '-id'], name='artwork_created_idx'),
+            # 작가별 작품 목록 (작가 대시보드, 전시 등록)
+            models.Index(fields=['artist', '-created_at'], name='artwork_artist_created_idx'),
+            # 목록 조건부 응답의 MAX(updated_at)
+            models.Index(fields=['updated_at'], name='artwork_updated_idx'),
+        ]
@@ -0,0 +1,44 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+from artists.models import ArtistStats
+from .models import Artwork
+
+# 작품 일괄 등록(artworks.importers) 후 보낸다. 인자는 artists_bulk_created와 같다
+artworks_bulk_created = Signal()
+
+
+def is_direct_delete(origin):
+    """작품 자체를 삭제한 경우인지 (작가/사용자 삭제로 인한 연쇄 삭제가 아닌지)"""
+    return isinstance(origin, Artwork) or getattr(origin, 'model', None) is Artwork
+
+
+@receiver(pre_save, sender=Artwork)
+def remember_previous_artist(sender, instance, **kwargs):
+    """작가가 바뀌는 수정이면 이전 작가의 통계도 갱신할 수 있도록 기억해 둔다"""
+    instance._previous_artist_id = None
+    if instance.pk:
+        instance._previous_artist_id = (
+            Artwork.objects.filter(pk=instance.pk).values_list('artist_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Artwork)
+def refresh_stats_on_save(sender, instance, **kwargs):
+    artist_ids = {instance.artist_id}
+    previous_artist_id = getattr(instance, '_previous_artist_id', None)
+    if previous_artist_id:
+        artist_ids.add(previous_artist_id)
+    ArtistStats.refresh(artist_ids)
+
+
+@receiver(post_delete, sender=Artwork)
+def refresh_stats_on_delete(sender, instance, origin=None, **kwargs):
+    # 작가/사용자 삭제로 인한 연쇄 삭제라면 통계 행도 함께 삭제되므로 갱신하지 않는다
+    if is_direct_delete(origin):
+        ArtistStats.refresh([instance.artist_id])
+
+
+@receiver(artworks_bulk_created, sender=Artwork)
+def refresh_stats_on_bulk_create(sender, instances, **kwargs):
+    artist_ids = {artwork.artist_id for artwork in instances}
+    ArtistStats.refresh(artist_ids)
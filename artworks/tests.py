@@ -1,10 +1,24 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.contrib.auth.models import User
 from django.urls import reverse
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from datetime import date
 from artists.models import Artist
+from opengallery.pagination import NEXT, encode_cursor
+from opengallery.tests import LOCMEM_CACHES
+from search import index as search_index
 from .models import Artwork
+from . import importers
+from .views import ARTWORKS_PER_PAGE
+import io
+import json
+import os
+import tempfile
 
 
 class ArtworkModelTest(TestCase):
@@ -226,3 +240,228 @@ class ArtworkIntegrationTest(TestCase):
         # 각 작품이 올바른 작가에게 속하는지 확인
         self.assertEqual(artwork1.artist, self.artist)
         self.assertEqual(artwork2.artist, artist2)
+
+
+class ArtworkFeedTest(TestCase):
+    """무한 스크롤용 작품 카드 조각 엔드포인트 테스트"""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(username='feed', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='피드작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='feed@example.com',
+            phone_number='010-1234-5678'
+        )
+        Artwork.objects.bulk_create([
+            Artwork(artist=self.artist, title=f'피드작품{i:02d}', price=1000 * (i + 1), size_number=10)
+            for i in range(ARTWORKS_PER_PAGE * 2 + 5)
+        ])
+        self.url = reverse('artworks:artwork_feed')
+    
+    def fetch(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return json.loads(response.content)
+    
+    def test_follow_cursor_to_end(self):
+        """next_cursor를 따라가면 모든 작품 카드를 중복 없이 받는지 테스트"""
+        titles = []
+        data = self.fetch()
+        while True:
+            titles.extend(
+                line.split('>')[1].split('<')[0] for line in data['html'].splitlines()
+                if 'card-title' in line
+            )
+            if not data['next_cursor']:
+                break
+            data = self.fetch(cursor=data['next_cursor'])
+        
+        self.assertEqual(len(titles), ARTWORKS_PER_PAGE * 2 + 5)
+        self.assertEqual(len(set(titles)), len(titles))
+        self.assertEqual(titles[0], '피드작품28')
+    
+    def test_cursor_past_last_item(self):
+        """마지막 항목 이후를 가리키는 커서는 첫 페이지 대신 빈 조각을 반환하는지 테스트"""
+        oldest = Artwork.objects.order_by('created_at', 'id').first()
+        cursor = encode_cursor(NEXT, oldest.created_at, oldest.id)
+        self.assertEqual(self.fetch(cursor=cursor), {'html': '', 'next_cursor': None})
+        
+        # 끝 부분이 삭제되어 커서 이후가 비게 된 경우
+        data = self.fetch()
+        first_page = Artwork.objects.order_by('-created_at', '-id')[:ARTWORKS_PER_PAGE]
+        Artwork.objects.exclude(pk__in=list(first_page.values_list('pk', flat=True))).delete()
+        self.assertEqual(self.fetch(cursor=data['next_cursor']), {'html': '', 'next_cursor': None})
+        self.assertEqual(self.fetch(cursor='잘못된커서'), {'html': '', 'next_cursor': None})
+    
+    def test_fragment_only(self):
+        """응답 HTML이 레이아웃 없이 카드만 포함하는지 테스트"""
+        data = self.fetch()
+        self.assertEqual(data['html'].count('card-title'), ARTWORKS_PER_PAGE)
+        self.assertNotIn('<nav', data['html'])
+        self.assertNotIn('<html', data['html'])
+        self.assertIn('₩1,000', self.fetch(cursor=self.fetch(cursor=data['next_cursor'])['next_cursor'])['html'])
+    
+    def test_search(self):
+        """검색어가 적용되는지 테스트"""
+        Artwork.objects.create(artist=self.artist, title='바다 풍경', price=5000, size_number=20)
+        data = self.fetch(search='풍경')
+        self.assertEqual(data['html'].count('card-title'), 1)
+        self.assertIsNone(data['next_cursor'])
+    
+    def test_no_session_or_user_queries(self):
+        """로그인 사용자 요청에서도 세션/사용자를 조회하지 않는지 테스트"""
+        self.client.login(username='feed', password='testpass123')
+        with CaptureQueriesContext(connection) as ctx:
+            self.fetch()
+        tables = ' '.join(query['sql'] for query in ctx.captured_queries)
+        self.assertNotIn('django_session', tables)
+        self.assertNotIn('"auth_user"', tables)
+    
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_cached_until_artworks_change(self):
+        """응답이 캐시되고 작품이 바뀌면 다시 렌더링되는지 테스트"""
+        cache.clear()
+        first = self.fetch()
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.fetch(), first)
+        self.assertEqual(len(ctx.captured_queries), 0)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Artwork.objects.create(artist=self.artist, title='새 작품', price=1000, size_number=10)
+        self.assertIn('새 작품', self.fetch()['html'])
+        cache.clear()
+    
+    def test_list_page_wires_feed(self):
+        """작품 목록 페이지가 무한 스크롤 설정(피드 URL, 다음 커서)을 포함하는지 테스트"""
+        response = self.client.get(reverse('artworks:artwork_list'))
+        self.assertContains(response, f'data-feed-url="{self.url}"')
+        self.assertContains(response, f'data-next-cursor="{self.fetch()["next_cursor"]}"')
+        self.assertContains(response, 'data-pagination')
+
+
+class ArtworkImportTest(TestCase):
+    """작품 일괄 등록 테스트"""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(username='importer', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='일괄작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='importer@example.com',
+            phone_number='010-1234-5678'
+        )
+    
+    def csv_content(self, rows):
+        lines = ['title,price,size_number'] + [','.join(row) for row in rows]
+        return '\n'.join(lines).encode('utf-8')
+    
+    def test_validate_rows(self):
+        """가격 콤마는 허용하고, 호수 범위/필수값/길이 오류는 행 번호와 함께 보고해야 함"""
+        rows = [
+            {'title': '정상', 'price': '3,000,000', 'size_number': '10'},
+            {'title': '큰작품', 'price': '1000', 'size_number': '501'},
+            {'title': '', 'price': '-5', 'size_number': '0'},
+            {'title': '가' * 65, 'price': 'abc', 'size_number': '1'},
+        ]
+        valid, errors = importers.validate_rows(rows)
+        
+        self.assertEqual(valid, [{'title': '정상', 'price': 3000000, 'size_number': 10}])
+        self.assertEqual([error['row'] for error in errors], [2, 3, 4])
+        self.assertEqual(len(errors[1]['errors']), 3)
+    
+    def test_import_is_all_or_nothing(self):
+        """오류가 있으면 skip_invalid가 아닌 한 아무것도 저장하지 않아야 함"""
+        rows = [
+            {'title': '정상', 'price': '1000', 'size_number': '10'},
+            {'title': '오류', 'price': '1000', 'size_number': '999'},
+        ]
+        result = importers.import_artworks(self.artist, rows)
+        self.assertEqual(result['created'], 0)
+        self.assertFalse(Artwork.objects.exists())
+        
+        result = importers.import_artworks(self.artist, rows, skip_invalid=True)
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(len(result['errors']), 1)
+    
+    def test_bulk_insert_updates_derived_data(self):
+        """일괄 등록은 배치로 저장하고 작품 수, 통계, 검색 색인을 갱신해야 함"""
+        rows = [{'title': f'일괄작품{i}', 'price': 1000, 'size_number': 50} for i in range(30)]
+        with CaptureQueriesContext(connection) as queries:
+            result = importers.import_artworks(self.artist, rows, batch_size=10)
+        
+        self.assertEqual(result['created'], 30)
+        inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "artworks_artwork"')]
+        self.assertEqual(len(inserts), 3)
+        
+        self.artist.refresh_from_db()
+        self.assertEqual(self.artist.stats.artwork_count, 30)
+        self.assertEqual(self.artist.stats.small_artwork_count, 30)
+        if search_index.is_enabled():
+            found = search_index.search_artworks(Artwork.objects.all(), '일괄작품2')
+            self.assertEqual(set(found.values_list('title', flat=True)), {'일괄작품2'} | {f'일괄작품2{i}' for i in range(10)})
+    
+    def test_read_rows_errors(self):
+        """헤더 누락, 잘못된 JSON, 지원하지 않는 확장자는 파일 오류여야 함"""
+        with self.assertRaises(importers.ArtworkImportError):
+            importers.read_rows(b'name,price\nx,1', 'csv')
+        with self.assertRaises(importers.ArtworkImportError):
+            importers.read_rows(b'{"title": "x"}', 'json')
+        with self.assertRaises(importers.ArtworkImportError):
+            importers.detect_format('artworks.xlsx')
+    
+    def test_upload_view(self):
+        """대시보드 일괄 등록 화면에서 CSV를 올리면 작품이 등록되어야 함"""
+        self.client.login(username='importer', password='testpass123')
+        upload = SimpleUploadedFile('artworks.csv', self.csv_content([
+            ('작품A', '"1,000,000"', '10'),
+            ('작품B', '2000', '20'),
+        ]))
+        response = self.client.post(reverse('artworks:import_artworks'), {'file': upload})
+        
+        self.assertRedirects(response, reverse('artists:artist_dashboard'))
+        self.assertEqual(
+            sorted(Artwork.objects.values_list('title', 'price')),
+            [('작품A', 1000000), ('작품B', 2000)]
+        )
+    
+    def test_upload_view_reports_row_errors(self):
+        """오류가 있는 행은 화면에 행 번호와 함께 표시되어야 함"""
+        self.client.login(username='importer', password='testpass123')
+        upload = SimpleUploadedFile('artworks.json', json.dumps([
+            {'title': '작품A', 'price': 1000, 'size_number': 10},
+            {'title': '작품B', 'price': 1000, 'size_number': 0},
+        ]).encode())
+        response = self.client.post(reverse('artworks:import_artworks'), {'file': upload})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['row_errors'][0]['row'], 2)
+        self.assertFalse(Artwork.objects.exists())
+    
+    def test_upload_requires_artist(self):
+        """작가가 아닌 사용자는 일괄 등록할 수 없어야 함"""
+        User.objects.create_user(username='visitor', password='testpass123')
+        self.client.login(username='visitor', password='testpass123')
+        response = self.client.get(reverse('artworks:import_artworks'))
+        self.assertRedirects(response, reverse('auth_management:home'))
+    
+    def test_import_command(self):
+        """import_artworks 명령으로 파일의 작품을 등록할 수 있어야 함"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'artworks.csv')
+            with open(path, 'wb') as f:
+                f.write(self.csv_content([('명령작품', '5000', '30')]))
+            
+            call_command('import_artworks', path, artist='importer', stdout=io.StringIO())
+            self.assertTrue(Artwork.objects.filter(title='명령작품', artist=self.artist).exists())
+            
+            with open(path, 'wb') as f:
+                f.write(self.csv_content([('오류작품', '5000', '600')]))
+            with self.assertRaises(CommandError):
+                call_command('import_artworks', path, artist=str(self.artist.pk),
+                             stdout=io.StringIO(), stderr=io.StringIO())
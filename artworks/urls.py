@@ -1,9 +1,12 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'artworks'
 
 urlpatterns = [
-    path('artworks/', views.artwork_list, name='artwork_list'),
+    path('artworks/', views.artwork_list_async if settings.ASYNC_VIEWS else views.artwork_list, name='artwork_list'),
+    path('artworks/feed/', views.artwork_feed, name='artwork_feed'),
     path('artwork/create/', views.create_artwork, name='create_artwork'),
+    path('artwork/import/', views.import_artworks, name='import_artworks'),
 ]
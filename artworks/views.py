@@ -1,35 +1,91 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect
+from django.template.loader import render_to_string
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator
-from django.db.models import Q
+from django.http import HttpResponse
 from .models import Artwork
-from artists.models import Artist
+from . import importers
+from artists.utils import get_user_artist
+from search import index as search_index
+from opengallery import listing_cache
+from opengallery.conditional import alisting_condition, listing_condition
+from opengallery.pagination import CursorPaginator, LISTING_COUNT_LIMIT
+import json
 
-def artwork_list(request):
-    search_query = request.GET.get('search', '')
-    artworks = Artwork.objects.all().order_by('-created_at')
+ARTWORKS_PER_PAGE = 12
+
+def artwork_paginator(search_query, count_limit=LISTING_COUNT_LIMIT):
+    """작품 목록 페이지네이터 (동기/비동기 목록 뷰와 무한 스크롤 공용)"""
+    artworks = Artwork.objects.select_related('artist').order_by('-created_at')
     
     if search_query:
-        artworks = artworks.filter(
-            Q(title__icontains=search_query) |
-            Q(artist__name__icontains=search_query)
-        )
+        artworks = search_index.search_artworks(artworks, search_query)
     
-    paginator = Paginator(artworks, 12)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
-    return render(request, 'gallery/artwork_list.html', {
+    return CursorPaginator(artworks, ARTWORKS_PER_PAGE, count_limit=count_limit)
+
+def render_artwork_listing(request, search_query, page_obj):
+    return render_to_string('gallery/partials/artwork_listing.html', {
         'page_obj': page_obj,
         'search_query': search_query
+    }, request=request)
+
+def render_artwork_page(request, search_query, listing_html):
+    return render(request, 'gallery/artwork_list.html', {
+        'listing_html': listing_html,
+        'search_query': search_query
     })
 
+@listing_condition('artworks')
+def artwork_list(request):
+    search_query = request.GET.get('search', '')
+    
+    def render_listing():
+        page_obj = artwork_paginator(search_query).get_page(request.GET.get('cursor'))
+        return render_artwork_listing(request, search_query, page_obj)
+    
+    listing_html = listing_cache.get_or_render('artworks', request, render_listing)
+    return render_artwork_page(request, search_query, listing_html)
+
+@alisting_condition('artworks')
+async def artwork_list_async(request):
+    """artwork_list의 비동기 버전 (ASGI 프로필에서 사용, 조회만 비동기 ORM으로 바꾼다)"""
+    search_query = request.GET.get('search', '')
+    
+    async def render_listing():
+        page_obj = await artwork_paginator(search_query).aget_page(request.GET.get('cursor'))
+        return await sync_to_async(render_artwork_listing)(request, search_query, page_obj)
+    
+    listing_html = await listing_cache.aget_or_render('artworks', request, render_listing)
+    return await sync_to_async(render_artwork_page)(request, search_query, listing_html)
+
+def artwork_feed(request):
+    """무한 스크롤용 다음 작품 카드 묶음
+
+    {"html": 카드 HTML 조각, "next_cursor": 다음 커서 또는 null}을 반환한다.
+    커서 이후 항목이 없으면 (끝의 작품이 삭제된 경우 등) 첫 페이지 대신 빈 조각과 null을 반환해
+    이미 붙인 카드가 중복되지 않도록 한다.
+    카드는 요청 컨텍스트 없이 렌더링하므로 세션/사용자 조회와 전체 레이아웃 렌더링이 없고,
+    결과는 로그인 여부와 관계없이 하나의 캐시 항목을 공유한다.
+    """
+    def render_feed():
+        # 이어 붙이는 카드에는 전체 개수를 표시하지 않으므로 근사 개수도 세지 않는다
+        paginator = artwork_paginator(request.GET.get('search', ''), count_limit=None)
+        page_obj = paginator.get_page(request.GET.get('cursor'), fallback_to_first=False)
+        return json.dumps({
+            'html': render_to_string('gallery/partials/artwork_cards.html', {'artworks': page_obj}).strip(),
+            'next_cursor': page_obj.next_cursor,
+        }, ensure_ascii=False)
+    
+    return HttpResponse(
+        listing_cache.get_or_render('artwork_feed', request, render_feed),
+        content_type='application/json',
+    )
+
 @login_required
 def create_artwork(request):
-    try:
-        artist = Artist.objects.get(user=request.user)
-    except Artist.DoesNotExist:
+    artist = get_user_artist(request.user)
+    if artist is None:
         messages.error(request, '작가로 등록되지 않은 사용자입니다.')
         return redirect('auth_management:home')
     
@@ -61,3 +117,40 @@ def create_artwork(request):
             messages.error(request, f'작품 등록 중 오류가 발생했습니다: {str(e)}')
     
     return render(request, 'artist/create_artwork.html')
+
+@login_required
+def import_artworks(request):
+    """CSV/JSON 파일로 작품 일괄 등록"""
+    artist = get_user_artist(request.user)
+    if artist is None:
+        messages.error(request, '작가로 등록되지 않은 사용자입니다.')
+        return redirect('auth_management:home')
+    
+    context = {'max_rows': importers.MAX_IMPORT_ROWS}
+    
+    if request.method == 'POST':
+        upload = request.FILES.get('file')
+        skip_invalid = request.POST.get('skip_invalid') == 'on'
+        
+        if upload is None:
+            messages.error(request, '등록할 파일을 선택해주세요.')
+            return render(request, 'artist/import_artworks.html', context)
+        
+        try:
+            file_format = importers.detect_format(upload.name)
+            rows = importers.read_rows(upload.read(), file_format)
+        except importers.ArtworkImportError as e:
+            messages.error(request, str(e))
+            return render(request, 'artist/import_artworks.html', context)
+        
+        result = importers.import_artworks(artist, rows, skip_invalid=skip_invalid)
+        context['row_errors'] = result['errors']
+        
+        if result['created']:
+            messages.success(request, f'작품 {result["created"]}개가 등록되었습니다.')
+            if not result['errors']:
+                return redirect('artists:artist_dashboard')
+        elif result['errors']:
+            messages.error(request, f'오류가 있는 행이 {len(result["errors"])}개 있어 등록하지 않았습니다.')
+    
+    return render(request, 'artist/import_artworks.html', context)
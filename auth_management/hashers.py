@@ -0,0 +1,56 @@
+"""비용 파라미터를 설정(PASSWORD_HASHER_PARAMS)에서 읽는 비밀번호 해시
+
+알고리즘 이름은 Django 기본 해시와 같으므로 기존 해시를 그대로 확인할 수 있고,
+파라미터가 바뀌면 must_update()가 참이 되어 다음 로그인 때 새 파라미터로 다시 저장된다.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher,
+)
+
+# hashlib.scrypt의 maxmem 기본값 (OpenSSL 기본 32MiB)
+SCRYPT_DEFAULT_MAXMEM = 32 * 1024 * 1024
+
+
+def hasher_param(name, default):
+    return getattr(settings, 'PASSWORD_HASHER_PARAMS', {}).get(name, default)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return hasher_param('ARGON2_TIME_COST', Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return hasher_param('ARGON2_MEMORY_COST', Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return hasher_param('ARGON2_PARALLELISM', Argon2PasswordHasher.parallelism)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return hasher_param('SCRYPT_WORK_FACTOR', ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return hasher_param('SCRYPT_BLOCK_SIZE', ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return hasher_param('SCRYPT_PARALLELISM', ScryptPasswordHasher.parallelism)
+
+    @property
+    def maxmem(self):
+        # scrypt는 약 128 * n * r 바이트를 쓰므로 work_factor를 올리면 기본 한도(32MiB)를 넘는다
+        required = 128 * self.work_factor * self.block_size * (self.parallelism + 2)
+        return max(SCRYPT_DEFAULT_MAXMEM, 2 * required)
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return hasher_param('PBKDF2_ITERATIONS', PBKDF2PasswordHasher.iterations)
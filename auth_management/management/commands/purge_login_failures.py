@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from auth_management.models import LoginFailure
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        '만료된 로그인 실패 기록을 나누어 삭제합니다. 한 번에 삭제하는 행 수를 제한해 '
+        '로그인 실패 기록을 쓰는 요청이 오래 기다리지 않습니다.'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help=f'한 번에 삭제할 행 수 (기본값: {DEFAULT_BATCH_SIZE})',
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다.')
+        
+        expired = LoginFailure.objects.filter(expires_at__lte=timezone.now())
+        deleted = 0
+        while True:
+            pks = list(expired.values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            deleted += LoginFailure.objects.filter(pk__in=pks).delete()[0]
+        
+        self.stdout.write(self.style.SUCCESS(f'만료된 로그인 실패 기록 {deleted}개를 삭제했습니다.'))
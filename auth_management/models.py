@@ -1,3 +1,16 @@
 from django.db import models
 
-# Create your models here.
+
+class LoginFailure(models.Model):
+    """사용자명/IP별 로그인 실패 횟수 (auth_management.throttling)
+
+    여러 워커가 동시에 실패를 기록해도 빠지지 않도록 count는 F()로 증가시킨다.
+    마지막 실패 후 LOGIN_THROTTLE_WINDOW초가 지나면(expires_at) 횟수는 무시되고,
+    다음 실패는 1부터 다시 센다.
+    """
+    key = models.CharField(max_length=100, unique=True)
+    count = models.PositiveIntegerField(default=0)
+    expires_at = models.DateTimeField(db_index=True)
+    
+    def __str__(self):
+        return f"{self.key}: {self.count}"
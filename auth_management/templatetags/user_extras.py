@@ -1,25 +1,14 @@
 from django import template
-from artists.models import Artist
+from artists.utils import get_user_artist
 
 register = template.Library()
 
 @register.filter
 def is_artist(user):
     """사용자가 작가인지 확인"""
-    if not user.is_authenticated:
-        return False
-    try:
-        Artist.objects.get(user=user)
-        return True
-    except Artist.DoesNotExist:
-        return False
+    return get_user_artist(user) is not None
 
 @register.filter
 def get_artist(user):
     """사용자의 작가 정보 반환"""
-    if not user.is_authenticated:
-        return None
-    try:
-        return Artist.objects.get(user=user)
-    except Artist.DoesNotExist:
-        return None
+    return get_user_artist(user)
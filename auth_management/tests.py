@@ -1,9 +1,18 @@
-from django.test import TestCase, Client
+from unittest import mock
+from django.test import TestCase, Client, override_settings
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.exceptions import ImproperlyConfigured
 from django.urls import reverse
 from django.contrib.auth import authenticate
+from django.utils import timezone
 from artists.models import Artist
-from datetime import date
+from opengallery.hasher_profile import argon2_available, password_hashers
+from datetime import date, timedelta
+from io import StringIO
+from .models import LoginFailure
 
 
 class AuthViewTest(TestCase):
@@ -316,3 +325,144 @@ class AuthSecurityTest(TestCase):
         # 로그아웃 후 세션 정리 확인
         self.client.logout()
         self.assertNotIn('_auth_user_id', self.client.session)
+
+
+# 테스트가 느려지지 않도록 비용을 낮춘 파라미터
+FAST_HASHER_PARAMS = {
+    'SCRYPT_WORK_FACTOR': 2**4,
+    'SCRYPT_BLOCK_SIZE': 8,
+    'SCRYPT_PARALLELISM': 1,
+    'PBKDF2_ITERATIONS': 1000,
+}
+
+
+class PasswordHasherProfileTest(TestCase):
+    """비밀번호 해시 프로필과 로그인 시 재해시 테스트"""
+
+    def test_profile_puts_preferred_hasher_first(self):
+        """선택한 프로필의 해시가 맨 앞에 오고 나머지 해시도 확인용으로 남는지 테스트"""
+        hashers = password_hashers('scrypt')
+
+        self.assertEqual(hashers[0], 'auth_management.hashers.TunedScryptPasswordHasher')
+        self.assertIn('auth_management.hashers.TunedPBKDF2PasswordHasher', hashers)
+        self.assertEqual(len(hashers), len(set(hashers)))
+
+    def test_auto_profile(self):
+        """auto 프로필은 argon2-cffi가 있을 때만 argon2를 사용하는지 테스트"""
+        expected = 'TunedArgon2PasswordHasher' if argon2_available() else 'TunedScryptPasswordHasher'
+
+        self.assertTrue(password_hashers('auto')[0].endswith(expected))
+
+    def test_invalid_profile(self):
+        """알 수 없는 프로필은 설정 오류인지 테스트"""
+        with self.assertRaises(ImproperlyConfigured):
+            password_hashers('md5')
+
+    @override_settings(
+        PASSWORD_HASHERS=password_hashers('scrypt'),
+        PASSWORD_HASHER_PARAMS=FAST_HASHER_PARAMS,
+    )
+    def test_rehash_on_login(self):
+        """기존 PBKDF2 해시가 로그인 시 선택한 알고리즘으로 다시 저장되는지 테스트"""
+        user = User.objects.create_user(username='legacy')
+        user.password = make_password('legacypass123', hasher='pbkdf2_sha256')
+        user.save()
+
+        response = self.client.post(reverse('auth_management:login'), {
+            'username': 'legacy',
+            'password': 'legacypass123',
+        })
+
+        self.assertEqual(response.status_code, 302)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('scrypt$16$'))
+
+    @override_settings(
+        PASSWORD_HASHERS=password_hashers('scrypt'),
+        PASSWORD_HASHER_PARAMS=FAST_HASHER_PARAMS,
+    )
+    def test_rehash_when_parameters_change(self):
+        """비용 파라미터를 바꾸면 다음 로그인 때 새 파라미터로 다시 저장되는지 테스트"""
+        user = User.objects.create_user(username='tuned', password='tunedpass123')
+        self.assertTrue(user.password.startswith('scrypt$16$'))
+
+        with self.settings(PASSWORD_HASHER_PARAMS={**FAST_HASHER_PARAMS, 'SCRYPT_WORK_FACTOR': 2**5}):
+            self.assertTrue(self.client.login(username='tuned', password='tunedpass123'))
+
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('scrypt$32$'))
+
+
+@override_settings(
+    LOGIN_THROTTLE_MAX_FAILURES=3,
+    LOGIN_THROTTLE_IP_MAX_FAILURES=5,
+)
+class LoginThrottleTest(TestCase):
+    """로그인 실패 횟수 제한 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.url = reverse('auth_management:login')
+
+    def login(self, username='testuser', password='wrongpassword'):
+        return self.client.post(self.url, {'username': username, 'password': password})
+
+    def test_locked_after_max_failures(self):
+        """실패가 한도에 도달하면 올바른 비밀번호도 해시 계산 없이 거절되는지 테스트"""
+        for _ in range(3):
+            self.assertEqual(self.login().status_code, 200)
+
+        with mock.patch('auth_management.views.authenticate') as authenticate_mock:
+            response = self.login(password='testpass123')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertContains(response, '로그인 시도가 너무 많습니다', status_code=429)
+        authenticate_mock.assert_not_called()
+        self.assertNotIn('_auth_user_id', self.client.session)
+
+    def test_username_is_case_insensitive(self):
+        """사용자명 대소문자를 바꿔도 같은 실패 횟수를 쓰는지 테스트"""
+        for username in ('testuser', 'TestUser', ' TESTUSER'):
+            self.login(username=username)
+
+        self.assertEqual(self.login(password='testpass123').status_code, 429)
+
+    def test_success_resets_failures(self):
+        """로그인에 성공하면 사용자명의 실패 횟수가 초기화되는지 테스트"""
+        for _ in range(2):
+            self.login()
+        self.assertEqual(self.login(password='testpass123').status_code, 302)
+        self.client.logout()
+
+        for _ in range(2):
+            self.login()
+        self.assertEqual(self.login(password='testpass123').status_code, 302)
+
+    def test_ip_limit_across_usernames(self):
+        """여러 사용자명을 번갈아 시도해도 IP별 한도에 걸리는지 테스트"""
+        for number in range(5):
+            self.login(username=f'unknown{number}')
+
+        self.assertEqual(self.login(password='testpass123').status_code, 429)
+
+    def test_failures_expire_after_window(self):
+        """마지막 실패 후 LOGIN_THROTTLE_WINDOW가 지나면 잠금이 풀리고 1부터 다시 세는지 테스트"""
+        for _ in range(3):
+            self.login()
+        later = timezone.now() + timedelta(seconds=settings.LOGIN_THROTTLE_WINDOW + 1)
+        with mock.patch('auth_management.throttling.timezone.now', return_value=later):
+            self.assertEqual(self.login().status_code, 200)
+            self.assertEqual(self.login(password='testpass123').status_code, 302)
+        self.assertFalse(LoginFailure.objects.filter(key__startswith='user:').exists())
+        self.assertEqual(LoginFailure.objects.get(key__startswith='ip:').count, 1)
+
+    def test_purge_expired_failures(self):
+        """purge_login_failures 명령은 만료된 실패 기록만 지우는지 테스트"""
+        self.login()
+        LoginFailure.objects.create(key='ip:10.0.0.1', count=3, expires_at=timezone.now() - timedelta(seconds=1))
+
+        out = StringIO()
+        call_command('purge_login_failures', '--batch-size', '1', stdout=out)
+
+        self.assertIn('1개', out.getvalue())
+        self.assertEqual(LoginFailure.objects.count(), 2)
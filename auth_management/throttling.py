@@ -0,0 +1,67 @@
+"""로그인 실패 횟수 제한
+
+사용자명과 IP별 실패 횟수를 LoginFailure 테이블에 세고, 한도를 넘으면 비밀번호 해시를
+계산하기 전에 로그인 시도를 거절한다. 실패 횟수는 마지막 실패 후 LOGIN_THROTTLE_WINDOW초가
+지나면 무시되며, 만료된 행은 purge_login_failures 명령으로 지운다.
+"""
+import hashlib
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import LoginFailure
+
+
+def _user_key(username):
+    # 사용자명은 임의의 문자열이므로 해시해서 키로 사용
+    digest = hashlib.md5(username.strip().lower().encode()).hexdigest()
+    return f'user:{digest}'
+
+
+def _ip_key(request):
+    return f'ip:{request.META.get("REMOTE_ADDR", "")}'
+
+
+def _keys(request, username):
+    """키 -> 실패 허용 횟수"""
+    return {
+        _user_key(username): settings.LOGIN_THROTTLE_MAX_FAILURES,
+        _ip_key(request): settings.LOGIN_THROTTLE_IP_MAX_FAILURES,
+    }
+
+
+def is_locked(request, username):
+    """사용자명 또는 IP의 실패 횟수가 한도에 도달했는지 여부"""
+    limits = _keys(request, username)
+    counts = dict(
+        LoginFailure.objects.filter(key__in=limits, expires_at__gt=timezone.now())
+        .values_list('key', 'count')
+    )
+    return any(counts.get(key, 0) >= limit for key, limit in limits.items())
+
+
+def _record(key, now, expires_at):
+    # 증가/재시작은 모두 조건부 UPDATE 한 번이라 동시에 실패한 워커의 횟수가 덮어써지지 않는다
+    failures = LoginFailure.objects.filter(key=key)
+    if failures.filter(expires_at__gt=now).update(count=F('count') + 1, expires_at=expires_at):
+        return
+    if failures.filter(expires_at__lte=now).update(count=1, expires_at=expires_at):
+        return
+    try:
+        with transaction.atomic():
+            LoginFailure.objects.create(key=key, count=1, expires_at=expires_at)
+    except IntegrityError:  # 다른 워커가 먼저 행을 만든 경우
+        failures.update(count=F('count') + 1, expires_at=expires_at)
+
+
+def register_failure(request, username):
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=settings.LOGIN_THROTTLE_WINDOW)
+    for key in _keys(request, username):
+        _record(key, now, expires_at)
+
+
+def reset(username):
+    """로그인에 성공하면 해당 사용자명의 실패 횟수를 지움 (IP 횟수는 유지)"""
+    LoginFailure.objects.filter(key=_user_key(username)).delete()
@@ -1,10 +1,11 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'auth_management'
 
 urlpatterns = [
-    path('', views.home, name='home'),
+    path('', views.home_async if settings.ASYNC_VIEWS else views.home, name='home'),
     path('accounts/login/', views.login_view, name='login'),
     path('accounts/logout/', views.logout_view, name='logout'),
     path('accounts/signup/', views.signup_view, name='signup'),
@@ -1,21 +1,37 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib import messages
 from django.http import HttpResponse
+from artists.utils import aget_user_artist
+from . import throttling
 
 def home(request):
     return render(request, 'gallery/home.html')
 
+async def home_async(request):
+    """home의 비동기 버전 (ASGI 프로필에서 사용)"""
+    # 사용자와 작가 정보를 비동기 ORM으로 미리 조회해 두어 템플릿 렌더링 중 추가 쿼리가 없도록 함
+    request.user = await request.auser()
+    await aget_user_artist(request.user)
+    return await sync_to_async(render)(request, 'gallery/home.html')
+
 def login_view(request):
     if request.method == 'POST':
         username = request.POST['username']
         password = request.POST['password']
+        # 실패가 누적된 사용자명/IP는 비밀번호 해시를 계산하기 전에 거절
+        if throttling.is_locked(request, username):
+            messages.error(request, '로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요.')
+            return render(request, 'registration/login.html', status=429)
         user = authenticate(request, username=username, password=password)
         if user is not None:
+            throttling.reset(username)
             login(request, user)
             return redirect('auth_management:home')
         else:
+            throttling.register_failure(request, username)
             messages.error(request, '사용자명 또는 비밀번호가 잘못되었습니다.')
     return render(request, 'registration/login.html')
 
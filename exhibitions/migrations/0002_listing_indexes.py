@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exhibitions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exhibition',
+            index=models.Index(fields=['-created_at', '-id'], name='exhibition_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exhibitions', '0002_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exhibition',
+            index=models.Index(fields=['updated_at'], name='exhibition_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.3 on 2026-10-18 05:51
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_artwork_count(apps, schema_editor):
+    Exhibition = apps.get_model('exhibitions', 'Exhibition')
+    ExhibitionArtwork = apps.get_model('exhibitions', 'ExhibitionArtwork')
+    counts = (
+        ExhibitionArtwork.objects.filter(exhibition=OuterRef('pk'))
+        .order_by()
+        .values('exhibition')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    Exhibition.objects.update(artwork_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exhibitions', '0003_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exhibition',
+            name='artwork_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(populate_artwork_count, migrations.RunPython.noop),
+    ]
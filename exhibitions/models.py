@@ -1,21 +1,58 @@
 from django.db import models
+from django.db.models import F, Prefetch, Value
+from django.db.models.functions import Greatest
 from artists.models import Artist
 from artworks.models import Artwork
 
+# 전시 목록 카드에 미리 보여줄 작품 수
+PREVIEW_ARTWORK_COUNT = 3
+
+
+class ExhibitionQuerySet(models.QuerySet):
+    def feed(self):
+        """전시 목록용 쿼리셋 (작가 조인, 대표 작품 프리페치)
+
+        전시 수와 관계없이 페이지당 고정된 개수의 쿼리만 실행되도록
+        작가는 JOIN으로, 대표 작품은 전시별로 최대 PREVIEW_ARTWORK_COUNT개만
+        잘라서 한 번에 가져온다. 작품 수는 artwork_count 컬럼을 그대로 읽고,
+        미리 보여주지 않는 나머지 작품 수는 remaining_artwork_count로 함께 계산한다.
+        """
+        preview_artworks = Artwork.objects.order_by('-created_at', '-id')[:PREVIEW_ARTWORK_COUNT]
+        return (
+            self.select_related('artist')
+            .prefetch_related(
+                Prefetch('artworks', queryset=preview_artworks, to_attr='preview_artworks')
+            )
+            .annotate(remaining_artwork_count=Greatest(
+                F('artwork_count') - Value(PREVIEW_ARTWORK_COUNT), Value(0)
+            ))
+            .order_by('-created_at', '-id')
+        )
+
 class Exhibition(models.Model):
     artist = models.ForeignKey(Artist, on_delete=models.CASCADE)
     title = models.CharField(max_length=64)
     start_date = models.DateField()
     end_date = models.DateField()
     artworks = models.ManyToManyField(Artwork, through='ExhibitionArtwork')
+    # 작품 수 (ExhibitionArtwork 추가/삭제 시 exhibitions.signals가 F()로 증감, repair_counters로 재계산)
+    artwork_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ExhibitionQuerySet.as_manager()
+    
     def __str__(self):
         return f"{self.title} - {self.artist.name}"
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # 전시 목록 (최신순)
+            models.Index(fields=['-created_at', '-id'], name='exhibition_created_idx'),
+            # 목록 조건부 응답의 MAX(updated_at)
+            models.Index(fields=['updated_at'], name='exhibition_updated_idx'),
+        ]
 
 class ExhibitionArtwork(models.Model):
     """전시-작품 연결 모델"""
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from opengallery.counters import shift_column
+from .models import Exhibition, ExhibitionArtwork
+
+
+def shift_artwork_count(exhibition_id, delta):
+    shift_column(Exhibition.objects.filter(pk=exhibition_id), 'artwork_count', delta)
+
+
+@receiver(post_save, sender=ExhibitionArtwork)
+def increase_artwork_count(sender, instance, created, **kwargs):
+    if created:
+        shift_artwork_count(instance.exhibition_id, 1)
+
+
+@receiver(post_delete, sender=ExhibitionArtwork)
+def decrease_artwork_count(sender, instance, origin=None, **kwargs):
+    # 전시 자체가 삭제되는 경우에는 갱신할 필요가 없다 (작품 삭제로 인한 연쇄 삭제는 갱신)
+    if isinstance(origin, Exhibition) or getattr(origin, 'model', None) is Exhibition:
+        return
+    shift_artwork_count(instance.exhibition_id, -1)
@@ -2,10 +2,16 @@ from django.test import TestCase, Client
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from datetime import date, timedelta
-from artists.models import Artist
+from unittest import mock
+from artists.models import Artist, ArtistStats
 from artworks.models import Artwork
+from opengallery import counters
 from .models import Exhibition, ExhibitionArtwork
+import io
 
 
 class ExhibitionModelTest(TestCase):
@@ -161,6 +167,156 @@ class ExhibitionViewTest(TestCase):
         
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, '테스트 전시')
+    
+    def _create_exhibition_with_artworks(self, title, artwork_count):
+        exhibition = Exhibition.objects.create(
+            artist=self.artist,
+            title=title,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=30)
+        )
+        for i in range(artwork_count):
+            artwork = Artwork.objects.create(
+                artist=self.artist,
+                title=f'{title} 작품{i}',
+                price=1000000,
+                size_number=10
+            )
+            ExhibitionArtwork.objects.create(exhibition=exhibition, artwork=artwork)
+        return exhibition
+    
+    def test_exhibition_list_preview_artworks(self):
+        """전시 목록 대표 작품 3개 및 나머지 작품 수 표시 테스트"""
+        self._create_exhibition_with_artworks('대형 전시', 5)
+        
+        response = self.client.get(reverse('exhibitions:exhibition_list'))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '5개')
+        self.assertContains(response, '외 2개')
+        exhibition = next(e for e in response.context['page_obj'] if e.title == '대형 전시')
+        self.assertEqual(len(exhibition.preview_artworks), 3)
+    
+    def test_remaining_count_follows_preview_size(self):
+        """나머지 작품 수는 PREVIEW_ARTWORK_COUNT를 기준으로 계산되는지 테스트"""
+        self._create_exhibition_with_artworks('대형 전시', 5)
+        
+        with mock.patch('exhibitions.models.PREVIEW_ARTWORK_COUNT', 2):
+            response = self.client.get(reverse('exhibitions:exhibition_list'))
+        
+        self.assertContains(response, '외 3개')
+        exhibition = next(e for e in response.context['page_obj'] if e.title == '대형 전시')
+        self.assertEqual(len(exhibition.preview_artworks), 2)
+    
+    def test_exhibition_list_query_count_is_constant(self):
+        """전시 수와 관계없이 전시 목록 쿼리 수가 일정한지 테스트"""
+        self._create_exhibition_with_artworks('전시A', 4)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(reverse('exhibitions:exhibition_list'))
+        
+        for i in range(6):
+            self._create_exhibition_with_artworks(f'추가 전시{i}', 4)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(reverse('exhibitions:exhibition_list'))
+        
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+    
+    def test_exhibition_list_pagination(self):
+        """전시 목록 페이지네이션 테스트"""
+        for i in range(11):
+            Exhibition.objects.create(
+                artist=self.artist,
+                title=f'페이지 전시{i}',
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=30)
+            )
+        
+        response = self.client.get(reverse('exhibitions:exhibition_list'))
+        self.assertEqual(len(response.context['page_obj']), 10)
+        
+        response = self.client.get(reverse('exhibitions:exhibition_list'), {'page': 2})
+        self.assertEqual(len(response.context['page_obj']), 2)
+
+
+class CreateExhibitionViewTest(TestCase):
+    """전시 등록 뷰 테스트"""
+    
+    def setUp(self):
+        self.artist_user = User.objects.create_user(username='artist', password='artistpass123')
+        self.artist = Artist.objects.create(
+            user=self.artist_user,
+            name='김작가',
+            gender='남자',
+            birthday=date(1990, 1, 1),
+            email='artist@example.com',
+            phone_number='010-1234-5678'
+        )
+        other_user = User.objects.create_user(username='other', password='otherpass123')
+        self.other_artist = Artist.objects.create(
+            user=other_user,
+            name='이작가',
+            gender='여자',
+            birthday=date(1991, 1, 1),
+            email='other@example.com',
+            phone_number='010-8765-4321'
+        )
+        self.artworks = [
+            Artwork.objects.create(artist=self.artist, title=f'작품{i}', price=1000, size_number=10)
+            for i in range(3)
+        ]
+        self.other_artwork = Artwork.objects.create(
+            artist=self.other_artist, title='남의 작품', price=1000, size_number=10
+        )
+        self.client.login(username='artist', password='artistpass123')
+    
+    def _post(self, artwork_ids):
+        return self.client.post(reverse('exhibitions:create_exhibition'), {
+            'title': '새 전시',
+            'start_date': date.today().isoformat(),
+            'end_date': (date.today() + timedelta(days=30)).isoformat(),
+            'artworks': [str(artwork_id) for artwork_id in artwork_ids],
+        })
+    
+    def test_create_exhibition_links_artworks(self):
+        """선택한 작품들이 전시에 연결되는지 테스트"""
+        response = self._post([artwork.id for artwork in self.artworks])
+        
+        self.assertRedirects(response, reverse('artists:artist_dashboard'))
+        exhibition = Exhibition.objects.get(title='새 전시')
+        self.assertEqual(set(exhibition.artworks.all()), set(self.artworks))
+        self.assertEqual(exhibition.artwork_count, 3)
+    
+    def test_link_query_count_is_constant(self):
+        """선택한 작품 수와 관계없이 전시 등록 쿼리 수가 일정한지 테스트"""
+        with CaptureQueriesContext(connection) as one:
+            self._post([self.artworks[0].id])
+        with CaptureQueriesContext(connection) as three:
+            self._post([artwork.id for artwork in self.artworks])
+        
+        self.assertEqual(len(one.captured_queries), len(three.captured_queries))
+    
+    def test_foreign_artwork_rejected(self):
+        """다른 작가의 작품이 포함되면 전시가 생성되지 않는지 테스트"""
+        response = self._post([self.artworks[0].id, self.other_artwork.id])
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, f'본인의 작품만 전시할 수 있습니다. (작품 번호: {self.other_artwork.id})')
+        self.assertFalse(Exhibition.objects.exists())
+        self.assertFalse(ExhibitionArtwork.objects.exists())
+    
+    def test_missing_artwork_rejected(self):
+        """존재하지 않는 작품 번호가 포함되면 전시가 생성되지 않는지 테스트"""
+        response = self._post([self.artworks[0].id, 999999])
+        
+        self.assertContains(response, '존재하지 않는 작품입니다. (작품 번호: 999999)')
+        self.assertFalse(Exhibition.objects.exists())
+    
+    def test_malformed_artwork_id_rejected(self):
+        """숫자가 아닌 작품 번호 처리 테스트"""
+        response = self._post([self.artworks[0].id, 'abc'])
+        
+        self.assertContains(response, '잘못된 작품 번호가 포함되어 있습니다.')
+        self.assertFalse(Exhibition.objects.exists())
 
 
 class ExhibitionIntegrationTest(TestCase):
@@ -258,3 +414,72 @@ class ExhibitionIntegrationTest(TestCase):
         exhibitions = Exhibition.objects.all()
         self.assertEqual(exhibitions[0], exhibition2)
         self.assertEqual(exhibitions[1], exhibition1)
+
+
+class ArtworkCountTest(TestCase):
+    """전시 작품 수(artwork_count) 컬럼 유지 테스트"""
+    
+    def setUp(self):
+        user = User.objects.create_user(username='counter', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=user,
+            name='카운트작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='counter@example.com',
+            phone_number='010-1234-5678'
+        )
+        self.artworks = [
+            Artwork.objects.create(artist=self.artist, title=f'작품{i}', price=1000, size_number=10)
+            for i in range(3)
+        ]
+        self.exhibition = Exhibition.objects.create(
+            artist=self.artist,
+            title='카운트전시',
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 2, 1)
+        )
+    
+    def test_links_update_exhibition_count(self):
+        """전시-작품 연결이 추가/삭제되면 전시의 작품 수가 바뀌어야 함"""
+        for artwork in self.artworks:
+            ExhibitionArtwork.objects.create(exhibition=self.exhibition, artwork=artwork)
+        self.exhibition.refresh_from_db()
+        self.assertEqual(self.exhibition.artwork_count, 3)
+        
+        ExhibitionArtwork.objects.filter(artwork=self.artworks[0]).delete()
+        self.exhibition.refresh_from_db()
+        self.assertEqual(self.exhibition.artwork_count, 2)
+    
+    def test_artwork_delete_updates_exhibition_count(self):
+        """작품이 삭제되면 연쇄 삭제된 연결만큼 전시의 작품 수가 줄어야 함"""
+        for artwork in self.artworks:
+            ExhibitionArtwork.objects.create(exhibition=self.exhibition, artwork=artwork)
+        
+        self.artworks[1].delete()
+        self.exhibition.refresh_from_db()
+        self.assertEqual(self.exhibition.artwork_count, 2)
+    
+    def test_feed_reads_count_column(self):
+        """전시 목록은 작품 수를 집계하지 않고 컬럼을 읽어야 함"""
+        ExhibitionArtwork.objects.create(exhibition=self.exhibition, artwork=self.artworks[0])
+        with CaptureQueriesContext(connection) as queries:
+            exhibition = Exhibition.objects.feed()[0]
+        self.assertEqual(exhibition.artwork_count, 1)
+        self.assertNotIn('exhibitions_exhibitionartwork', queries[0]['sql'])
+    
+    def test_repair_command(self):
+        """repair_counters 명령은 어긋난 작품 수를 다시 계산해야 함"""
+        ExhibitionArtwork.objects.create(exhibition=self.exhibition, artwork=self.artworks[0])
+        Exhibition.objects.update(artwork_count=10)
+        ArtistStats.objects.all().delete()
+        
+        call_command('repair_counters', stdout=io.StringIO())
+        
+        self.exhibition.refresh_from_db()
+        self.artist.refresh_from_db()
+        self.assertEqual(self.exhibition.artwork_count, 1)
+        self.assertEqual(self.artist.stats.artwork_count, 3)
+        self.assertEqual(
+            counters.recount_column(Exhibition, 'artwork_count', ExhibitionArtwork, 'exhibition'), 0
+        )
@@ -1,9 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = 'exhibitions'
 
 urlpatterns = [
-    path('exhibitions/', views.exhibition_list, name='exhibition_list'),
+    path('exhibitions/', views.exhibition_list_async if settings.ASYNC_VIEWS else views.exhibition_list, name='exhibition_list'),
     path('exhibition/create/', views.create_exhibition, name='create_exhibition'),
 ]
@@ -1,21 +1,56 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, redirect
+from django.template.loader import render_to_string
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db import transaction
 from .models import Exhibition, ExhibitionArtwork
-from artists.models import Artist
+from artists.utils import get_user_artist
+from opengallery import listing_cache
+from opengallery.conditional import alisting_condition, listing_condition
+from opengallery.pagination import aget_numbered_page
 from artworks.models import Artwork
 
-def exhibition_list(request):
-    exhibitions = Exhibition.objects.all().order_by('-created_at')
+EXHIBITIONS_PER_PAGE = 10
+
+def exhibition_paginator():
+    """전시 목록 페이지네이터 (동기/비동기 목록 뷰 공용)"""
+    return Paginator(Exhibition.objects.feed(), EXHIBITIONS_PER_PAGE)
+
+def render_exhibition_listing(request, page_obj):
+    return render_to_string('gallery/partials/exhibition_listing.html', {
+        'page_obj': page_obj
+    }, request=request)
+
+def render_exhibition_page(request, listing_html):
     return render(request, 'gallery/exhibition_list.html', {
-        'exhibitions': exhibitions
+        'listing_html': listing_html
     })
 
+@listing_condition('exhibitions')
+def exhibition_list(request):
+    def render_listing():
+        page_obj = exhibition_paginator().get_page(request.GET.get('page'))
+        return render_exhibition_listing(request, page_obj)
+    
+    listing_html = listing_cache.get_or_render('exhibitions', request, render_listing)
+    return render_exhibition_page(request, listing_html)
+
+@alisting_condition('exhibitions')
+async def exhibition_list_async(request):
+    """exhibition_list의 비동기 버전 (ASGI 프로필에서 사용, 조회만 비동기 ORM으로 바꾼다)"""
+    async def render_listing():
+        page_obj = await aget_numbered_page(exhibition_paginator(), request.GET.get('page'))
+        return await sync_to_async(render_exhibition_listing)(request, page_obj)
+    
+    listing_html = await listing_cache.aget_or_render('exhibitions', request, render_listing)
+    return await sync_to_async(render_exhibition_page)(request, listing_html)
+
 @login_required
 def create_exhibition(request):
-    try:
-        artist = Artist.objects.get(user=request.user)
-    except Artist.DoesNotExist:
+    artist = get_user_artist(request.user)
+    if artist is None:
         messages.error(request, '작가로 등록되지 않은 사용자입니다.')
         return redirect('auth_management:home')
     
@@ -35,21 +70,41 @@ def create_exhibition(request):
             messages.error(request, '최소 하나 이상의 작품을 선택해주세요.')
             return render(request, 'artist/create_exhibition.html', {'artworks': artworks})
         
+        # 선택된 작품 번호를 한 번의 쿼리로 검증 (본인 작품만 전시 가능)
         try:
-            exhibition = Exhibition.objects.create(
-                artist=artist,
-                title=title,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            # 선택된 작품들을 전시에 추가
-            for artwork_id in selected_artworks:
-                artwork = Artwork.objects.get(id=artwork_id, artist=artist)
-                ExhibitionArtwork.objects.create(
-                    exhibition=exhibition,
-                    artwork=artwork
+            artwork_ids = {int(artwork_id) for artwork_id in selected_artworks}
+        except ValueError:
+            messages.error(request, '잘못된 작품 번호가 포함되어 있습니다.')
+            return render(request, 'artist/create_exhibition.html', {'artworks': artworks})
+        
+        owned_ids = set(artworks.filter(id__in=artwork_ids).values_list('id', flat=True))
+        invalid_ids = artwork_ids - owned_ids
+        if invalid_ids:
+            existing_ids = set(Artwork.objects.filter(id__in=invalid_ids).values_list('id', flat=True))
+            foreign_ids = sorted(invalid_ids & existing_ids)
+            missing_ids = sorted(invalid_ids - existing_ids)
+            if foreign_ids:
+                messages.error(request, f'본인의 작품만 전시할 수 있습니다. (작품 번호: {", ".join(map(str, foreign_ids))})')
+            if missing_ids:
+                messages.error(request, f'존재하지 않는 작품입니다. (작품 번호: {", ".join(map(str, missing_ids))})')
+            return render(request, 'artist/create_exhibition.html', {'artworks': artworks})
+        
+        try:
+            with transaction.atomic():
+                exhibition = Exhibition.objects.create(
+                    artist=artist,
+                    title=title,
+                    start_date=start_date,
+                    end_date=end_date,
+                    # bulk_create는 post_save를 보내지 않으므로 작품 수를 직접 저장
+                    artwork_count=len(artwork_ids)
                 )
+                
+                # 선택된 작품들을 한 번에 전시에 추가
+                ExhibitionArtwork.objects.bulk_create([
+                    ExhibitionArtwork(exhibition=exhibition, artwork_id=artwork_id)
+                    for artwork_id in sorted(artwork_ids)
+                ])
             
             messages.success(request, '전시가 성공적으로 등록되었습니다.')
             return redirect('artists:artist_dashboard')
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class OpengalleryConfig(AppConfig):
+    """여러 앱에 걸친 공통 기능 (목록 캐시 무효화 등)"""
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'opengallery'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -3,6 +3,10 @@ ASGI config for opengallery project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+ASGI 프로필로 실행하려면 DJANGO_ASYNC_VIEWS=true로 공개 페이지에 비동기 뷰를 사용한다.
+
+    DJANGO_ASYNC_VIEWS=true uvicorn opengallery.asgi:application --workers 4
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 """
@@ -0,0 +1,529 @@
+"""뷰별 쿼리 수 / 응답 시간 / 메모리 벤치마크
+
+데이터 규모(작품 수)를 바꿔 가며 합성 데이터를 만든 뒤 주요 뷰를 반복 호출해
+쿼리 수, p50/p95 응답 시간, 최대 메모리 사용량을 측정한다.
+데이터가 늘어날 때 쿼리 수가 함께 늘어나는 뷰(N+1 회귀)가 있으면 실패로 판정한다.
+SQLite 동시 쓰기 부하 테스트(run_write_benchmark), WSGI/ASGI 동시 요청 처리량 비교
+(run_async_benchmark), 세션 프로필별 요청당 쿼리 수 비교(run_session_benchmark)도 함께 제공한다.
+
+    python run_tests.py --bench
+    python run_tests.py --bench --bench-sizes 1000,10000 --bench-iterations 5
+    python run_tests.py --bench-writes
+    python run_tests.py --bench-async
+    python run_tests.py --bench-sessions
+"""
+import asyncio
+import importlib
+import itertools
+import os
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, timedelta
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches, reverse
+from artists.models import Artist, ArtistApplication, ArtistStats
+from artworks.models import Artwork
+from exhibitions.models import Exhibition, ExhibitionArtwork
+from opengallery import counters
+from opengallery.db_profile import sqlite_pragmas
+from search import index as search_index
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_ITERATIONS = 10
+# process_applications 한 번에 처리할 신청 수
+APPLICATION_BATCH_SIZE = 50
+BULK_BATCH_SIZE = 2000
+
+_application_batches = itertools.count(1)
+
+
+def seed_dataset(artwork_count, prefix='bench'):
+    """작품 artwork_count개 규모의 합성 데이터 생성 (작가 50작품당 1명, 전시 20작품당 1개)"""
+    artist_count = max(artwork_count // 50, 1)
+    users = User.objects.bulk_create(
+        [User(username=f'{prefix}_artist{i}', password='!') for i in range(artist_count)],
+        batch_size=BULK_BATCH_SIZE,
+    )
+    artists = Artist.objects.bulk_create([
+        Artist(
+            user=user,
+            name=f'작가{i}',
+            gender='남자' if i % 2 else '여자',
+            birthday=date(1980, 1, 1) + timedelta(days=i % 3650),
+            email=f'{prefix}{i}@example.com',
+            phone_number=f'010-{i % 10000:04d}-{(i * 7) % 10000:04d}',
+        )
+        for i, user in enumerate(users)
+    ], batch_size=BULK_BATCH_SIZE)
+    artworks = Artwork.objects.bulk_create([
+        Artwork(
+            artist=artists[i % artist_count],
+            title=f'작품{i}',
+            price=(i % 100 + 1) * 100000,
+            size_number=i % 500 + 1,
+        )
+        for i in range(artwork_count)
+    ], batch_size=BULK_BATCH_SIZE)
+    
+    exhibitions = Exhibition.objects.bulk_create([
+        Exhibition(
+            artist=artists[i % artist_count],
+            title=f'전시{i}',
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 2, 1),
+        )
+        for i in range(max(artwork_count // 20, 1))
+    ], batch_size=BULK_BATCH_SIZE)
+    # 각 전시에 같은 작가의 작품 5개씩 연결
+    by_artist = {}
+    for artwork in artworks:
+        by_artist.setdefault(artwork.artist_id, []).append(artwork)
+    ExhibitionArtwork.objects.bulk_create([
+        ExhibitionArtwork(exhibition=exhibition, artwork=artwork)
+        for exhibition in exhibitions
+        for artwork in by_artist.get(exhibition.artist_id, [])[:5]
+    ], batch_size=BULK_BATCH_SIZE)
+    
+    seed_applications(max(artwork_count // 10, 1), prefix=f'{prefix}_done', status='rejected')
+    
+    # bulk_create는 시그널을 보내지 않으므로 파생 데이터는 직접 갱신
+    ArtistStats.refresh()
+    counters.recount_column(Exhibition, 'artwork_count', ExhibitionArtwork, 'exhibition')
+    counters.reconcile()
+    search_index.rebuild()
+
+
+def seed_applications(count, prefix, status='pending'):
+    users = User.objects.bulk_create(
+        [User(username=f'{prefix}_applicant{i}', password='!') for i in range(count)],
+        batch_size=BULK_BATCH_SIZE,
+    )
+    return ArtistApplication.objects.bulk_create([
+        ArtistApplication(
+            user=user,
+            name=f'신청자{i}',
+            gender='여자',
+            birthday=date(1995, 1, 1),
+            email=f'{prefix}{i}@example.com',
+            phone_number='010-0000-0000',
+            status=status,
+        )
+        for i, user in enumerate(users)
+    ], batch_size=BULK_BATCH_SIZE)
+
+
+def _consume(response):
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+    return response
+
+
+def _view_cases():
+    """(이름, 준비 함수, 요청 함수) 목록. 준비 함수는 측정 시간에서 제외된다."""
+    def prepare_applications():
+        applications = seed_applications(APPLICATION_BATCH_SIZE, prefix=f'bench_batch{next(_application_batches)}')
+        return {'action': 'approve', 'application_ids': [str(a.id) for a in applications]}
+    
+    return [
+        ('artist_list', None, lambda client, _: client.get(reverse('artists:artist_list'))),
+        ('artwork_list', None, lambda client, _: client.get(reverse('artworks:artwork_list'))),
+        ('exhibition_list', None, lambda client, _: client.get(reverse('exhibitions:exhibition_list'))),
+        ('admin_statistics', None, lambda client, _: client.get(reverse('artists:admin_statistics'))),
+        ('download_applications_csv', None,
+         lambda client, _: client.get(reverse('artists:download_applications_csv'))),
+        ('process_applications', prepare_applications,
+         lambda client, data: client.post(reverse('artists:process_applications'), data)),
+    ]
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure_views(iterations=DEFAULT_ITERATIONS):
+    """현재 데이터베이스 상태에서 각 뷰를 측정해 {뷰 이름: 결과} 반환"""
+    admin, _ = User.objects.get_or_create(
+        username='bench_admin', defaults={'is_staff': True, 'is_superuser': True}
+    )
+    client = Client()
+    client.force_login(admin)
+    
+    results = {}
+    for name, prepare, request in _view_cases():
+        timings = []
+        query_counts = []
+        for _ in range(iterations):
+            data = prepare() if prepare else None
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.perf_counter()
+                response = _consume(request(client, data))
+                timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise RuntimeError(f'{name} 응답 코드가 {response.status_code}입니다.')
+            query_counts.append(len(ctx.captured_queries))
+        
+        # 메모리는 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 따로 한 번 측정
+        data = prepare() if prepare else None
+        tracemalloc.start()
+        _consume(request(client, data))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        results[name] = {
+            'queries': max(query_counts),
+            'p50_ms': statistics.median(timings),
+            'p95_ms': _percentile(timings, 95),
+            'peak_kb': peak / 1024,
+        }
+    return results
+
+
+def find_query_growth(results_by_size):
+    """데이터 규모가 커질 때 쿼리 수가 늘어난 뷰 목록 [(뷰, 작은 규모 쿼리 수, 큰 규모 쿼리 수)]"""
+    sizes = sorted(results_by_size)
+    regressions = []
+    for smaller, larger in zip(sizes, sizes[1:]):
+        for name, result in results_by_size[larger].items():
+            before = results_by_size[smaller][name]['queries']
+            if result['queries'] > before:
+                regressions.append((name, smaller, before, larger, result['queries']))
+    return regressions
+
+
+def format_results(size, results):
+    lines = [
+        f'\n[작품 {size:,}개]',
+        f'{"뷰":<28}{"쿼리":>6}{"p50(ms)":>10}{"p95(ms)":>10}{"메모리(KB)":>12}',
+    ]
+    for name, result in results.items():
+        lines.append(
+            f'{name:<28}{result["queries"]:>6}{result["p50_ms"]:>10.1f}'
+            f'{result["p95_ms"]:>10.1f}{result["peak_kb"]:>12.0f}'
+        )
+    return '\n'.join(lines)
+
+
+@contextmanager
+def benchmark_databases():
+    """벤치마크 동안 테스트 데이터베이스를 만들고 끝나면 제거"""
+    from django.test.runner import DiscoverRunner
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    setup_test_environment()
+    old_config = runner.setup_databases()
+    try:
+        yield
+    finally:
+        runner.teardown_databases(old_config)
+        teardown_test_environment()
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, iterations=DEFAULT_ITERATIONS, verbosity=1):
+    """규모별로 테스트 데이터베이스를 비우고 다시 채워 측정한 뒤 쿼리 수가 늘어난 뷰의 수를 반환"""
+    from django.core.management import call_command
+    
+    results_by_size = {}
+    with benchmark_databases():
+        for size in sizes:
+            call_command('flush', interactive=False, verbosity=0)
+            started = time.perf_counter()
+            seed_dataset(size)
+            if verbosity > 1:
+                print(f'작품 {size:,}개 데이터 생성: {time.perf_counter() - started:.1f}초')
+            results_by_size[size] = measure_views(iterations)
+            print(format_results(size, results_by_size[size]))
+    
+    regressions = find_query_growth(results_by_size)
+    print()
+    for name, smaller, before, larger, after in regressions:
+        print(f'쿼리 수 증가: {name} (작품 {smaller:,}개: {before}회 → {larger:,}개: {after}회)')
+    if not regressions:
+        print('데이터 규모와 관계없이 모든 뷰의 쿼리 수가 일정합니다.')
+    return len(regressions)
+
+
+# 동시 쓰기 부하 테스트: 기존 기본 설정과 db_profile의 SQLite 프로필 비교
+WRITE_PROFILES = {
+    # 파이썬 sqlite3 기본값 (timeout 5초, DEFERRED 트랜잭션, 롤백 저널)
+    'default': {
+        'pragmas': ['PRAGMA journal_mode=DELETE', 'PRAGMA synchronous=FULL'],
+        'timeout': 5,
+        'begin': 'DEFERRED',
+    },
+    'tuned': {
+        'pragmas': sqlite_pragmas(),
+        'timeout': 20,
+        'begin': 'IMMEDIATE',
+    },
+}
+DEFAULT_WRITE_THREADS = 8
+DEFAULT_WRITES_PER_THREAD = 200
+
+
+def _write_worker(path, profile, writes, barrier, results):
+    conn = sqlite3.connect(path, timeout=profile['timeout'], isolation_level=None)
+    for pragma in profile['pragmas']:
+        conn.execute(pragma)
+    committed = locked = 0
+    barrier.wait()
+    for i in range(writes):
+        try:
+            conn.execute(f'BEGIN {profile["begin"]}')
+            # create_artwork처럼 읽은 뒤 쓰는 트랜잭션
+            conn.execute('SELECT COUNT(*) FROM write_bench').fetchone()
+            conn.execute('INSERT INTO write_bench (payload) VALUES (?)', (f'row-{i}' * 20,))
+            conn.execute('COMMIT')
+            committed += 1
+        except sqlite3.OperationalError as exc:
+            if 'locked' not in str(exc):
+                raise
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            locked += 1
+    conn.close()
+    results.append((committed, locked))
+
+
+def measure_concurrent_writes(profile, threads=DEFAULT_WRITE_THREADS,
+                              writes_per_thread=DEFAULT_WRITES_PER_THREAD):
+    """임시 DB 파일에 여러 스레드가 동시에 쓰고 커밋 수/잠금 오류 수/초당 커밋 수를 반환"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'write_bench.sqlite3')
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE write_bench (id INTEGER PRIMARY KEY, payload TEXT)')
+        conn.commit()
+        conn.close()
+
+        barrier = threading.Barrier(threads)
+        results = []
+        workers = [
+            threading.Thread(
+                target=_write_worker,
+                args=(path, profile, writes_per_thread, barrier, results),
+            )
+            for _ in range(threads)
+        ]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+    committed = sum(result[0] for result in results)
+    return {
+        'committed': committed,
+        'locked': sum(result[1] for result in results),
+        'elapsed': elapsed,
+        'writes_per_sec': committed / elapsed if elapsed else 0.0,
+    }
+
+
+def run_write_benchmark(threads=DEFAULT_WRITE_THREADS, writes_per_thread=DEFAULT_WRITES_PER_THREAD):
+    """프로필별 동시 쓰기 결과를 출력하고, 튜닝된 프로필에서 발생한 잠금 오류 수를 반환"""
+    print(f'동시 쓰기 부하 테스트 (스레드 {threads}개 × 트랜잭션 {writes_per_thread}개)')
+    print(f'{"프로필":<12}{"커밋":>8}{"잠금오류":>10}{"소요(s)":>10}{"커밋/s":>10}')
+    results = {}
+    for name, profile in WRITE_PROFILES.items():
+        result = results[name] = measure_concurrent_writes(profile, threads, writes_per_thread)
+        print(
+            f'{name:<12}{result["committed"]:>8}{result["locked"]:>10}'
+            f'{result["elapsed"]:>10.2f}{result["writes_per_sec"]:>10.0f}'
+        )
+    return results['tuned']['locked']
+
+
+
+# WSGI(동기 뷰) / ASGI(비동기 뷰) 동시 요청 처리량 비교
+URLCONF_MODULES = (
+    'auth_management.urls',
+    'artists.urls',
+    'artworks.urls',
+    'exhibitions.urls',
+    'opengallery.urls',
+)
+THROUGHPUT_URLS = (
+    ('auth_management:home', {}),
+    ('artists:artist_list', {}),
+    ('artworks:artwork_list', {}),
+    ('exhibitions:exhibition_list', {}),
+)
+DEFAULT_CONCURRENCY = 16
+DEFAULT_THROUGHPUT_REQUESTS = 400
+
+
+def _reload_urlconfs():
+    # 앱 URLconf가 settings.ASYNC_VIEWS를 임포트 시점에 읽으므로 다시 임포트한다
+    for name in URLCONF_MODULES:
+        importlib.reload(importlib.import_module(name))
+    clear_url_caches()
+
+
+@contextmanager
+def async_views(enabled=True):
+    """ASYNC_VIEWS 설정을 바꾸고 URLconf를 다시 불러와 동기/비동기 뷰를 전환"""
+    try:
+        with override_settings(ASYNC_VIEWS=enabled):
+            _reload_urlconfs()
+            yield
+    finally:
+        _reload_urlconfs()
+
+
+def _throughput_urls():
+    return [reverse(name, kwargs=kwargs) for name, kwargs in THROUGHPUT_URLS]
+
+
+def measure_wsgi_throughput(concurrency=DEFAULT_CONCURRENCY, total=DEFAULT_THROUGHPUT_REQUESTS):
+    """스레드 concurrency개로 동기 뷰에 요청을 보내 초당 처리 요청 수를 반환"""
+    urls = _throughput_urls()
+    
+    def request(i):
+        return Client().get(urls[i % len(urls)]).status_code
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        statuses = list(executor.map(request, range(total)))
+    elapsed = time.perf_counter() - started
+    return {'requests': total, 'errors': sum(status != 200 for status in statuses),
+            'elapsed': elapsed, 'rps': total / elapsed}
+
+
+def measure_asgi_throughput(concurrency=DEFAULT_CONCURRENCY, total=DEFAULT_THROUGHPUT_REQUESTS):
+    """이벤트 루프 하나에서 동시에 concurrency개씩 비동기 뷰에 요청을 보내 초당 처리 요청 수를 반환"""
+    with async_views():
+        urls = _throughput_urls()
+        
+        async def run():
+            semaphore = asyncio.Semaphore(concurrency)
+            client = AsyncClient()
+            
+            async def request(i):
+                async with semaphore:
+                    response = await client.get(urls[i % len(urls)])
+                    return response.status_code
+            
+            return await asyncio.gather(*(request(i) for i in range(total)))
+        
+        started = time.perf_counter()
+        statuses = asyncio.run(run())
+        elapsed = time.perf_counter() - started
+    return {'requests': total, 'errors': sum(status != 200 for status in statuses),
+            'elapsed': elapsed, 'rps': total / elapsed}
+
+
+def run_async_benchmark(artwork_count=1000, concurrency=DEFAULT_CONCURRENCY,
+                        total=DEFAULT_THROUGHPUT_REQUESTS):
+    """WSGI/ASGI 경로의 동시 요청 처리량을 출력하고 오류 응답 수를 반환"""
+    with benchmark_databases():
+        seed_dataset(artwork_count)
+        print(f'동시 요청 처리량 (작품 {artwork_count:,}개, 동시 {concurrency}개, 요청 {total}개)')
+        print(f'{"경로":<10}{"요청":>8}{"오류":>8}{"소요(s)":>10}{"요청/s":>10}')
+        results = {
+            'WSGI': measure_wsgi_throughput(concurrency, total),
+            'ASGI': measure_asgi_throughput(concurrency, total),
+        }
+    for name, result in results.items():
+        print(
+            f'{name:<10}{result["requests"]:>8}{result["errors"]:>8}'
+            f'{result["elapsed"]:>10.2f}{result["rps"]:>10.0f}'
+        )
+    return sum(result['errors'] for result in results.values())
+
+
+# 세션/메시지 저장소 프로필별 요청당 쿼리 수 비교
+SESSION_PROFILES = {
+    'db': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.db',
+        'MESSAGE_STORAGE': 'django.contrib.messages.storage.fallback.FallbackStorage',
+    },
+    'cached_db': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.cached_db',
+        'MESSAGE_STORAGE': 'django.contrib.messages.storage.fallback.FallbackStorage',
+    },
+    'signed_cookies': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.signed_cookies',
+        'MESSAGE_STORAGE': 'django.contrib.messages.storage.cookie.CookieStorage',
+    },
+}
+SESSION_BENCHMARK_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'session-benchmark',
+    }
+}
+
+
+def _session_cases(artist_user, admin):
+    """(이름, 로그인 사용자, 요청 함수) 목록"""
+    artwork = {'title': '세션 벤치마크', 'price': '100,000', 'size_number': '10'}
+    return [
+        ('artist_dashboard', artist_user,
+         lambda client: client.get(reverse('artists:artist_dashboard'))),
+        ('admin_applications', admin,
+         lambda client: client.get(reverse('artists:admin_applications'))),
+        # 메시지를 남기고 리다이렉트된 페이지에서 읽는 POST (요청 두 번의 합계)
+        ('create_artwork+redirect', artist_user,
+         lambda client: client.post(reverse('artworks:create_artwork'), artwork, follow=True)),
+    ]
+
+
+def measure_session_queries(profile, iterations=DEFAULT_ITERATIONS):
+    """프로필별 {요청 이름: {'queries': 전체 쿼리 수, 'session_queries': 세션 테이블 쿼리 수}}"""
+    artist_user = Artist.objects.select_related('user').order_by('pk').first().user
+    admin, _ = User.objects.get_or_create(
+        username='bench_admin', defaults={'is_staff': True, 'is_superuser': True}
+    )
+    
+    results = {}
+    with override_settings(CACHES=SESSION_BENCHMARK_CACHES, **SESSION_PROFILES[profile]):
+        for name, user, request in _session_cases(artist_user, admin):
+            client = Client()
+            client.force_login(user)
+            request(client)  # 세션 캐시 채우기
+            queries = []
+            session_queries = []
+            for _ in range(iterations):
+                with CaptureQueriesContext(connection) as ctx:
+                    response = _consume(request(client))
+                if response.status_code != 200:
+                    raise RuntimeError(f'{name} 응답 코드가 {response.status_code}입니다.')
+                queries.append(len(ctx.captured_queries))
+                session_queries.append(
+                    sum('django_session' in query['sql'] for query in ctx.captured_queries)
+                )
+            results[name] = {'queries': max(queries), 'session_queries': max(session_queries)}
+    return results
+
+
+def run_session_benchmark(artwork_count=1000, iterations=DEFAULT_ITERATIONS):
+    """세션 프로필별 요청당 쿼리 수를 출력하고, db 프로필보다 쿼리가 늘어난 경우의 수를 반환"""
+    with benchmark_databases():
+        seed_dataset(artwork_count)
+        results = {profile: measure_session_queries(profile, iterations) for profile in SESSION_PROFILES}
+    
+    print('세션 프로필별 요청당 쿼리 수 (전체 / 세션 테이블)')
+    print(f'{"요청":<26}' + ''.join(f'{profile:>18}' for profile in SESSION_PROFILES))
+    for name in results['db']:
+        cells = [
+            f'{results[profile][name]["queries"]} / {results[profile][name]["session_queries"]}'
+            for profile in SESSION_PROFILES
+        ]
+        print(f'{name:<26}' + ''.join(f'{cell:>18}' for cell in cells))
+    return sum(
+        results[profile][name]['queries'] > results['db'][name]['queries']
+        for profile in SESSION_PROFILES for name in results['db']
+    )
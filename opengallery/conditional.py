@@ -0,0 +1,103 @@
+"""공개 목록 페이지의 조건부 GET (ETag / Last-Modified) 지원
+
+목록이 보여주는 모델들의 MAX(updated_at)과 세대 토큰으로 검증값을 만들어, 내용이 바뀌지
+않았으면 뷰 본문(쿼리, 템플릿 렌더링)을 실행하지 않고 304 Not Modified를 반환한다.
+
+- MAX(updated_at)은 삭제를 반영하지 못하므로 Last-Modified에는 세대 토큰의 발급 시각(삭제 시에도
+  교체됨)을 함께 반영하고, ETag에는 세대 토큰을 포함한다. Last-Modified는 초 단위이므로 같은 초
+  안의 변경은 ETag로만 구분된다.
+- 페이지 상단 내비게이션이 로그인 사용자마다 다르므로 ETag에 사용자를 포함하고,
+  Last-Modified는 사용자 구분이 불가능하므로 비로그인 요청에만 보낸다.
+- 표시할 메시지가 남아 있는 요청은 캐시된 페이지로 대체하면 메시지가 사라지므로 검증값을 만들지 않는다.
+"""
+import hashlib
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views.decorators.http import condition
+from . import generations
+from .listing_cache import LISTING_MODELS, LISTING_PARAMS
+
+
+def last_modified(listing):
+    """목록 관련 모델들의 MAX(updated_at)과 세대 발급 시각 중 가장 늦은 시각
+
+    세대가 바뀌기 전까지는 캐시된 값을 사용한다.
+    """
+    key = generations.versioned_key(f'last-modified:{listing}', LISTING_MODELS[listing])
+    value = cache.get(key)
+    if value is None:
+        timestamps = [
+            apps.get_model(label).objects.aggregate(latest=Max('updated_at'))['latest']
+            for label in LISTING_MODELS[listing]
+        ]
+        timestamps.append(generations.changed_at(*LISTING_MODELS[listing]))
+        timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+        # 데이터가 하나도 없으면 False를 저장해 매번 다시 집계하지 않도록 함
+        value = max(timestamps) if timestamps else False
+        cache.set(key, value, None)
+    return value or None
+
+
+def _validators(listing, request):
+    # etag_func와 last_modified_func가 같은 값을 두 번 계산하지 않도록 요청에 저장
+    cached = getattr(request, '_listing_validators', None)
+    if cached is not None:
+        return cached
+
+    if len(get_messages(request)):
+        validators = (None, None)
+    else:
+        modified = last_modified(listing)
+        params = '&'.join(
+            f'{name}={request.GET.get(name, "")}' for name in LISTING_PARAMS[listing]
+        )
+        user = request.user.pk if request.user.is_authenticated else 'anon'
+        etag = hashlib.md5(
+            generations.versioned_key(listing, LISTING_MODELS[listing], user, params, modified).encode()
+        ).hexdigest()
+        validators = (etag, None if request.user.is_authenticated else modified)
+
+    request._listing_validators = validators
+    return validators
+
+
+def listing_condition(listing):
+    """목록 뷰에 ETag/Last-Modified 조건부 응답을 적용하는 데코레이터"""
+    return condition(
+        etag_func=lambda request, *args, **kwargs: _validators(listing, request)[0],
+        last_modified_func=lambda request, *args, **kwargs: _validators(listing, request)[1],
+    )
+
+
+def alisting_condition(listing):
+    """비동기 목록 뷰용 listing_condition
+
+    condition()은 비동기 뷰에서도 검증값 함수를 이벤트 루프에서 직접 호출하므로
+    (DB/세션 접근 불가) 검증값 계산만 스레드로 넘기고 304 판단은 같은 방식으로 처리한다.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        async def inner(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return await view_func(request, *args, **kwargs)
+            
+            etag, modified = await sync_to_async(_validators)(listing, request)
+            etag = f'"{etag}"' if etag else None
+            modified = int(modified.timestamp()) if modified else None
+            response = get_conditional_response(request, etag=etag, last_modified=modified)
+            if response is None:
+                response = await view_func(request, *args, **kwargs)
+            
+            if modified and not response.has_header('Last-Modified'):
+                response.headers['Last-Modified'] = http_date(modified)
+            if etag:
+                response.headers.setdefault('ETag', etag)
+            return response
+        return inner
+    return decorator
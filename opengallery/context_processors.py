@@ -1,13 +1,10 @@
-from artists.models import Artist
+from django.utils.functional import SimpleLazyObject
+from artists.utils import get_user_artist
 
 def user_extras(request):
     """사용자 관련 추가 정보를 템플릿에 제공"""
-    context = {}
-    if request.user.is_authenticated:
-        try:
-            context['user_artist'] = Artist.objects.get(user=request.user)
-        except Artist.DoesNotExist:
-            context['user_artist'] = None
-    else:
-        context['user_artist'] = None
-    return context
+    # CurrentArtistMiddleware가 붙여 둔 지연 객체를 재사용 (실제 사용 시 한 번만 조회)
+    user_artist = getattr(request, 'artist', None)
+    if user_artist is None:
+        user_artist = SimpleLazyObject(lambda: get_user_artist(request.user))
+    return {'user_artist': user_artist}
@@ -0,0 +1,90 @@
+"""전체 합계 카운터 (작가 수, 작품 수, 대기중인 신청 수)
+
+SQLite의 COUNT(*)는 테이블 전체를 스캔하므로 관리자 대시보드가 방문마다 세 번의 전체
+스캔을 하지 않도록 합계를 Counter 테이블에 저장해 둔다.
+
+- 생성/삭제/상태 변경 시그널(opengallery.signals)과 bulk_create/update() 경로에서
+  shift()로 증감한다. 원본 변경과 같은 트랜잭션에서 실행되므로 롤백되면 함께 취소된다.
+- 행이 없는 카운터는 조회 시 원본 테이블에서 계산해 만든다.
+- 어긋난 값은 reconcile() (repair_counters 명령)로 원본 테이블에서 다시 계산한다.
+
+shift_column()/recount_column()은 다른 모델에 비정규화해 둔 개수 컬럼
+(예: Exhibition.artwork_count)에도 같은 방식으로 쓰인다.
+"""
+from django.apps import apps
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from .models import Counter
+
+# 카운터 이름 -> (모델, 원본 조건)
+COUNTERS = {
+    'artists': ('artists.Artist', {}),
+    'artworks': ('artworks.Artwork', {}),
+    'pending_applications': ('artists.ArtistApplication', {'status': 'pending'}),
+}
+
+
+def shift_column(queryset, field, delta):
+    """쿼리셋 행들의 개수 컬럼을 F()로 증감 (음수가 되는 감소는 무시)"""
+    if delta < 0:
+        queryset = queryset.filter(**{f'{field}__gte': -delta})
+    return queryset.update(**{field: F(field) + delta})
+
+
+def recount_column(model, field, related_model, related_field, pks=None):
+    """model.field를 related_model에서 related_field별로 다시 세어 값이 다른 행만 갱신하고 갱신된 수를 반환"""
+    counts = Coalesce(Subquery(
+        related_model.objects.filter(**{related_field: OuterRef('pk')})
+        .order_by()
+        .values(related_field)
+        .annotate(count=Count('pk'))
+        .values('count')
+    ), 0)
+    rows = model.objects.alias(actual=counts).exclude(**{field: F('actual')})
+    if pks is not None:
+        rows = rows.filter(pk__in=pks)
+    return rows.update(**{field: counts})
+
+
+def _check(name):
+    if name not in COUNTERS:
+        raise ValueError(f'알 수 없는 카운터입니다: {name}')
+
+
+def count(name):
+    """원본 테이블에서 카운터 값을 계산 (COUNT(*))"""
+    _check(name)
+    label, filters = COUNTERS[name]
+    return apps.get_model(label).objects.filter(**filters).count()
+
+
+def shift(name, delta):
+    """카운터를 F()로 증감 (음수가 되는 감소는 무시, 행이 없으면 다음 조회 때 계산된다)"""
+    _check(name)
+    if not delta:
+        return
+    shift_column(Counter.objects.filter(name=name), 'value', delta)
+
+
+def get_counts(*names):
+    """카운터 값을 {name: value} 형태로 반환 (이름이 없으면 전체, 쿼리 한 번)"""
+    names = names or tuple(COUNTERS)
+    for name in names:
+        _check(name)
+    values = dict(Counter.objects.filter(name__in=names).values_list('name', 'value'))
+    for name in names:
+        if name not in values:
+            values[name] = Counter.objects.get_or_create(name=name, defaults={'value': count(name)})[0].value
+    return values
+
+
+def reconcile():
+    """모든 카운터를 원본 테이블에서 다시 계산해 저장하고 값이 바뀐 카운터 수를 반환"""
+    stored = dict(Counter.objects.values_list('name', 'value'))
+    changed = 0
+    for name in COUNTERS:
+        value = count(name)
+        if stored.get(name) != value:
+            Counter.objects.update_or_create(name=name, defaults={'value': value})
+            changed += 1
+    return changed
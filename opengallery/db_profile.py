@@ -0,0 +1,90 @@
+"""환경 변수 기반 데이터베이스 설정
+
+DB_ENGINE=sqlite(기본값) 이면 SQLite를 WAL 모드와 잠금 대기 시간, mmap 등을 적용해 사용하고,
+DB_ENGINE=postgresql 이면 PostgreSQL을 지속 연결(CONN_MAX_AGE) 또는 커넥션 풀로 사용한다.
+
+    DB_ENGINE=sqlite  SQLITE_JOURNAL_MODE=WAL  SQLITE_SYNCHRONOUS=NORMAL
+    SQLITE_BUSY_TIMEOUT=20  SQLITE_MMAP_SIZE=268435456
+
+    DB_ENGINE=postgresql  DB_NAME=opengallery  DB_USER=...  DB_PASSWORD=...
+    DB_HOST=localhost  DB_PORT=5432  DB_CONN_MAX_AGE=60  DB_POOL=true  DB_POOL_MAX_SIZE=10
+"""
+from decouple import config
+from django.core.exceptions import ImproperlyConfigured
+
+SQLITE_JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SQLITE_SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
+def sqlite_pragmas(journal_mode='WAL', synchronous='NORMAL', busy_timeout=20, mmap_size=268435456):
+    """연결마다 실행할 PRAGMA 목록 (busy_timeout은 초 단위)"""
+    journal_mode = journal_mode.upper()
+    synchronous = synchronous.upper()
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ImproperlyConfigured(f'지원하지 않는 SQLite journal_mode입니다: {journal_mode}')
+    if synchronous not in SQLITE_SYNCHRONOUS_MODES:
+        raise ImproperlyConfigured(f'지원하지 않는 SQLite synchronous 값입니다: {synchronous}')
+
+    return [
+        f'PRAGMA journal_mode={journal_mode}',
+        f'PRAGMA synchronous={synchronous}',
+        f'PRAGMA busy_timeout={int(busy_timeout * 1000)}',
+        f'PRAGMA mmap_size={int(mmap_size)}',
+    ]
+
+
+def sqlite_database(name):
+    busy_timeout = config('SQLITE_BUSY_TIMEOUT', default=20, cast=float)
+    pragmas = sqlite_pragmas(
+        journal_mode=config('SQLITE_JOURNAL_MODE', default='WAL'),
+        synchronous=config('SQLITE_SYNCHRONOUS', default='NORMAL'),
+        busy_timeout=busy_timeout,
+        mmap_size=config('SQLITE_MMAP_SIZE', default=268435456, cast=int),
+    )
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': config('DB_NAME', default=str(name)),
+        'OPTIONS': {
+            # 연결 생성 직후 실행 (journal_mode=WAL은 DB 파일에 저장되지만 나머지는 연결마다 필요)
+            'init_command': ';'.join(pragmas),
+            'timeout': busy_timeout,
+            # 읽기 후 쓰기로 잠금을 올리는 시점에는 busy_timeout이 적용되지 않아 바로
+            # "database is locked"가 나므로, 트랜잭션 시작 시점에 쓰기 잠금을 잡는다
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+
+
+def postgresql_database():
+    database = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': config('DB_NAME', default='opengallery'),
+        'USER': config('DB_USER', default='opengallery'),
+        'PASSWORD': config('DB_PASSWORD', default=''),
+        'HOST': config('DB_HOST', default='localhost'),
+        'PORT': config('DB_PORT', default='5432'),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': config('DB_CONNECT_TIMEOUT', default=5, cast=int),
+        },
+    }
+    if config('DB_POOL', default=False, cast=bool):
+        # psycopg 3 커넥션 풀 (Django 5.1+). 풀을 쓰면 CONN_MAX_AGE는 0이어야 한다
+        database['CONN_MAX_AGE'] = 0
+        database['OPTIONS']['pool'] = {
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=int),
+        }
+    else:
+        database['CONN_MAX_AGE'] = config('DB_CONN_MAX_AGE', default=60, cast=int)
+    return database
+
+
+def database_from_env(default_sqlite_name):
+    engine = config('DB_ENGINE', default='sqlite').lower()
+    if engine in ('postgres', 'postgresql'):
+        return postgresql_database()
+    if engine in ('sqlite', 'sqlite3'):
+        return sqlite_database(default_sqlite_name)
+    raise ImproperlyConfigured(f'지원하지 않는 DB_ENGINE입니다: {engine}')
@@ -0,0 +1,122 @@
+"""모델별 세대(generation) 토큰과 쿼리셋 결과 캐시
+
+모델 데이터가 바뀔 때마다 해당 모델의 세대 토큰을 새로 발급하고, 캐시 키에 관련 모델의
+세대를 포함시킨다. 이전 세대의 키는 더 이상 조회되지 않으므로 키를 찾아 지울 필요 없이
+토큰 하나만 바꾸면 무효화가 끝난다 (O(1)).
+
+토큰은 발급 시각과 임의 값으로 이루어지며 (changed_at()으로 발급 시각을 읽는다),
+GENERATION_CACHE_ALIAS 캐시에 저장된다. 이 캐시는 여러 워커 프로세스가 함께
+보는 저장소(파일 기반 캐시 등)여야 한 프로세스에서의 무효화가 모든 워커에 반영된다.
+"""
+import hashlib
+import time
+import uuid
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+
+# 세대 토큰을 관리하는 모델 (app_label.ModelName)
+TRACKED_MODELS = (
+    'artists.Artist',
+    'artists.ArtistApplication',
+    'artworks.Artwork',
+    'exhibitions.Exhibition',
+)
+
+
+def _cache():
+    return caches[getattr(settings, 'GENERATION_CACHE_ALIAS', 'default')]
+
+
+def _label(model):
+    if isinstance(model, str):
+        label = model
+    else:
+        label = model._meta.label
+    if label not in TRACKED_MODELS:
+        raise ValueError(f'세대 토큰을 관리하지 않는 모델입니다: {label}')
+    return label
+
+
+def _generation_key(label):
+    return f'generation:{label}'
+
+
+def get_generations(*models):
+    """모델별 현재 세대 토큰을 {label: token} 형태로 반환 (없는 토큰은 새로 발급)"""
+    labels = [_label(model) for model in models]
+    keys = {_generation_key(label): label for label in labels}
+    stored = _cache().get_many(list(keys))
+
+    generations = {}
+    for key, label in keys.items():
+        token = stored.get(key)
+        if token is None:
+            token = bump(label)
+        generations[label] = token
+    return generations
+
+
+def bump(model):
+    """모델의 세대 토큰을 새 값으로 교체하고 반환"""
+    label = _label(model)
+    # incr는 키가 만료되거나 캐시가 비워지면 이전 값과 같은 숫자를 다시 만들 수 있으므로 매번 고유한 토큰을 발급
+    token = f'{time.time():.6f}-{uuid.uuid4().hex}'
+    _cache().set(_generation_key(label), token, None)
+    return token
+
+
+def changed_at(*models):
+    """모델들의 현재 세대 토큰 중 가장 늦은 발급 시각 (삭제처럼 updated_at에 남지 않는 변경도 반영)"""
+    timestamps = []
+    for token in get_generations(*models).values():
+        try:
+            timestamps.append(float(token.split('-', 1)[0]))
+        except ValueError:  # 발급 시각이 없는 이전 형식의 토큰
+            continue
+    if not timestamps:
+        return None
+    return datetime.fromtimestamp(max(timestamps), tz=timezone.utc)
+
+
+def bump_on_commit(model):
+    """트랜잭션 커밋 후 세대 토큰을 교체 (커밋 전 데이터로 캐시가 다시 채워지는 것을 방지)"""
+    label = _label(model)
+    transaction.on_commit(lambda: bump(label))
+
+
+def versioned_key(prefix, models, *parts):
+    """관련 모델의 세대와 부가 정보(parts)를 포함한 캐시 키 생성"""
+    generations = get_generations(*models)
+    versions = ':'.join(generations[label] for label in sorted(generations))
+    digest = hashlib.md5(
+        '|'.join(str(part) for part in parts).encode()
+    ).hexdigest()
+    return f'{prefix}:{hashlib.md5(versions.encode()).hexdigest()}:{digest}'
+
+
+def cached_queryset(queryset, models=None, key=None, timeout=None):
+    """쿼리셋 결과를 리스트로 캐시하고 반환
+
+    models를 생략하면 쿼리셋의 모델만 세대에 포함된다. select_related 등으로 다른 모델을
+    함께 읽는다면 그 모델도 models에 넣어야 해당 모델 변경 시 캐시가 무효화된다.
+    key를 생략하면 쿼리셋의 SQL과 파라미터로 키를 만든다. str(queryset.query)는 파라미터를
+    따옴표/타입 없이 끼워 넣어 서로 다른 쿼리가 같은 문자열이 될 수 있으므로
+    (name__in=['a, b']와 name__in=['a', 'b']) 파라미터를 repr로 구분한다.
+    """
+    if models is None:
+        models = (queryset.model,)
+    if key is None:
+        sql, params = queryset.query.sql_with_params()
+        key = repr((queryset.db, sql, params))
+    if timeout is None:
+        timeout = getattr(settings, 'QUERYSET_CACHE_TIMEOUT', 300)
+
+    cache_key = versioned_key('queryset', models, key)
+    results = cache.get(cache_key)
+    if results is None:
+        # 전달받은 쿼리셋의 결과 캐시를 재사용하지 않도록 복제본으로 조회
+        results = list(queryset.all())
+        cache.set(cache_key, results, timeout)
+    return results
@@ -0,0 +1,63 @@
+"""환경 변수 기반 비밀번호 해시 설정
+
+PASSWORD_HASHER_PROFILE로 새 비밀번호(와 로그인 시 재해시)에 쓸 해시 알고리즘을 고르고,
+알고리즘별 비용 파라미터를 환경 변수로 조정한다. 선택되지 않은 알고리즘도 목록에 남겨 두므로
+기존 해시는 그대로 확인되고, 로그인에 성공하면 Django가 선택된 알고리즘/파라미터로 다시 저장한다.
+
+    PASSWORD_HASHER_PROFILE=auto  (argon2-cffi가 있으면 argon2, 없으면 scrypt)
+    ARGON2_TIME_COST=2  ARGON2_MEMORY_COST=102400  ARGON2_PARALLELISM=8
+    SCRYPT_WORK_FACTOR=16384  SCRYPT_BLOCK_SIZE=8  SCRYPT_PARALLELISM=1
+    PBKDF2_ITERATIONS=1000000
+"""
+import importlib.util
+from decouple import config
+from django.core.exceptions import ImproperlyConfigured
+
+PASSWORD_HASHER_PROFILES = {
+    'argon2': 'auth_management.hashers.TunedArgon2PasswordHasher',
+    'scrypt': 'auth_management.hashers.TunedScryptPasswordHasher',
+    'pbkdf2': 'auth_management.hashers.TunedPBKDF2PasswordHasher',
+}
+# 예전 해시 확인용으로만 남겨 두는 해시
+LEGACY_PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+
+def argon2_available():
+    return importlib.util.find_spec('argon2') is not None
+
+
+def password_hashers(profile='auto'):
+    """선택한 프로필의 해시를 맨 앞에 둔 PASSWORD_HASHERS 목록"""
+    profile = profile.lower()
+    if profile == 'auto':
+        profile = 'argon2' if argon2_available() else 'scrypt'
+    if profile not in PASSWORD_HASHER_PROFILES:
+        raise ImproperlyConfigured(f'지원하지 않는 PASSWORD_HASHER_PROFILE입니다: {profile}')
+    if profile == 'argon2' and not argon2_available():
+        raise ImproperlyConfigured('argon2 프로필을 사용하려면 argon2-cffi를 설치해야 합니다.')
+
+    preferred = PASSWORD_HASHER_PROFILES[profile]
+    others = [path for path in PASSWORD_HASHER_PROFILES.values() if path != preferred]
+    return [preferred, *others, *LEGACY_PASSWORD_HASHERS]
+
+
+def password_hasher_params():
+    """auth_management.hashers의 해시들이 읽는 비용 파라미터"""
+    params = {
+        'ARGON2_TIME_COST': config('ARGON2_TIME_COST', default=2, cast=int),
+        'ARGON2_MEMORY_COST': config('ARGON2_MEMORY_COST', default=102400, cast=int),
+        'ARGON2_PARALLELISM': config('ARGON2_PARALLELISM', default=8, cast=int),
+        'SCRYPT_WORK_FACTOR': config('SCRYPT_WORK_FACTOR', default=2**14, cast=int),
+        'SCRYPT_BLOCK_SIZE': config('SCRYPT_BLOCK_SIZE', default=8, cast=int),
+        'SCRYPT_PARALLELISM': config('SCRYPT_PARALLELISM', default=1, cast=int),
+        'PBKDF2_ITERATIONS': config('PBKDF2_ITERATIONS', default=1_000_000, cast=int),
+    }
+    work_factor = params['SCRYPT_WORK_FACTOR']
+    if work_factor < 2 or work_factor & (work_factor - 1):
+        raise ImproperlyConfigured('SCRYPT_WORK_FACTOR는 2의 거듭제곱이어야 합니다.')
+    invalid = [name for name, value in params.items() if value < 1]
+    if invalid:
+        raise ImproperlyConfigured(f'비밀번호 해시 파라미터는 1 이상이어야 합니다: {", ".join(invalid)}')
+    return params
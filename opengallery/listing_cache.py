@@ -0,0 +1,64 @@
+"""공개 목록 페이지(작가/작품/전시) 렌더링 결과 캐시
+
+목록 본문(카드 + 페이지네이션)을 검색어, 커서/페이지, 로그인 여부별로 캐시한다.
+캐시 키에 목록이 보여주는 모델들의 세대 토큰을 포함시켜, 관련 모델이 바뀌면
+이전 캐시 전체가 한 번에 무효화된다 (opengallery.generations 참고).
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.safestring import mark_safe
+from . import generations
+
+# 목록별 캐시 키에 포함할 GET 파라미터
+LISTING_PARAMS = {
+    'artists': ('search', 'cursor'),
+    'artworks': ('search', 'cursor'),
+    'exhibitions': ('page',),
+    'artwork_feed': ('search', 'cursor'),
+}
+
+# 목록별로 화면에 나타나는 모델 (이 모델들의 세대가 바뀌면 캐시 무효화)
+LISTING_MODELS = {
+    'artists': ('artists.Artist',),
+    'artworks': ('artworks.Artwork', 'artists.Artist'),
+    'exhibitions': ('exhibitions.Exhibition', 'artworks.Artwork', 'artists.Artist'),
+    'artwork_feed': ('artworks.Artwork', 'artists.Artist'),
+}
+
+# 요청 컨텍스트 없이 렌더링해 로그인 여부와 관계없이 같은 내용인 목록 (사용자/세션을 조회하지 않음)
+SHARED_LISTINGS = ('artwork_feed',)
+
+
+def cache_key(listing, request):
+    params = '&'.join(
+        f'{name}={request.GET.get(name, "")}' for name in LISTING_PARAMS[listing]
+    )
+    if listing in SHARED_LISTINGS:
+        variant = 'shared'
+    else:
+        variant = 'auth' if request.user.is_authenticated else 'anon'
+    return generations.versioned_key(
+        f'listing:{listing}', LISTING_MODELS[listing], variant, params
+    )
+
+
+def get_or_render(listing, request, render_func):
+    """캐시된 목록 본문 HTML을 반환하고, 없으면 render_func()로 렌더링해 저장"""
+    key = cache_key(listing, request)
+    html = cache.get(key)
+    if html is None:
+        html = render_func()
+        cache.set(key, str(html), getattr(settings, 'LISTING_CACHE_TIMEOUT', 300))
+    return mark_safe(html)
+
+
+async def aget_or_render(listing, request, render_func):
+    """get_or_render의 비동기 버전 (render_func는 코루틴 함수)"""
+    # 캐시 키 계산은 세션/사용자 조회를 포함하므로 스레드에서 실행
+    key = await sync_to_async(cache_key)(listing, request)
+    html = await cache.aget(key)
+    if html is None:
+        html = await render_func()
+        await cache.aset(key, str(html), getattr(settings, 'LISTING_CACHE_TIMEOUT', 300))
+    return mark_safe(html)
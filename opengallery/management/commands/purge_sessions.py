@@ -0,0 +1,43 @@
+from importlib import import_module
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        '만료된 세션을 나누어 삭제합니다. 한 번에 삭제하는 행 수를 제한해 '
+        '큰 세션 테이블에서도 쓰기 잠금을 오래 잡지 않습니다.'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help=f'한 번에 삭제할 세션 수 (기본값: {DEFAULT_BATCH_SIZE})',
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다.')
+        
+        store = import_module(settings.SESSION_ENGINE).SessionStore
+        if not hasattr(store, 'get_model_class'):
+            # signed_cookies/cache 세션은 만료 시 저절로 사라지므로 지울 행이 없음
+            self.stdout.write(f'{settings.SESSION_ENGINE} 세션은 데이터베이스에 저장되지 않아 정리할 것이 없습니다.')
+            return
+        
+        # 삭제 도중 만료되는 세션은 다음 실행 때 지움
+        model = store.get_model_class()
+        expired = model.objects.filter(expire_date__lt=timezone.now())
+        deleted = 0
+        while True:
+            keys = list(expired.values_list('session_key', flat=True)[:batch_size])
+            if not keys:
+                break
+            # 배치마다 별도 트랜잭션(autocommit)으로 삭제
+            deleted += model.objects.filter(session_key__in=keys).delete()[0]
+        
+        self.stdout.write(self.style.SUCCESS(f'만료된 세션 {deleted}개를 삭제했습니다.'))
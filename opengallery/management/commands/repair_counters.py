@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from artists.models import Artist, ArtistStats
+from exhibitions.models import Exhibition, ExhibitionArtwork
+from opengallery import counters, generations
+
+
+class Command(BaseCommand):
+    help = '전시의 작품 수(artwork_count), 작가 통계, 대시보드 합계 카운터를 원본 테이블에서 다시 계산합니다.'
+    
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            exhibitions = counters.recount_column(Exhibition, 'artwork_count', ExhibitionArtwork, 'exhibition')
+            stats = ArtistStats.refresh()
+            # 통계 페이지의 캐시된 목록(작가 세대로 무효화)이 다시 계산된 통계를 보도록 함
+            generations.bump_on_commit(Artist)
+            totals = counters.reconcile()
+        
+        self.stdout.write(f'전시 작품 수 보정: {exhibitions}개')
+        self.stdout.write(f'작가 통계 재계산: {stats}명')
+        self.stdout.write(f'합계 카운터 보정: {totals}개')
+        self.stdout.write(self.style.SUCCESS('카운터 복구를 완료했습니다.'))
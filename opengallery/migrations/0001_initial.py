@@ -0,0 +1,37 @@
+# Generated by Django 5.2.3 on 2026-10-18 06:12
+
+from django.db import migrations, models
+
+
+def populate_counters(apps, schema_editor):
+    Counter = apps.get_model('opengallery', 'Counter')
+    Artist = apps.get_model('artists', 'Artist')
+    ArtistApplication = apps.get_model('artists', 'ArtistApplication')
+    Artwork = apps.get_model('artworks', 'Artwork')
+    Counter.objects.bulk_create([
+        Counter(name='artists', value=Artist.objects.count()),
+        Counter(name='artworks', value=Artwork.objects.count()),
+        Counter(name='pending_applications', value=ArtistApplication.objects.filter(status='pending').count()),
+    ])
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('artists', '0005_application_sort_indexes'),
+        ('artworks', '0003_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Counter',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
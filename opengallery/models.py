@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class Counter(models.Model):
+    """관리자 대시보드 등에 표시하는 전체 합계 (COUNT(*) 전체 스캔 대신 조회)
+
+    원본 행이 추가/삭제되거나 상태가 바뀔 때 같은 트랜잭션 안에서 F()로 증감되며
+    (opengallery.counters 참고), repair_counters 명령으로 원본 테이블과 다시 맞춘다.
+    """
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.name}: {self.value}"
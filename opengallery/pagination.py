@@ -0,0 +1,189 @@
+"""커서(키셋) 기반 페이지네이션
+
+OFFSET/COUNT(*) 기반의 Paginator는 뒤쪽 페이지로 갈수록 느려지므로, 마지막으로 본 항목의
+(정렬 키, id) 값을 커서로 넘겨 다음 페이지를 인덱스 범위 조회로 가져온다.
+어느 페이지든 첫 페이지와 같은 비용이 든다.
+"""
+import base64
+import binascii
+from datetime import datetime
+from django.db.models import Q
+
+# 목록 페이지에 표시할 근사 전체 개수의 상한
+LISTING_COUNT_LIMIT = 1000
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+def encode_cursor(direction, key, pk):
+    raw = f'{direction}|{key.isoformat()}|{pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (방향, 정렬 키, id)로 해석 (잘못된 커서는 None)"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        direction, key, pk = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        if direction not in (NEXT, PREVIOUS):
+            return None
+        return direction, datetime.fromisoformat(key), int(pk)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
+
+
+class CursorPage:
+    """커서 페이지 (템플릿에서 page_obj처럼 순회 가능)"""
+    
+    def __init__(self, object_list, next_cursor, previous_cursor, approximate_count=None, count_limit=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.approximate_count = approximate_count
+        self.count_limit = count_limit
+    
+    def __iter__(self):
+        return iter(self.object_list)
+    
+    def __len__(self):
+        return len(self.object_list)
+    
+    def __getitem__(self, index):
+        return self.object_list[index]
+    
+    def has_next(self):
+        return self.next_cursor is not None
+    
+    def has_previous(self):
+        return self.previous_cursor is not None
+    
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+    
+    @property
+    def count_is_capped(self):
+        """approximate_count가 상한에 걸려 실제 개수가 더 많을 수 있는지 여부"""
+        return self.count_limit is not None and self.approximate_count is not None \
+            and self.approximate_count >= self.count_limit
+
+
+class CursorPaginator:
+    """(key_field, id) 내림차순 키셋 페이지네이터
+
+    count_limit을 지정하면 최대 count_limit개까지만 세는 근사 전체 개수를 함께 제공한다.
+    모델 인스턴스뿐 아니라 values() 쿼리셋의 dict 행도 지원한다.
+    """
+    
+    def __init__(self, queryset, per_page, key_field='created_at', count_limit=None):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.key_field = key_field
+        self.count_limit = count_limit
+    
+    def _value(self, row, field):
+        if isinstance(row, dict):
+            return row[field]
+        return getattr(row, field)
+    
+    def _cursor_for(self, direction, row):
+        return encode_cursor(direction, self._value(row, self.key_field), self._value(row, 'id'))
+    
+    def approximate_count(self):
+        if self.count_limit is None:
+            return None
+        return self.queryset.order_by()[:self.count_limit].count()
+    
+    async def aapproximate_count(self):
+        if self.count_limit is None:
+            return None
+        return await self.queryset.order_by()[:self.count_limit].acount()
+    
+    def _page_queryset(self, decoded):
+        key = self.key_field
+        if decoded is None:
+            return self.queryset.order_by(f'-{key}', '-id')[:self.per_page + 1]
+        _, value, pk = decoded
+        if decoded[0] == NEXT:
+            # key <= value 범위 조건을 함께 두어 인덱스 범위 탐색이 가능하도록 한다
+            return (
+                self.queryset.filter(**{f'{key}__lte': value})
+                .filter(Q(**{f'{key}__lt': value}) | Q(id__lt=pk))
+                .order_by(f'-{key}', '-id')[:self.per_page + 1]
+            )
+        return (
+            self.queryset.filter(**{f'{key}__gte': value})
+            .filter(Q(**{f'{key}__gt': value}) | Q(id__gt=pk))
+            .order_by(key, 'id')[:self.per_page + 1]
+        )
+    
+    def _build_page(self, rows, decoded, approximate_count):
+        if decoded is None or decoded[0] == NEXT:
+            has_more_after, has_before = len(rows) > self.per_page, decoded is not None
+            rows = rows[:self.per_page]
+        else:
+            has_more_after, has_before = True, len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+        
+        next_cursor = previous_cursor = None
+        if rows and has_more_after:
+            next_cursor = self._cursor_for(NEXT, rows[-1])
+        if rows and has_before:
+            previous_cursor = self._cursor_for(PREVIOUS, rows[0])
+        
+        return CursorPage(
+            rows,
+            next_cursor,
+            previous_cursor,
+            approximate_count=approximate_count,
+            count_limit=self.count_limit,
+        )
+    
+    def get_page(self, cursor=None, fallback_to_first=True):
+        """커서 다음/이전 페이지
+
+        커서 이후/이전에 항목이 없으면 (삭제 등) 첫 페이지를 보여준다. 이어 붙이는 무한 스크롤처럼
+        첫 페이지가 중복이 되는 경우에는 fallback_to_first=False로 빈 페이지를 받는다
+        (잘못된 커서도 빈 페이지).
+        """
+        decoded = decode_cursor(cursor)
+        if cursor and decoded is None and not fallback_to_first:
+            return self._build_page([], None, None)
+        rows = list(self._page_queryset(decoded))
+        if decoded is not None and not rows:
+            if fallback_to_first:
+                return self.get_page()
+            return self._build_page(rows, decoded, None)
+        return self._build_page(rows, decoded, self.approximate_count())
+    
+    async def aget_page(self, cursor=None, fallback_to_first=True):
+        """get_page의 비동기 버전 (비동기 ORM으로 조회)"""
+        decoded = decode_cursor(cursor)
+        if cursor and decoded is None and not fallback_to_first:
+            return self._build_page([], None, None)
+        rows = [
+            row async for row in
+            self._page_queryset(decoded).aiterator(chunk_size=self.per_page + 1)
+        ]
+        if decoded is not None and not rows:
+            if fallback_to_first:
+                return await self.aget_page()
+            return self._build_page(rows, decoded, None)
+        return self._build_page(rows, decoded, await self.aapproximate_count())
+
+
+async def aget_numbered_page(paginator, number):
+    """Paginator.get_page의 비동기 버전
+
+    전체 개수는 acount()로, 페이지 항목은 aiterator()로 조회한다.
+    """
+    # count는 cached_property이므로 미리 채워 두면 동기 COUNT 쿼리가 실행되지 않는다
+    paginator.count = await paginator.object_list.acount()
+    page = paginator.get_page(number)
+    page.object_list = [
+        row async for row in
+        page.object_list.aiterator(chunk_size=paginator.per_page)
+    ]
+    return page
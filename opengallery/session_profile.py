@@ -0,0 +1,52 @@
+"""환경 변수 기반 세션/메시지 저장소 설정
+
+SESSION_PROFILE로 세션 저장 방식을, MESSAGE_STORAGE_PROFILE로 messages 저장 방식을 고른다.
+
+    SESSION_PROFILE=db              요청마다 DB에서 세션 조회 (기본값, Django 기본값)
+    SESSION_PROFILE=cached_db       세션을 캐시에서 읽고 DB에도 저장 (캐시가 비어도 DB에서 복구)
+    SESSION_PROFILE=signed_cookies  세션 전체를 서명된 쿠키에 저장 (DB/캐시 조회 없음,
+                                    서버에서 세션을 강제로 만료시킬 수 없고 쿠키 크기 제한이 있음)
+
+    MESSAGE_STORAGE_PROFILE=fallback  쿠키에 먼저 저장하고 넘치면 세션에 저장 (기본값)
+    MESSAGE_STORAGE_PROFILE=cookie    항상 쿠키에 저장 (세션 갱신 없음)
+    MESSAGE_STORAGE_PROFILE=session   세션에 저장
+
+cached_db는 SESSION_CACHE_BACKEND(와 SESSION_CACHE_LOCATION)로 memcached, Redis처럼 쓰기마다
+전체 항목을 훑지 않는 공유 캐시를 지정해야 한다. FileBasedCache는 set마다 캐시 디렉터리 전체를
+나열하므로(cull) 세션 수에 비례해 세션/메시지 저장이 느려지고, 요청마다 줄인 세션 조회보다
+비용이 커진다.
+"""
+from django.core.exceptions import ImproperlyConfigured
+
+FILE_BASED_CACHE = 'django.core.cache.backends.filebased.FileBasedCache'
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+MESSAGE_STORAGES = {
+    'fallback': 'django.contrib.messages.storage.fallback.FallbackStorage',
+    'cookie': 'django.contrib.messages.storage.cookie.CookieStorage',
+    'session': 'django.contrib.messages.storage.session.SessionStorage',
+}
+
+
+def session_engine(profile='db', cache_backend=''):
+    profile = profile.lower()
+    if profile not in SESSION_ENGINES:
+        raise ImproperlyConfigured(f'지원하지 않는 SESSION_PROFILE입니다: {profile}')
+    if profile == 'cached_db' and cache_backend in ('', FILE_BASED_CACHE):
+        raise ImproperlyConfigured(
+            'cached_db 세션은 SESSION_CACHE_BACKEND에 memcached/Redis 등 파일 기반이 아닌 캐시를 지정해야 합니다.'
+        )
+    return SESSION_ENGINES[profile]
+
+
+def message_storage(profile='fallback', session_profile='db'):
+    profile = profile.lower()
+    if profile not in MESSAGE_STORAGES:
+        raise ImproperlyConfigured(f'지원하지 않는 MESSAGE_STORAGE_PROFILE입니다: {profile}')
+    if profile == 'session' and session_profile.lower() == 'signed_cookies':
+        # 메시지가 어차피 쿠키에 실리므로 의미가 없고, 세션 쿠키 크기만 커진다
+        raise ImproperlyConfigured('signed_cookies 세션에서는 session 메시지 저장소를 사용할 수 없습니다.')
+    return MESSAGE_STORAGES[profile]
@@ -11,6 +11,11 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
 from pathlib import Path
+from decouple import config
+# *_profile 모듈은 설정이 만들어지기 전에 임포트되므로 설정에 접근하는 Django 모듈을 임포트하지 않아야 한다
+from opengallery.db_profile import database_from_env
+from opengallery.hasher_profile import password_hasher_params, password_hashers
+from opengallery.session_profile import message_storage, session_engine
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -41,6 +46,9 @@ INSTALLED_APPS = [
     'artworks.apps.ArtworksConfig',
     'exhibitions.apps.ExhibitionsConfig',
     'auth_management.apps.AuthManagementConfig', 
+    'search.apps.SearchConfig',
+    'api.apps.ApiConfig',
+    'opengallery.apps.OpengalleryConfig',
     'django.contrib.humanize',
 ]
 
@@ -50,12 +58,17 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'artists.middleware.CurrentArtistMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'opengallery.urls'
 
+# ASGI 프로필: 공개 페이지(홈, 작가/작품/전시 목록)에 비동기 뷰 사용
+# uvicorn 등 ASGI 서버로 실행할 때 켠다 (opengallery/asgi.py 참고)
+ASYNC_VIEWS = config('DJANGO_ASYNC_VIEWS', default=False, cast=bool)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -79,13 +92,80 @@ WSGI_APPLICATION = 'opengallery.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# DB_ENGINE 등 환경 변수(.env)로 SQLite/PostgreSQL 프로필 선택 (opengallery/db_profile.py 참고)
 DATABASES = {
+    'default': database_from_env(BASE_DIR / 'db.sqlite3'),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+# 여러 워커 프로세스가 같은 캐시를 보도록 파일 기반 캐시를 사용한다.
+# FileBasedCache는 MAX_ENTRIES를 넘으면 항목을 무작위로 지우고(cull) set마다 디렉터리 전체를
+# 훑으므로, 지워지면 안 되는 항목은 목록 조각과 다른 디렉터리(별칭)에 두어 조각이 늘어나도
+# 밀려나지 않게 하고, 세션처럼 항목이 많고 자주 쓰는 캐시에는 쓰지 않는다.
+CACHE_DIR = BASE_DIR / '.cache'
+CACHES = {
+    # 목록 조각, 쿼리셋 결과 (지워지면 다시 만든다)
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': CACHE_DIR / 'default',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+    # 세대 토큰 (모델 수만큼만 저장되므로 가득 차지 않는다. 지워지면 관련 캐시 전체가 무효화됨)
+    'generations': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': CACHE_DIR / 'generations',
+        'TIMEOUT': None,
+    },
 }
 
+# 모델 세대 토큰을 저장할 캐시 (opengallery.generations)
+GENERATION_CACHE_ALIAS = 'generations'
+
+# 공개 목록 페이지 본문 캐시 유지 시간 (초)
+LISTING_CACHE_TIMEOUT = 300
+
+# cached_queryset 결과 캐시 유지 시간 (초)
+QUERYSET_CACHE_TIMEOUT = 300
+
+# 자동 완성 색인을 요청 스레드 밖에서 다시 만들지 여부 (search.suggest)
+SUGGEST_BACKGROUND_REBUILD = True
+
+
+# Sessions / messages
+# 세션 저장 방식 (db | cached_db | signed_cookies)
+SESSION_PROFILE = config('SESSION_PROFILE', default='db')
+# cached_db 세션을 둘 캐시 백엔드 (memcached/Redis 등, opengallery/session_profile.py 참고)
+SESSION_CACHE_BACKEND = config('SESSION_CACHE_BACKEND', default='')
+if SESSION_CACHE_BACKEND:
+    CACHES['sessions'] = {
+        'BACKEND': SESSION_CACHE_BACKEND,
+        'LOCATION': config('SESSION_CACHE_LOCATION', default=''),
+    }
+SESSION_ENGINE = session_engine(SESSION_PROFILE, SESSION_CACHE_BACKEND)
+SESSION_CACHE_ALIAS = 'sessions'
+
+# messages 저장 방식 (fallback | cookie | session)
+MESSAGE_STORAGE = message_storage(
+    config('MESSAGE_STORAGE_PROFILE', default='fallback'), SESSION_PROFILE,
+)
+
+
+# Password hashing
+# 새 비밀번호와 로그인 시 재해시에 쓸 알고리즘 (auto | argon2 | scrypt | pbkdf2)
+PASSWORD_HASHER_PROFILE = config('PASSWORD_HASHER_PROFILE', default='auto')
+PASSWORD_HASHERS = password_hashers(PASSWORD_HASHER_PROFILE)
+PASSWORD_HASHER_PARAMS = password_hasher_params()
+
+# 로그인 실패 제한: 사용자명/IP별 허용 실패 횟수와 실패 기록 유지 시간 (초)
+LOGIN_THROTTLE_MAX_FAILURES = config('LOGIN_THROTTLE_MAX_FAILURES', default=5, cast=int)
+LOGIN_THROTTLE_IP_MAX_FAILURES = config('LOGIN_THROTTLE_IP_MAX_FAILURES', default=20, cast=int)
+LOGIN_THROTTLE_WINDOW = config('LOGIN_THROTTLE_WINDOW', default=900, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
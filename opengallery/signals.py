@@ -0,0 +1,96 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from artists.models import Artist, ArtistApplication
+from artists.signals import artists_bulk_created
+from artworks.models import Artwork
+from artworks.signals import artworks_bulk_created
+from exhibitions.models import Exhibition, ExhibitionArtwork
+from . import counters, generations
+
+# 저장/삭제 시 세대 토큰을 교체할 모델 (전시-작품 연결은 전시의 세대로 취급)
+GENERATION_MODELS = {
+    Artist: Artist,
+    ArtistApplication: ArtistApplication,
+    Artwork: Artwork,
+    Exhibition: Exhibition,
+    ExhibitionArtwork: Exhibition,
+}
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_generation_on_change(sender, **kwargs):
+    if sender in GENERATION_MODELS:
+        generations.bump_on_commit(GENERATION_MODELS[sender])
+
+
+@receiver(artists_bulk_created)
+def bump_generation_on_bulk_create(sender, **kwargs):
+    generations.bump_on_commit(Artist)
+
+
+@receiver(artworks_bulk_created)
+def bump_generation_on_bulk_artworks(sender, **kwargs):
+    generations.bump_on_commit(Artwork)
+
+
+# 생성/삭제 시 증감할 전체 합계 카운터
+COUNTED_MODELS = {
+    Artist: 'artists',
+    Artwork: 'artworks',
+}
+
+
+@receiver(post_save)
+def count_on_create(sender, created, **kwargs):
+    if created and sender in COUNTED_MODELS:
+        counters.shift(COUNTED_MODELS[sender], 1)
+
+
+@receiver(post_delete)
+def count_on_delete(sender, **kwargs):
+    # 작가/사용자 삭제로 인한 연쇄 삭제도 실제로 행이 사라지므로 함께 감소시킨다
+    if sender in COUNTED_MODELS:
+        counters.shift(COUNTED_MODELS[sender], -1)
+
+
+@receiver(artists_bulk_created)
+def count_on_bulk_create(sender, instances, **kwargs):
+    counters.shift('artists', len(instances))
+
+
+@receiver(artworks_bulk_created)
+def count_on_bulk_artworks(sender, instances, **kwargs):
+    counters.shift('artworks', len(instances))
+
+
+@receiver(pre_save, sender=ArtistApplication)
+def remember_previous_status(sender, instance, **kwargs):
+    """대기중 여부가 바뀌는 수정인지 알 수 있도록 이전 상태를 기억해 둔다"""
+    instance._previous_status = None
+    if instance.pk:
+        instance._previous_status = (
+            ArtistApplication.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=ArtistApplication)
+def count_pending_on_save(sender, instance, **kwargs):
+    was_pending = getattr(instance, '_previous_status', None) == 'pending'
+    is_pending = instance.status == 'pending'
+    if was_pending != is_pending:
+        counters.shift('pending_applications', 1 if is_pending else -1)
+
+
+@receiver(pre_delete, sender=ArtistApplication)
+def remember_status_before_delete(sender, instance, **kwargs):
+    # 메모리의 인스턴스는 update()로 처리된 뒤의 상태를 모를 수 있으므로 저장된 상태를 읽는다
+    instance._previous_status = (
+        ArtistApplication.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+    )
+
+
+@receiver(post_delete, sender=ArtistApplication)
+def count_pending_on_delete(sender, instance, **kwargs):
+    if getattr(instance, '_previous_status', None) == 'pending':
+        counters.shift('pending_applications', -1)
@@ -0,0 +1,8 @@
+# 캐시 동작을 확인하는 테스트용 메모리 캐시 (테스트 설정의 기본 캐시는 DummyCache)
+# 모든 앱의 테스트가 같이 쓰므로 사용하는 테스트는 시작과 끝에 cache.clear()로 비운다
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'opengallery-test',
+    }
+}
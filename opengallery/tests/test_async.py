@@ -0,0 +1,95 @@
+from asgiref.sync import iscoroutinefunction
+from django.test import AsyncClient, TestCase, override_settings
+from django.contrib.auth.models import User
+from django.urls import resolve, reverse
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from datetime import date
+from artists.models import Artist
+from artworks.models import Artwork
+from exhibitions.models import Exhibition
+from opengallery.benchmarks import async_views
+from opengallery.pagination import CursorPaginator, aget_numbered_page
+from . import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AsyncViewTest(TestCase):
+    """ASGI 프로필 비동기 뷰 테스트"""
+    
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='asyncartist', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='비동기작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='async@example.com',
+            phone_number='010-1234-5678'
+        )
+        for i in range(15):
+            Artwork.objects.create(artist=self.artist, title=f'비동기작품{i}', price=10000, size_number=10)
+        Exhibition.objects.create(
+            artist=self.artist,
+            title='비동기전시',
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 2, 1)
+        )
+        self.enterContext(async_views())
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def test_urls_use_async_views(self):
+        """ASGI 프로필에서는 공개 페이지가 비동기 뷰로 연결되어야 함"""
+        for name in ('auth_management:home', 'artists:artist_list',
+                     'artworks:artwork_list', 'exhibitions:exhibition_list'):
+            self.assertTrue(iscoroutinefunction(resolve(reverse(name)).func), name)
+    
+    async def test_listing_pages(self):
+        """비동기 목록 페이지가 동기 뷰와 같은 내용을 보여줘야 함"""
+        client = AsyncClient()
+        
+        response = await client.get(reverse('artworks:artwork_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '비동기작품14')
+        self.assertNotContains(response, '비동기작품2<')
+        
+        response = await client.get(reverse('artists:artist_list'), {'search': '비동기'})
+        self.assertContains(response, '비동기작가')
+        
+        response = await client.get(reverse('exhibitions:exhibition_list'))
+        self.assertContains(response, '비동기전시')
+    
+    async def test_not_modified(self):
+        """비동기 뷰도 ETag가 같으면 304를 반환해야 함"""
+        client = AsyncClient()
+        url = reverse('artworks:artwork_list')
+        response = await client.get(url)
+        self.assertTrue(response.has_header('Last-Modified'))
+        response = await client.get(url, headers={'if-none-match': response['ETag']})
+        self.assertEqual(response.status_code, 304)
+    
+    async def test_home_for_artist(self):
+        """로그인한 작가에게는 작가 대시보드 링크를 보여줘야 함"""
+        client = AsyncClient()
+        await client.alogin(username='asyncartist', password='testpass123')
+        response = await client.get(reverse('auth_management:home'))
+        self.assertContains(response, reverse('artists:artist_dashboard'))
+    
+    async def test_async_pagination(self):
+        """비동기 페이지네이션이 동기 버전과 같은 결과를 반환해야 함"""
+        queryset = Artwork.objects.all()
+        paginator = CursorPaginator(queryset, 10, count_limit=100)
+        page = await paginator.aget_page()
+        self.assertEqual(len(page), 10)
+        self.assertEqual(page.approximate_count, 15)
+        
+        next_page = await paginator.aget_page(page.next_cursor)
+        self.assertEqual(len(next_page), 5)
+        self.assertFalse(next_page.has_next())
+        
+        numbered = await aget_numbered_page(Paginator(queryset.order_by('id'), 10), 2)
+        self.assertEqual(numbered.paginator.num_pages, 2)
+        self.assertEqual(len(numbered.object_list), 5)
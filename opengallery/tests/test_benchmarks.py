@@ -0,0 +1,15 @@
+from django.test import TestCase
+from opengallery.benchmarks import find_query_growth, measure_views, seed_dataset
+
+
+class QueryGrowthTest(TestCase):
+    """데이터가 늘어나도 뷰의 쿼리 수가 일정한지 확인 (벤치마크 스위트의 축소판)"""
+    
+    def test_query_counts_do_not_grow_with_data(self):
+        seed_dataset(40, prefix='small')
+        small = measure_views(iterations=1)
+        
+        seed_dataset(200, prefix='large')
+        large = measure_views(iterations=1)
+        
+        self.assertEqual(find_query_growth({40: small, 240: large}), [])
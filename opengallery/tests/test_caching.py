@@ -0,0 +1,309 @@
+from django.test import TestCase, Client, override_settings
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import parse_http_date
+from datetime import date
+from unittest import mock
+from artists.models import Artist, ArtistApplication
+from artworks.models import Artwork
+from exhibitions.models import Exhibition, ExhibitionArtwork
+from opengallery import generations
+from . import LOCMEM_CACHES
+import tempfile
+import time
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ListingCacheTest(TestCase):
+    """공개 목록 렌더링 캐시 테스트"""
+    
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        user = User.objects.create_user(username='cached', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=user,
+            name='캐시작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='cached@example.com',
+            phone_number='010-1234-5678'
+        )
+        Artwork.objects.create(artist=self.artist, title='첫작품', price=10000, size_number=10)
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def test_second_request_uses_cache(self):
+        """같은 목록을 다시 요청하면 목록 쿼리를 실행하지 않아야 함"""
+        for name in ('artists:artist_list', 'artworks:artwork_list', 'exhibitions:exhibition_list'):
+            url = reverse(name)
+            with CaptureQueriesContext(connection) as first:
+                self.client.get(url)
+            with CaptureQueriesContext(connection) as second:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(second), 0, name)
+            self.assertGreater(len(first), 0, name)
+    
+    def test_cache_varies_by_parameters(self):
+        """검색어가 다르면 별도로 캐시되어야 함"""
+        url = reverse('artworks:artwork_list')
+        self.client.get(url)
+        response = self.client.get(url, {'search': '없는작품'})
+        self.assertNotContains(response, '첫작품')
+    
+    def test_save_invalidates_listings(self):
+        """작품이 추가되면 커밋 후 작품/전시 목록 캐시가 무효화되어야 함"""
+        url = reverse('artworks:artwork_list')
+        self.assertNotContains(self.client.get(url), '새작품')
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Artwork.objects.create(artist=self.artist, title='새작품', price=20000, size_number=20)
+        
+        self.assertContains(self.client.get(url), '새작품')
+    
+    def test_rendered_html_is_not_escaped(self):
+        """캐시에서 꺼낸 목록 HTML이 이스케이프되지 않아야 함"""
+        url = reverse('artists:artist_list')
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertContains(response, '캐시작가')
+        self.assertNotContains(response, '&lt;div')
+
+
+class CacheLayoutTest(TestCase):
+    """운영 설정의 용도별 캐시 분리 테스트"""
+    
+    def test_culled_entries_do_not_share_storage(self):
+        """세션과 세대 토큰은 목록 조각과 다른 저장소를 써야 함"""
+        from opengallery import settings as project_settings
+        
+        aliases = {
+            project_settings.GENERATION_CACHE_ALIAS,
+            project_settings.SESSION_CACHE_ALIAS,
+        }
+        self.assertEqual(len(aliases), 2)
+        self.assertNotIn('default', aliases)
+        locations = [project_settings.CACHES[alias]['LOCATION'] for alias in project_settings.CACHES]
+        self.assertEqual(len(set(locations)), len(locations))
+
+
+class GenerationTest(TestCase):
+    """모델 세대 토큰과 쿼리셋 캐시 테스트"""
+    
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': self.cache_dir.name,
+            }
+        })
+        self.settings_override.enable()
+        self.user = User.objects.create_user(username='gen', password='testpass123')
+    
+    def tearDown(self):
+        self.settings_override.disable()
+        self.cache_dir.cleanup()
+    
+    def create_artist(self, name='세대작가'):
+        return Artist.objects.create(
+            user=self.user,
+            name=name,
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='gen@example.com',
+            phone_number='010-1234-5678'
+        )
+    
+    def test_bump_is_visible_to_other_processes(self):
+        """교체한 토큰을 같은 저장소를 쓰는 다른 캐시 인스턴스(다른 워커)도 읽어야 함"""
+        from django.core.cache.backends.filebased import FileBasedCache
+        
+        token = generations.bump('artists.Artist')
+        other_worker = FileBasedCache(self.cache_dir.name, {})
+        self.assertEqual(other_worker.get('generation:artists.Artist'), token)
+    
+    def test_untracked_model_is_rejected(self):
+        """관리하지 않는 모델은 오류가 발생해야 함"""
+        with self.assertRaises(ValueError):
+            generations.bump(User)
+    
+    def test_save_bumps_generation_after_commit(self):
+        """모델 저장 후 커밋되면 해당 모델의 세대만 바뀌어야 함"""
+        before = generations.get_generations(Artist, Artwork)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_artist()
+        after = generations.get_generations(Artist, Artwork)
+        
+        self.assertNotEqual(before['artists.Artist'], after['artists.Artist'])
+        self.assertEqual(before['artworks.Artwork'], after['artworks.Artwork'])
+    
+    def test_exhibition_artwork_bumps_exhibition(self):
+        """전시-작품 연결이 바뀌면 전시 세대가 바뀌어야 함"""
+        artist = self.create_artist()
+        artwork = Artwork.objects.create(artist=artist, title='작품', price=1000, size_number=10)
+        exhibition = Exhibition.objects.create(
+            artist=artist,
+            title='전시',
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 2, 1)
+        )
+        before = generations.get_generations(Exhibition)['exhibitions.Exhibition']
+        with self.captureOnCommitCallbacks(execute=True):
+            ExhibitionArtwork.objects.create(exhibition=exhibition, artwork=artwork)
+        after = generations.get_generations(Exhibition)['exhibitions.Exhibition']
+        self.assertNotEqual(before, after)
+    
+    def test_cached_queryset(self):
+        """캐시된 결과는 쿼리 없이 반환되고, 모델이 바뀌면 다시 조회되어야 함"""
+        artist = self.create_artist('첫작가')
+        queryset = Artist.objects.order_by('name')
+        
+        first = generations.cached_queryset(queryset)
+        with CaptureQueriesContext(connection) as queries:
+            second = generations.cached_queryset(queryset)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual([a.name for a in first], [a.name for a in second])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            artist.name = '바뀐작가'
+            artist.save()
+        
+        self.assertEqual([a.name for a in generations.cached_queryset(queryset)], ['바뀐작가'])
+    
+    def test_cached_queryset_keys_include_params(self):
+        """SQL 문자열이 같아도 파라미터가 다르면 다른 캐시 항목을 써야 함"""
+        artist = self.create_artist()
+        for title in ('a, b', 'a'):
+            Artwork.objects.create(artist=artist, title=title, price=1000, size_number=10)
+        together = Artwork.objects.filter(title__in=['a, b'])
+        apart = Artwork.objects.filter(title__in=['a', 'b'])
+        self.assertEqual(str(together.query), str(apart.query))
+        
+        self.assertEqual([a.title for a in generations.cached_queryset(together)], ['a, b'])
+        self.assertEqual([a.title for a in generations.cached_queryset(apart)], ['a'])
+    
+    def test_batch_processing_bumps_application_generation(self):
+        """일괄 처리(update)도 신청 세대를 바꿔야 함"""
+        from artists.services import process_application_batch
+        
+        application = ArtistApplication.objects.create(
+            user=self.user,
+            name='신청자',
+            gender='남자',
+            birthday=date(1990, 1, 1),
+            email='apply@example.com',
+            phone_number='010-0000-0000'
+        )
+        before = generations.get_generations(ArtistApplication)['artists.ArtistApplication']
+        with self.captureOnCommitCallbacks(execute=True):
+            process_application_batch([application.id], 'reject')
+        after = generations.get_generations(ArtistApplication)['artists.ArtistApplication']
+        self.assertNotEqual(before, after)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ConditionalResponseTest(TestCase):
+    """목록 페이지 ETag / Last-Modified 조건부 응답 테스트"""
+    
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(username='conditional', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='조건부작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='conditional@example.com',
+            phone_number='010-1234-5678'
+        )
+        Artwork.objects.create(artist=self.artist, title='조건부작품', price=10000, size_number=10)
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def test_not_modified_without_rendering(self):
+        """ETag가 같으면 템플릿을 렌더링하지 않고 304를 반환해야 함"""
+        for name in ('artists:artist_list', 'artworks:artwork_list', 'exhibitions:exhibition_list'):
+            url = reverse(name)
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.has_header('ETag'), name)
+            self.assertTrue(response.has_header('Last-Modified'), name)
+            
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(response.status_code, 304, name)
+            self.assertTemplateNotUsed(response, 'gallery/partials/artist_listing.html')
+            self.assertEqual(response.content, b'')
+    
+    def test_if_modified_since(self):
+        """Last-Modified 이후 변경이 없으면 304를 반환해야 함"""
+        url = reverse('artworks:artwork_list')
+        response = self.client.get(url)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+    
+    def test_delete_advances_last_modified(self):
+        """삭제는 updated_at에 남지 않아도 Last-Modified를 바꿔 If-Modified-Since만 보내는 요청에 304가 아니어야 함"""
+        url = reverse('artworks:artwork_list')
+        artwork = Artwork.objects.create(artist=self.artist, title='삭제될작품', price=20000, size_number=20)
+        last_modified = self.client.get(url)['Last-Modified']
+        
+        later = time.time() + 5
+        with mock.patch('opengallery.generations.time.time', return_value=later):
+            with self.captureOnCommitCallbacks(execute=True):
+                artwork.delete()
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, '삭제될작품')
+        self.assertEqual(parse_http_date(response['Last-Modified']), int(later))
+    
+    def test_change_invalidates_etag(self):
+        """작품이 추가되거나 삭제되면 이전 ETag로는 304가 아니어야 함"""
+        url = reverse('artworks:artwork_list')
+        etag = self.client.get(url)['ETag']
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            artwork = Artwork.objects.create(artist=self.artist, title='새작품', price=20000, size_number=20)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '새작품')
+        
+        etag = response['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            artwork.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+    
+    def test_etag_varies_by_query_and_user(self):
+        """검색어와 로그인 사용자별로 ETag가 달라야 하고, 로그인 시 Last-Modified는 보내지 않아야 함"""
+        url = reverse('artworks:artwork_list')
+        anonymous = self.client.get(url)['ETag']
+        searched = self.client.get(url, {'search': '조건부'})['ETag']
+        self.assertNotEqual(anonymous, searched)
+        
+        self.client.login(username='conditional', password='testpass123')
+        response = self.client.get(url)
+        self.assertNotEqual(response['ETag'], anonymous)
+        self.assertFalse(response.has_header('Last-Modified'))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=anonymous).status_code, 200)
+    
+    def test_pending_messages_skip_validators(self):
+        """표시할 메시지가 남아 있으면 304 대신 전체 페이지를 보내야 함"""
+        url = reverse('artworks:artwork_list')
+        etag = self.client.get(url)['ETag']
+        
+        self.client.login(username='conditional', password='testpass123')
+        self.client.post(reverse('artworks:create_artwork'), {
+            'title': '메시지작품',
+            'price': '30000',
+            'size_number': '30'
+        })
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
@@ -0,0 +1,141 @@
+from django.test import TestCase, Client
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from datetime import date
+from artists.models import Artist, ArtistApplication
+from artworks.models import Artwork
+from opengallery import counters
+from opengallery.models import Counter
+import io
+
+
+class CounterTest(TestCase):
+    """관리자 대시보드 합계 카운터 테스트"""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(username='counter', password='testpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='카운터작가',
+            gender='여자',
+            birthday=date(1990, 1, 1),
+            email='counter@example.com',
+            phone_number='010-1234-5678'
+        )
+    
+    def create_application(self, username):
+        user = User.objects.create_user(username=username, password='testpass123')
+        return ArtistApplication.objects.create(
+            user=user,
+            name=username,
+            gender='남자',
+            birthday=date(1995, 5, 15),
+            email=f'{username}@example.com',
+            phone_number='010-9876-5432'
+        )
+    
+    def assertCountersMatch(self):
+        self.assertEqual(
+            counters.get_counts(),
+            {name: counters.count(name) for name in counters.COUNTERS},
+        )
+    
+    def test_create_and_delete_are_counted(self):
+        """작가/작품 생성과 삭제(연쇄 삭제 포함)가 카운터에 반영되어야 함"""
+        artwork = Artwork.objects.create(title='작품', price=100000, size_number=10, artist=self.artist)
+        Artwork.objects.create(title='작품2', price=200000, size_number=20, artist=self.artist)
+        self.assertEqual(counters.get_counts('artists', 'artworks'), {'artists': 1, 'artworks': 2})
+        
+        artwork.delete()
+        self.assertEqual(counters.get_counts('artworks'), {'artworks': 1})
+        
+        self.user.delete()
+        self.assertEqual(counters.get_counts('artists', 'artworks'), {'artists': 0, 'artworks': 0})
+    
+    def test_bulk_create_is_counted(self):
+        """일괄 등록한 작품도 카운터에 반영되어야 함"""
+        from artworks.importers import import_artworks
+        
+        rows = [{'title': f'일괄{i}', 'price': '1000', 'size_number': '5'} for i in range(5)]
+        import_artworks(self.artist, rows)
+        self.assertEqual(counters.get_counts('artworks'), {'artworks': 5})
+    
+    def test_pending_applications_follow_status(self):
+        """대기중 신청 수는 생성, 상태 변경, 일괄 처리, 삭제를 따라가야 함"""
+        from artists.services import process_application_batch
+        
+        applications = [self.create_application(f'applicant{i}') for i in range(4)]
+        self.assertEqual(counters.get_counts('pending_applications'), {'pending_applications': 4})
+        
+        applications[0].status = 'rejected'
+        applications[0].save()
+        applications[0].save()
+        self.assertEqual(counters.get_counts('pending_applications'), {'pending_applications': 3})
+        
+        applications[0].status = 'pending'
+        applications[0].save()
+        self.assertEqual(counters.get_counts('pending_applications'), {'pending_applications': 4})
+        
+        process_application_batch([applications[1].id, applications[2].id], 'approve')
+        self.assertEqual(counters.get_counts('pending_applications'), {'pending_applications': 2})
+        
+        applications[3].delete()
+        applications[1].delete()
+        self.assertCountersMatch()
+    
+    def test_rollback_discards_change(self):
+        """원본 변경이 롤백되면 카운터 변경도 함께 취소되어야 함"""
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                Artwork.objects.create(title='롤백', price=1000, size_number=1, artist=self.artist)
+                raise RuntimeError
+        self.assertEqual(counters.get_counts('artworks'), {'artworks': 0})
+    
+    def test_missing_counter_is_computed(self):
+        """행이 없는 카운터는 원본 테이블에서 계산해 만들어야 함"""
+        Counter.objects.all().delete()
+        self.assertEqual(counters.get_counts('artists'), {'artists': 1})
+        self.assertTrue(Counter.objects.filter(name='artists').exists())
+    
+    def test_reconcile_repairs_drift(self):
+        """repair_counters 명령은 어긋난 카운터를 원본 테이블에서 다시 계산해야 함"""
+        Counter.objects.filter(name='artists').update(value=100)
+        Counter.objects.filter(name='artworks').delete()
+        
+        output = io.StringIO()
+        call_command('repair_counters', stdout=output)
+        self.assertIn('합계 카운터 보정: 2개', output.getvalue())
+        self.assertCountersMatch()
+        self.assertEqual(counters.reconcile(), 0)
+    
+    def test_decrement_never_goes_negative(self):
+        """감소로 음수가 되는 경우는 무시해야 함"""
+        Counter.objects.filter(name='artworks').update(value=0)
+        counters.shift('artworks', -1)
+        self.assertEqual(Counter.objects.get(name='artworks').value, 0)
+    
+    def test_unknown_counter_is_rejected(self):
+        """알 수 없는 카운터 이름은 오류가 발생해야 함"""
+        with self.assertRaises(ValueError):
+            counters.shift('users', 1)
+    
+    def test_admin_dashboard_reads_counters(self):
+        """관리자 대시보드는 COUNT(*) 없이 카운터 테이블만 조회해야 함"""
+        User.objects.create_user(username='admin', password='testpass123', is_staff=True)
+        Artwork.objects.create(title='작품', price=100000, size_number=10, artist=self.artist)
+        self.create_application('applicant')
+        client = Client()
+        client.login(username='admin', password='testpass123')
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse('artists:admin_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['total_artists'], 1)
+        self.assertEqual(response.context['total_artworks'], 1)
+        self.assertEqual(response.context['pending_applications'], 1)
+        sql = [query['sql'] for query in queries.captured_queries]
+        self.assertFalse([statement for statement in sql if 'COUNT(' in statement.upper()])
+        self.assertEqual(len([statement for statement in sql if 'opengallery_counter' in statement]), 1)
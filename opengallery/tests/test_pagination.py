@@ -0,0 +1,90 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from datetime import date
+from artists.models import Artist
+from artworks.models import Artwork
+from opengallery.pagination import CursorPaginator, decode_cursor
+
+
+class CursorPaginationTest(TestCase):
+    """커서 페이지네이션 테스트"""
+    
+    def setUp(self):
+        user = User.objects.create_user(username='artist', password='artistpass123')
+        self.artist = Artist.objects.create(
+            user=user,
+            name='커서작가',
+            gender='남자',
+            birthday=date(1990, 1, 1),
+            email='cursor@example.com',
+            phone_number='010-1234-5678'
+        )
+        for i in range(7):
+            Artwork.objects.create(artist=self.artist, title=f'작품{i}', price=1000, size_number=10)
+        # 같은 등록 시각을 가진 작품들도 id로 순서가 결정되는지 확인하기 위해 일부 시각을 맞춘다
+        same_time = timezone.now()
+        Artwork.objects.filter(title__in=['작품2', '작품3', '작품4']).update(created_at=same_time)
+        self.expected = list(Artwork.objects.order_by('-created_at', '-id'))
+    
+    def test_walk_forward_and_backward(self):
+        """다음/이전 커서로 모든 항목을 중복 없이 순회하는지 테스트"""
+        paginator = CursorPaginator(Artwork.objects.all(), 3)
+        
+        pages = [paginator.get_page()]
+        while pages[-1].has_next():
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+        
+        self.assertEqual([a for page in pages for a in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertFalse(pages[0].has_previous())
+        
+        previous = paginator.get_page(pages[2].previous_cursor)
+        self.assertEqual(list(previous), list(pages[1]))
+        previous = paginator.get_page(previous.previous_cursor)
+        self.assertEqual(list(previous), list(pages[0]))
+        self.assertFalse(previous.has_previous())
+    
+    def test_values_queryset(self):
+        """values() 쿼리셋 지원 테스트"""
+        paginator = CursorPaginator(Artwork.objects.values('id', 'title', 'created_at'), 4)
+        
+        first = paginator.get_page()
+        second = paginator.get_page(first.next_cursor)
+        
+        self.assertEqual(
+            [row['id'] for row in list(first) + list(second)],
+            [artwork.id for artwork in self.expected]
+        )
+    
+    def test_invalid_cursor_returns_first_page(self):
+        """잘못된 커서는 첫 페이지를 반환하는지 테스트"""
+        paginator = CursorPaginator(Artwork.objects.all(), 3)
+        
+        self.assertIsNone(decode_cursor('not-a-cursor'))
+        self.assertEqual(list(paginator.get_page('not-a-cursor')), self.expected[:3])
+    
+    def test_approximate_count(self):
+        """근사 전체 개수 상한 테스트"""
+        page = CursorPaginator(Artwork.objects.all(), 3, count_limit=5).get_page()
+        self.assertEqual(page.approximate_count, 5)
+        self.assertTrue(page.count_is_capped)
+        
+        page = CursorPaginator(Artwork.objects.all(), 3, count_limit=100).get_page()
+        self.assertEqual(page.approximate_count, 7)
+        self.assertFalse(page.count_is_capped)
+    
+    def test_listing_views_use_cursor(self):
+        """작품 목록의 다음 페이지 링크가 커서를 사용하는지 테스트"""
+        for i in range(10):
+            Artwork.objects.create(artist=self.artist, title=f'추가작품{i}', price=1000, size_number=10)
+        
+        response = self.client.get(reverse('artworks:artwork_list'))
+        page_obj = response.context['page_obj']
+        self.assertEqual(len(page_obj), 12)
+        self.assertContains(response, f'?cursor={page_obj.next_cursor}')
+        
+        response = self.client.get(reverse('artworks:artwork_list'), {'cursor': page_obj.next_cursor})
+        self.assertEqual(len(response.context['page_obj']), 5)
+        self.assertContains(response, '전체 17개')
@@ -0,0 +1,123 @@
+from django.test import TestCase, override_settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import timedelta
+from unittest import mock
+from opengallery.benchmarks import (
+    WRITE_PROFILES, measure_concurrent_writes, measure_session_queries, seed_dataset,
+)
+from opengallery.db_profile import database_from_env, sqlite_pragmas
+from opengallery.session_profile import message_storage, session_engine
+import io
+import os
+
+
+class DatabaseProfileTest(TestCase):
+    """환경 변수 기반 데이터베이스 프로필 테스트"""
+    
+    def test_sqlite_profile_defaults(self):
+        """SQLite 기본 프로필은 WAL, IMMEDIATE 트랜잭션, 잠금 대기 시간을 적용해야 함"""
+        with mock.patch.dict(os.environ, {}, clear=False):
+            for name in ('DB_ENGINE', 'SQLITE_JOURNAL_MODE', 'SQLITE_BUSY_TIMEOUT'):
+                os.environ.pop(name, None)
+            database = database_from_env('/tmp/opengallery.sqlite3')
+        
+        self.assertEqual(database['ENGINE'], 'django.db.backends.sqlite3')
+        self.assertEqual(database['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertEqual(database['OPTIONS']['timeout'], 20)
+        self.assertIn('PRAGMA journal_mode=WAL', database['OPTIONS']['init_command'])
+        self.assertIn('PRAGMA busy_timeout=20000', database['OPTIONS']['init_command'])
+    
+    def test_postgresql_profile(self):
+        """PostgreSQL 프로필은 지속 연결 또는 커넥션 풀을 사용해야 함"""
+        with mock.patch.dict(os.environ, {'DB_ENGINE': 'postgresql', 'DB_CONN_MAX_AGE': '120'}):
+            database = database_from_env('unused')
+        self.assertEqual(database['ENGINE'], 'django.db.backends.postgresql')
+        self.assertEqual(database['CONN_MAX_AGE'], 120)
+        self.assertNotIn('pool', database['OPTIONS'])
+        
+        with mock.patch.dict(os.environ, {'DB_ENGINE': 'postgresql', 'DB_POOL': 'true'}):
+            database = database_from_env('unused')
+        self.assertEqual(database['CONN_MAX_AGE'], 0)
+        self.assertEqual(database['OPTIONS']['pool']['max_size'], 10)
+    
+    def test_invalid_settings(self):
+        """잘못된 엔진이나 PRAGMA 값은 설정 오류여야 함"""
+        with mock.patch.dict(os.environ, {'DB_ENGINE': 'oracle'}):
+            with self.assertRaises(ImproperlyConfigured):
+                database_from_env('unused')
+        with self.assertRaises(ImproperlyConfigured):
+            sqlite_pragmas(journal_mode='wal; DROP TABLE x')
+    
+    def test_tuned_profile_has_no_lock_errors(self):
+        """튜닝된 프로필은 동시 쓰기에서 잠금 오류 없이 모두 커밋되어야 함"""
+        result = measure_concurrent_writes(WRITE_PROFILES['tuned'], threads=4, writes_per_thread=25)
+        self.assertEqual(result['locked'], 0)
+        self.assertEqual(result['committed'], 100)
+
+
+class SessionProfileTest(TestCase):
+    """세션/메시지 저장소 프로필과 만료 세션 정리 테스트"""
+    
+    def test_profiles(self):
+        """프로필 이름이 세션 엔진과 메시지 저장소로 바뀌어야 하고, 잘못된 값은 설정 오류여야 함"""
+        self.assertEqual(
+            session_engine('cached_db', 'django.core.cache.backends.redis.RedisCache'),
+            'django.contrib.sessions.backends.cached_db',
+        )
+        self.assertEqual(
+            message_storage('cookie', 'signed_cookies'),
+            'django.contrib.messages.storage.cookie.CookieStorage',
+        )
+        with self.assertRaises(ImproperlyConfigured):
+            session_engine('file')
+        # cached_db는 파일 기반이 아닌 세션 캐시가 있어야 함
+        for cache_backend in ('', 'django.core.cache.backends.filebased.FileBasedCache'):
+            with self.assertRaises(ImproperlyConfigured):
+                session_engine('cached_db', cache_backend)
+        with self.assertRaises(ImproperlyConfigured):
+            message_storage('session', 'signed_cookies')
+    
+    def test_cached_and_cookie_profiles_skip_session_queries(self):
+        """cached_db와 signed_cookies 프로필은 요청마다 세션 테이블을 조회하지 않아야 함"""
+        seed_dataset(50, prefix='session')
+        
+        for profile in ('cached_db', 'signed_cookies'):
+            results = measure_session_queries(profile, iterations=2)
+            for name, result in results.items():
+                self.assertEqual(result['session_queries'], 0, f'{profile}: {name}')
+        
+        results = measure_session_queries('db', iterations=2)
+        self.assertGreater(results['artist_dashboard']['session_queries'], 0)
+    
+    @override_settings(SESSION_ENGINE='django.contrib.sessions.backends.db')
+    def test_purge_sessions_in_batches(self):
+        """만료된 세션만 batch_size씩 나누어 삭제해야 함"""
+        from django.contrib.sessions.models import Session
+        
+        expired = timezone.now() - timedelta(days=1)
+        Session.objects.bulk_create(
+            [Session(session_key=f'expired{i}', session_data='', expire_date=expired) for i in range(7)]
+        )
+        Session.objects.create(
+            session_key='active', session_data='', expire_date=timezone.now() + timedelta(days=1),
+        )
+        
+        out = io.StringIO()
+        with CaptureQueriesContext(connection) as ctx:
+            call_command('purge_sessions', batch_size=3, stdout=out)
+        
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['active'])
+        self.assertIn('7개', out.getvalue())
+        deletes = [query for query in ctx.captured_queries if query['sql'].startswith('DELETE')]
+        self.assertEqual(len(deletes), 3)
+    
+    @override_settings(SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies')
+    def test_purge_sessions_without_database_sessions(self):
+        """데이터베이스에 세션을 저장하지 않는 엔진에서는 아무것도 지우지 않아야 함"""
+        out = io.StringIO()
+        call_command('purge_sessions', stdout=out)
+        self.assertIn('정리할 것이 없습니다', out.getvalue())
@@ -2,13 +2,10 @@ from django.test import TestCase, Client
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.core.management import call_command
-from django.db import transaction
 from datetime import date, timedelta
-from artists.models import Artist, ArtistApplication
+from artists.models import Artist
 from artworks.models import Artwork
 from exhibitions.models import Exhibition, ExhibitionArtwork
-import io
-import sys
 
 
 class ProjectIntegrationTest(TestCase):
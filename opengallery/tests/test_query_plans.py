@@ -0,0 +1,108 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from datetime import date, timedelta
+from artists.models import Artist, ArtistApplication
+from artworks.models import Artwork
+from exhibitions.models import Exhibition, ExhibitionArtwork
+
+
+class QueryPlanTest(TestCase):
+    """목록 뷰의 주요 쿼리가 인덱스를 사용하는지 EXPLAIN QUERY PLAN으로 확인"""
+    
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.artist_user = User.objects.create_user(username='artist', password='artistpass123')
+        self.artist = Artist.objects.create(
+            user=self.artist_user,
+            name='플랜작가',
+            gender='남자',
+            birthday=date(1990, 1, 1),
+            email='plan@example.com',
+            phone_number='010-1234-5678'
+        )
+        artwork = Artwork.objects.create(artist=self.artist, title='플랜작품', price=1000, size_number=10)
+        exhibition = Exhibition.objects.create(
+            artist=self.artist,
+            title='플랜전시',
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=30)
+        )
+        ExhibitionArtwork.objects.create(exhibition=exhibition, artwork=artwork)
+        ArtistApplication.objects.create(
+            user=self.admin_user,
+            name='신청자',
+            gender='여자',
+            birthday=date(1995, 5, 15),
+            email='applicant@example.com',
+            phone_number='010-9876-5432'
+        )
+    
+    def _main_query_plan(self, url, table):
+        """뷰가 실행한 쿼리 중 table을 정렬 조회하는 첫 쿼리의 실행 계획"""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        
+        sql = next(
+            query['sql'] for query in ctx.captured_queries
+            if query['sql'].startswith('SELECT') and f'FROM "{table}"' in query['sql']
+            and 'ORDER BY' in query['sql']
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+    
+    def assertUsesIndex(self, url, table):
+        plan = self._main_query_plan(url, table)
+        table_steps = [step for step in plan if f' {table} ' in f'{step} ']
+        self.assertTrue(table_steps, plan)
+        for step in table_steps:
+            self.assertIn('INDEX', step, plan)
+        self.assertFalse([step for step in plan if 'TEMP B-TREE FOR ORDER BY' in step], plan)
+    
+    def test_public_listings_use_indexes(self):
+        """작가/작품/전시 목록 쿼리의 인덱스 사용 테스트"""
+        self.assertUsesIndex(reverse('artists:artist_list'), 'artists_artist')
+        self.assertUsesIndex(reverse('artworks:artwork_list'), 'artworks_artwork')
+        self.assertUsesIndex(reverse('exhibitions:exhibition_list'), 'exhibitions_exhibition')
+    
+    def test_artist_dashboard_uses_index(self):
+        """작가 대시보드 작품 목록 쿼리의 인덱스 사용 테스트"""
+        self.client.login(username='artist', password='artistpass123')
+        self.assertUsesIndex(reverse('artists:artist_dashboard'), 'artworks_artwork')
+    
+    def test_admin_applications_uses_index(self):
+        """신청 내역 관리 쿼리의 인덱스 사용 테스트"""
+        self.client.login(username='admin', password='adminpass123')
+        self.assertUsesIndex(reverse('artists:admin_applications'), 'artists_artistapplication')
+    
+    def test_admin_application_sorts_use_indexes(self):
+        """신청 내역 관리의 모든 정렬/상태 필터가 정렬용 임시 B-트리 없이 인덱스를 사용하는지 테스트"""
+        from artists.views import APPLICATION_SORTS
+        
+        self.client.login(username='admin', password='adminpass123')
+        url = reverse('artists:admin_applications')
+        for field in APPLICATION_SORTS:
+            for sort in (field, f'-{field}'):
+                with self.subTest(sort=sort):
+                    self.assertUsesIndex(f'{url}?sort={sort}', 'artists_artistapplication')
+        for status in ('pending', 'approved', 'rejected'):
+            # 결과가 없는 페이지는 쿼리를 실행하지 않으므로 상태별 신청을 하나씩 만든다
+            ArtistApplication.objects.create(
+                user=self.admin_user, name=status, gender='여자', birthday=date(1995, 5, 15),
+                email='status@example.com', phone_number='010-0000-0000', status=status,
+            )
+            with self.subTest(status=status):
+                self.assertUsesIndex(f'{url}?status={status}', 'artists_artistapplication')
+    
+    def test_pending_applications_use_status_index(self):
+        """대기중 신청 조회가 상태 인덱스를 사용하는지 테스트"""
+        queryset = ArtistApplication.objects.filter(status='pending').order_by('-applied_at')
+        self.assertIn('application_status_idx', queryset.explain())
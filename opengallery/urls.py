@@ -24,6 +24,8 @@ urlpatterns = [
     path('', include('artists.urls')),    
     path('', include('artworks.urls')),
     path('', include('exhibitions.urls')),  
+    path('api/', include('api.urls')),
+    path('search/', include('search.urls')),
 ]
 
 
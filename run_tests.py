@@ -7,6 +7,10 @@
     python run_tests.py artists             # artists 앱 테스트만 실행
     python run_tests.py --coverage          # 커버리지와 함께 실행
     python run_tests.py --verbose           # 상세 출력
+    python run_tests.py --bench             # 뷰 쿼리 수/응답 시간 벤치마크
+    python run_tests.py --bench-writes      # SQLite 동시 쓰기 부하 테스트
+    python run_tests.py --bench-async       # WSGI/ASGI 동시 요청 처리량 비교
+    python run_tests.py --bench-sessions    # 세션 프로필별 요청당 쿼리 수 비교
 """
 
 import os
@@ -113,12 +117,88 @@ def main():
         action='store_true',
         help='첫 번째 실패 시 테스트 중단'
     )
+    parser.add_argument(
+        '--bench', '-b',
+        action='store_true',
+        help='테스트 대신 뷰 벤치마크 실행 (쿼리 수, p50/p95 응답 시간, 최대 메모리)'
+    )
+    parser.add_argument(
+        '--bench-sizes',
+        default='1000,10000,100000',
+        help='벤치마크 데이터 규모(작품 수) 목록 (쉼표 구분, 기본값: 1000,10000,100000)'
+    )
+    parser.add_argument(
+        '--bench-iterations',
+        type=int,
+        default=10,
+        help='벤치마크 뷰별 반복 횟수 (기본값: 10)'
+    )
+    parser.add_argument(
+        '--bench-writes',
+        action='store_true',
+        help='SQLite 동시 쓰기 부하 테스트 실행 (기본 설정과 WAL 프로필 비교)'
+    )
+    parser.add_argument(
+        '--bench-threads',
+        type=int,
+        default=8,
+        help='동시 쓰기 부하 테스트 스레드 수 (기본값: 8)'
+    )
+    parser.add_argument(
+        '--bench-async',
+        action='store_true',
+        help='동기(WSGI) 뷰와 비동기(ASGI) 뷰의 동시 요청 처리량 비교'
+    )
+    parser.add_argument(
+        '--bench-concurrency',
+        type=int,
+        default=16,
+        help='처리량 비교 시 동시 요청 수 (기본값: 16)'
+    )
+    parser.add_argument(
+        '--bench-sessions',
+        action='store_true',
+        help='세션 저장소 프로필(db, cached_db, signed_cookies)별 요청당 쿼리 수 비교'
+    )
     
     args = parser.parse_args()
     
     # 테스트 환경 설정
     setup_test_environment()
     
+    if args.bench:
+        from opengallery.benchmarks import run_benchmarks
+        
+        sizes = [int(size) for size in args.bench_sizes.split(',') if size.strip()]
+        print("오픈갤러리 벤치마크 시작")
+        print("="*50)
+        regressions = run_benchmarks(sizes, args.bench_iterations, verbosity=args.verbose)
+        sys.exit(1 if regressions else 0)
+    
+    if args.bench_writes:
+        from opengallery.benchmarks import run_write_benchmark
+        
+        print("오픈갤러리 동시 쓰기 부하 테스트 시작")
+        print("="*50)
+        locked = run_write_benchmark(threads=args.bench_threads)
+        sys.exit(1 if locked else 0)
+    
+    if args.bench_async:
+        from opengallery.benchmarks import run_async_benchmark
+        
+        print("오픈갤러리 WSGI/ASGI 처리량 비교 시작")
+        print("="*50)
+        errors = run_async_benchmark(concurrency=args.bench_concurrency)
+        sys.exit(1 if errors else 0)
+    
+    if args.bench_sessions:
+        from opengallery.benchmarks import run_session_benchmark
+        
+        print("오픈갤러리 세션 프로필 비교 시작")
+        print("="*50)
+        increased = run_session_benchmark()
+        sys.exit(1 if increased else 0)
+    
     # 실패 시 빠른 종료 설정
     if args.failfast:
         os.environ['DJANGO_TEST_FAILFAST'] = '1'
@@ -0,0 +1,142 @@
+"""작가/작품 전문 검색 색인 (SQLite FTS5)
+
+작가(이름, 이메일, 연락처)와 작품(제목, 작가명)을 trigram 토크나이저를 사용하는
+FTS5 가상 테이블에 색인해 두고, 검색 시 LIKE '%...%' 전체 스캔 대신 색인을 조회한다.
+가상 테이블의 rowid는 원본 테이블의 id와 같다.
+
+trigram 토크나이저는 3글자 이상의 검색어만 색인으로 찾을 수 있으므로 그보다 짧은 검색어나
+SQLite가 아닌 데이터베이스에서는 기존 icontains 검색으로 대체한다.
+"""
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from artists.models import Artist
+from artworks.models import Artwork
+
+ARTIST_TABLE = 'search_artist_fts'
+ARTWORK_TABLE = 'search_artwork_fts'
+MIN_QUERY_LENGTH = 3
+
+_ARTIST_SELECT = (
+    f"SELECT id, name, email, phone_number FROM {Artist._meta.db_table}"
+)
+_ARTWORK_SELECT = (
+    f"SELECT w.id, w.title, a.name FROM {Artwork._meta.db_table} w "
+    f"JOIN {Artist._meta.db_table} a ON a.id = w.artist_id"
+)
+
+
+def is_enabled():
+    return connection.vendor == 'sqlite'
+
+
+def _placeholders(values):
+    return ', '.join(['%s'] * len(values))
+
+
+def _execute(statements):
+    if not is_enabled():
+        return
+    with connection.cursor() as cursor:
+        for sql, params in statements:
+            cursor.execute(sql, params)
+
+
+def index_artists(artist_ids):
+    """작가 색인 갱신 (삭제된 작가는 색인에서도 제거됨)"""
+    artist_ids = list(artist_ids)
+    if not artist_ids:
+        return
+    in_clause = _placeholders(artist_ids)
+    _execute([
+        (f"DELETE FROM {ARTIST_TABLE} WHERE rowid IN ({in_clause})", artist_ids),
+        (f"INSERT INTO {ARTIST_TABLE} (rowid, name, email, phone_number) "
+         f"{_ARTIST_SELECT} WHERE id IN ({in_clause})", artist_ids),
+    ])
+
+
+def index_artworks(artwork_ids):
+    """작품 색인 갱신 (삭제된 작품은 색인에서도 제거됨)"""
+    artwork_ids = list(artwork_ids)
+    if not artwork_ids:
+        return
+    in_clause = _placeholders(artwork_ids)
+    _execute([
+        (f"DELETE FROM {ARTWORK_TABLE} WHERE rowid IN ({in_clause})", artwork_ids),
+        (f"INSERT INTO {ARTWORK_TABLE} (rowid, title, artist_name) "
+         f"{_ARTWORK_SELECT} WHERE w.id IN ({in_clause})", artwork_ids),
+    ])
+
+
+def index_artworks_of_artist(artist_id):
+    """작가명이 바뀌었을 때 해당 작가의 작품 색인 갱신"""
+    _execute([
+        (f"DELETE FROM {ARTWORK_TABLE} WHERE rowid IN "
+         f"(SELECT id FROM {Artwork._meta.db_table} WHERE artist_id = %s)", [artist_id]),
+        (f"INSERT INTO {ARTWORK_TABLE} (rowid, title, artist_name) "
+         f"{_ARTWORK_SELECT} WHERE w.artist_id = %s", [artist_id]),
+    ])
+
+
+def remove_artists(artist_ids):
+    artist_ids = list(artist_ids)
+    if artist_ids:
+        _execute([(f"DELETE FROM {ARTIST_TABLE} WHERE rowid IN ({_placeholders(artist_ids)})", artist_ids)])
+
+
+def remove_artworks(artwork_ids):
+    artwork_ids = list(artwork_ids)
+    if artwork_ids:
+        _execute([(f"DELETE FROM {ARTWORK_TABLE} WHERE rowid IN ({_placeholders(artwork_ids)})", artwork_ids)])
+
+
+def rebuild():
+    """색인 전체 재생성"""
+    _execute([
+        (f"DELETE FROM {ARTIST_TABLE}", []),
+        (f"INSERT INTO {ARTIST_TABLE} (rowid, name, email, phone_number) {_ARTIST_SELECT}", []),
+        (f"DELETE FROM {ARTWORK_TABLE}", []),
+        (f"INSERT INTO {ARTWORK_TABLE} (rowid, title, artist_name) {_ARTWORK_SELECT}", []),
+    ])
+
+
+def _match_expression(query):
+    # 검색어 전체를 하나의 구문으로 취급 (FTS5 문법 문자가 연산자로 해석되지 않도록)
+    return '"' + query.replace('"', '""') + '"'
+
+
+def _uses_index(query):
+    return is_enabled() and len(query) >= MIN_QUERY_LENGTH
+
+
+def search_artists(queryset, query):
+    """작가 쿼리셋을 이름/이메일/연락처 검색어로 필터링"""
+    query = query.strip()
+    if not query:
+        return queryset
+    if _uses_index(query):
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT rowid FROM {ARTIST_TABLE} WHERE {ARTIST_TABLE} MATCH %s",
+            (_match_expression(query),)
+        ))
+    return queryset.filter(
+        Q(name__icontains=query) |
+        Q(email__icontains=query) |
+        Q(phone_number__icontains=query)
+    )
+
+
+def search_artworks(queryset, query):
+    """작품 쿼리셋을 제목/작가명 검색어로 필터링"""
+    query = query.strip()
+    if not query:
+        return queryset
+    if _uses_index(query):
+        return queryset.filter(id__in=RawSQL(
+            f"SELECT rowid FROM {ARTWORK_TABLE} WHERE {ARTWORK_TABLE} MATCH %s",
+            (_match_expression(query),)
+        ))
+    return queryset.filter(
+        Q(title__icontains=query) |
+        Q(artist__name__icontains=query)
+    )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from search import index
+
+
+class Command(BaseCommand):
+    help = '작가/작품 전문 검색 색인을 전체 재생성합니다.'
+    
+    def handle(self, *args, **options):
+        if not index.is_enabled():
+            self.stdout.write(self.style.WARNING('SQLite 데이터베이스가 아니므로 검색 색인을 사용하지 않습니다.'))
+            return
+        
+        with transaction.atomic():
+            index.rebuild()
+        self.stdout.write(self.style.SUCCESS('검색 색인을 재생성했습니다.'))
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+CREATE_SQL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_artist_fts "
+    "USING fts5(name, email, phone_number, tokenize='trigram')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_artwork_fts "
+    "USING fts5(title, artist_name, tokenize='trigram')",
+    "INSERT INTO search_artist_fts (rowid, name, email, phone_number) "
+    "SELECT id, name, email, phone_number FROM artists_artist",
+    "INSERT INTO search_artwork_fts (rowid, title, artist_name) "
+    "SELECT w.id, w.title, a.name FROM artworks_artwork w "
+    "JOIN artists_artist a ON a.id = w.artist_id",
+]
+DROP_SQL = [
+    "DROP TABLE IF EXISTS search_artist_fts",
+    "DROP TABLE IF EXISTS search_artwork_fts",
+]
+
+
+def _run(statements):
+    def operation(apps, schema_editor):
+        # FTS5 가상 테이블은 SQLite 전용 (다른 DB에서는 icontains 검색을 사용)
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('artists', '0002_artiststats'),
+        ('artworks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(CREATE_SQL), _run(DROP_SQL)),
+    ]
@@ -0,0 +1,45 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from artists.models import Artist
+from artists.signals import artists_bulk_created
+from artworks.models import Artwork
+from artworks.signals import artworks_bulk_created
+from . import index
+
+BULK_INDEX_BATCH_SIZE = 500
+
+
+@receiver(post_save, sender=Artist)
+def index_artist(sender, instance, created, **kwargs):
+    index.index_artists([instance.pk])
+    if not created:
+        # 작품 색인에 작가명이 포함되어 있으므로 함께 갱신
+        index.index_artworks_of_artist(instance.pk)
+
+
+@receiver(artists_bulk_created, sender=Artist)
+def index_bulk_created_artists(sender, instances, **kwargs):
+    index.index_artists([artist.pk for artist in instances])
+
+
+@receiver(post_delete, sender=Artist)
+def remove_artist(sender, instance, **kwargs):
+    index.remove_artists([instance.pk])
+
+
+@receiver(post_save, sender=Artwork)
+def index_artwork(sender, instance, **kwargs):
+    index.index_artworks([instance.pk])
+
+
+@receiver(post_delete, sender=Artwork)
+def remove_artwork(sender, instance, **kwargs):
+    index.remove_artworks([instance.pk])
+
+
+@receiver(artworks_bulk_created, sender=Artwork)
+def index_bulk_created_artworks(sender, instances, **kwargs):
+    artwork_ids = [artwork.pk for artwork in instances]
+    # SQLite 바인드 변수 수 제한을 넘지 않도록 나누어 색인
+    for start in range(0, len(artwork_ids), BULK_INDEX_BATCH_SIZE):
+        index.index_artworks(artwork_ids[start:start + BULK_INDEX_BATCH_SIZE])
@@ -0,0 +1,142 @@
+"""검색어 자동 완성용 메모리 접두사 색인
+
+작가 이름과 작품 제목을 (정규화된 키, 표시 문자열) 정렬 목록으로 메모리에 올려 두고
+bisect로 접두사 범위를 찾는다. 제목 중간 단어로도 찾을 수 있도록 단어가 시작하는 위치마다
+키를 하나씩 만든다 ("푸른 바다" -> "푸른 바다", "바다").
+
+색인은 프로세스마다 종류별로 하나씩 두며, 해당 모델의 세대 토큰(opengallery.generations)이
+바뀌면 그 종류의 색인만 다시 만든다. 다시 만드는 동안에는 요청 스레드를 막지 않고 이전 색인으로
+응답하며 (SUGGEST_BACKGROUND_REBUILD), 새 색인이 준비되면 교체한다. 따라서 조회 한 번에 드는
+비용은 세대 토큰 캐시 조회와 bisect뿐이고, 프로세스가 처음 색인을 만들 때를 제외하면
+데이터베이스에 접근하지 않는다.
+"""
+import threading
+from bisect import bisect_left
+from django.conf import settings
+from django.db import connection
+from artists.models import Artist
+from artworks.models import Artwork
+from opengallery import generations
+
+# 색인 종류 -> 세대 토큰을 확인할 모델
+SUGGEST_MODELS = {
+    'artists': 'artists.Artist',
+    'artworks': 'artworks.Artwork',
+}
+DEFAULT_SUGGEST_LIMIT = 5
+MAX_SUGGEST_LIMIT = 20
+
+
+def normalize(text):
+    return ' '.join(text.casefold().split())
+
+
+class PrefixIndex:
+    """정렬된 (키, 표시 문자열) 목록에 대한 접두사 검색"""
+    
+    def __init__(self, texts):
+        entries = set()
+        for text in texts:
+            normalized = normalize(text)
+            if not normalized:
+                continue
+            words = normalized.split(' ')
+            for start in range(len(words)):
+                entries.add((' '.join(words[start:]), text))
+        entries = sorted(entries)
+        self.keys = [key for key, _ in entries]
+        self.texts = [text for _, text in entries]
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def lookup(self, prefix, limit=DEFAULT_SUGGEST_LIMIT):
+        """prefix로 시작하는 (또는 그 단어로 시작하는) 표시 문자열을 키 순서로 최대 limit개 반환"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        results = []
+        position = bisect_left(self.keys, prefix)
+        while position < len(self.keys) and self.keys[position].startswith(prefix):
+            text = self.texts[position]
+            if text not in results:
+                results.append(text)
+                if len(results) >= limit:
+                    break
+            position += 1
+        return results
+
+
+_lock = threading.Lock()
+# 종류별 (세대 토큰, 색인) - 한 번에 교체해 다른 스레드가 세대와 색인이 어긋난 상태를 보지 않도록 함
+_current = {}
+# 다시 만드는 중인 종류 (같은 종류를 동시에 두 번 만들지 않도록 함)
+_rebuilding = set()
+
+
+def build(kind):
+    if kind == 'artists':
+        return PrefixIndex(Artist.objects.values_list('name', flat=True).distinct())
+    return PrefixIndex(Artwork.objects.values_list('title', flat=True).distinct())
+
+
+def refresh(kind, token):
+    """kind 색인을 다시 만들어 token 세대의 색인으로 교체"""
+    try:
+        index = build(kind)
+        with _lock:
+            _current[kind] = (token, index)
+    finally:
+        with _lock:
+            _rebuilding.discard(kind)
+
+
+def _refresh_in_background(kind, token):
+    try:
+        refresh(kind, token)
+    finally:
+        # 스레드마다 열린 데이터베이스 연결을 정리
+        connection.close()
+
+
+def _schedule_refresh(kind, token):
+    with _lock:
+        if kind in _rebuilding:
+            return
+        _rebuilding.add(kind)
+    if getattr(settings, 'SUGGEST_BACKGROUND_REBUILD', True):
+        threading.Thread(target=_refresh_in_background, args=(kind, token), daemon=True).start()
+    else:
+        refresh(kind, token)
+
+
+def get_indexes(kinds=tuple(SUGGEST_MODELS)):
+    """종류별 색인 {kind: PrefixIndex}
+
+    세대가 바뀐 종류는 다시 만들도록 예약하고 새 색인이 준비될 때까지 이전 색인을 반환한다.
+    아직 색인이 없는 종류(프로세스 시작 직후)만 요청 안에서 만든다.
+    """
+    labels = {kind: SUGGEST_MODELS[kind] for kind in kinds}
+    tokens = generations.get_generations(*labels.values())
+    indexes = {}
+    for kind, label in labels.items():
+        token = tokens[label]
+        built_for, index = _current.get(kind, (None, None))
+        if index is None:
+            with _lock:
+                built_for, index = _current.get(kind, (None, None))
+                # 다른 스레드가 기다리는 동안 먼저 만들었으면 그대로 사용
+                if index is None:
+                    index = build(kind)
+                    _current[kind] = (token, index)
+        elif built_for != token:
+            _schedule_refresh(kind, token)
+            index = _current[kind][1]
+        indexes[kind] = index
+    return indexes
+
+
+def suggest(prefix, limit=DEFAULT_SUGGEST_LIMIT, kinds=('artists', 'artworks')):
+    """종류별 자동 완성 후보 {'artists': [...], 'artworks': [...]}"""
+    indexes = get_indexes(kinds)
+    return {kind: indexes[kind].lookup(prefix, limit) for kind in kinds}
@@ -0,0 +1,245 @@
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import date
+from io import StringIO
+from unittest import mock
+from artists.models import Artist, ArtistApplication
+from artists.services import process_application_batch
+from artworks.models import Artwork
+from opengallery.tests import LOCMEM_CACHES
+from . import index
+from . import suggest
+from .suggest import PrefixIndex
+import time
+
+
+class SearchIndexTest(TestCase):
+    """전문 검색 색인 동기화 및 검색 테스트"""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(username='artist', password='artistpass123')
+        self.artist = Artist.objects.create(
+            user=self.user,
+            name='김작가',
+            gender='남자',
+            birthday=date(1990, 1, 1),
+            email='painter@example.com',
+            phone_number='010-1234-5678'
+        )
+        self.artwork = Artwork.objects.create(
+            artist=self.artist,
+            title='푸른 바다의 노래',
+            price=1000000,
+            size_number=50
+        )
+    
+    def _artist_results(self, query):
+        return list(index.search_artists(Artist.objects.all(), query))
+    
+    def _artwork_results(self, query):
+        return list(index.search_artworks(Artwork.objects.all(), query))
+    
+    def test_search_artists_by_any_field(self):
+        """작가 이름/이메일/연락처 부분 검색 테스트"""
+        self.assertEqual(self._artist_results('김작가'), [self.artist])
+        self.assertEqual(self._artist_results('PAINTER'), [self.artist])
+        self.assertEqual(self._artist_results('1234-56'), [self.artist])
+        self.assertEqual(self._artist_results('없는작가'), [])
+    
+    def test_search_artworks_by_title_and_artist(self):
+        """작품 제목/작가명 부분 검색 테스트"""
+        self.assertEqual(self._artwork_results('바다의'), [self.artwork])
+        self.assertEqual(self._artwork_results('김작가'), [self.artwork])
+    
+    def test_search_uses_fts_index(self):
+        """3글자 이상 검색어는 FTS 색인을 사용하는지 테스트"""
+        with CaptureQueriesContext(connection) as ctx:
+            self._artwork_results('바다의')
+        self.assertIn('MATCH', ctx.captured_queries[-1]['sql'])
+        self.assertNotIn('LIKE', ctx.captured_queries[-1]['sql'])
+    
+    def test_short_query_falls_back_to_icontains(self):
+        """짧은 검색어는 icontains 검색으로 대체되는지 테스트"""
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self._artwork_results('바다'), [self.artwork])
+        self.assertIn('LIKE', ctx.captured_queries[-1]['sql'])
+    
+    def test_query_with_fts_syntax_characters(self):
+        """FTS 문법 문자가 포함된 검색어 처리 테스트"""
+        self.assertEqual(self._artwork_results('"바다" OR *'), [])
+    
+    def test_index_follows_changes(self):
+        """작가명 변경, 작품 수정/삭제 시 색인 갱신 테스트"""
+        self.artist.name = '이화가'
+        self.artist.save()
+        self.assertEqual(self._artwork_results('이화가'), [self.artwork])
+        self.assertEqual(self._artwork_results('김작가'), [])
+        
+        self.artwork.title = '붉은 노을'
+        self.artwork.save()
+        self.assertEqual(self._artwork_results('바다의'), [])
+        self.assertEqual(self._artwork_results('붉은 노을'), [self.artwork])
+        
+        self.artwork.delete()
+        self.assertEqual(self._artwork_results('붉은 노을'), [])
+        
+        self.user.delete()
+        self.assertEqual(self._artist_results('이화가'), [])
+    
+    def test_bulk_approved_artists_are_indexed(self):
+        """일괄 승인으로 생성된 작가도 색인되는지 테스트"""
+        applicant = User.objects.create_user(username='applicant', password='testpass123')
+        application = ArtistApplication.objects.create(
+            user=applicant,
+            name='박신인',
+            gender='여자',
+            birthday=date(1995, 5, 15),
+            email='newcomer@example.com',
+            phone_number='010-9876-5432'
+        )
+        
+        process_application_batch([application.id], 'approve')
+        
+        self.assertEqual([a.name for a in self._artist_results('newcomer')], ['박신인'])
+    
+    def test_rebuild_command(self):
+        """검색 색인 재생성 명령 테스트"""
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {index.ARTWORK_TABLE}')
+        self.assertEqual(self._artwork_results('바다의'), [])
+        
+        call_command('rebuild_search_index', stdout=StringIO())
+        
+        self.assertEqual(self._artwork_results('바다의'), [self.artwork])
+    
+    def test_list_views_use_search(self):
+        """작가/작품 목록 검색 테스트"""
+        response = self.client.get(reverse('artworks:artwork_list'), {'search': '바다의'})
+        self.assertContains(response, '푸른 바다의 노래')
+        
+        response = self.client.get(reverse('artists:artist_list'), {'search': 'painter@'})
+        self.assertContains(response, '김작가')
+
+
+class PrefixIndexTest(TestCase):
+    """메모리 접두사 색인 테스트"""
+    
+    def setUp(self):
+        self.index = PrefixIndex(['푸른 바다의 노래', '푸른 숲', 'Blue Moon', '바다', '푸른 숲', ''])
+    
+    def test_prefix_and_word_prefix(self):
+        """문자열 앞부분과 중간 단어의 앞부분으로 찾을 수 있는지 테스트"""
+        self.assertEqual(self.index.lookup('푸른'), ['푸른 바다의 노래', '푸른 숲'])
+        self.assertEqual(self.index.lookup('바다'), ['바다', '푸른 바다의 노래'])
+        self.assertEqual(self.index.lookup('  moon'), ['Blue Moon'])
+        self.assertEqual(self.index.lookup('blue  m'), ['Blue Moon'])
+        self.assertEqual(self.index.lookup('노래방'), [])
+        self.assertEqual(self.index.lookup(''), [])
+    
+    def test_limit(self):
+        """limit개까지만 반환하는지 테스트"""
+        self.assertEqual(self.index.lookup('푸른', limit=1), ['푸른 바다의 노래'])
+    
+    def test_lookup_is_fast(self):
+        """대량의 제목에서도 조회 한 번이 5ms 안에 끝나는지 테스트"""
+        large = PrefixIndex(f'작품 {i} 풍경' for i in range(20000))
+        started = time.perf_counter()
+        for i in range(100):
+            large.lookup(f'작품 {i}', limit=10)
+        self.assertLess((time.perf_counter() - started) / 100, 0.005)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SuggestViewTest(TestCase):
+    """자동 완성 엔드포인트 테스트"""
+    
+    def setUp(self):
+        cache.clear()
+        # 다른 테스트에서 만든 프로세스 색인을 비워 처음 만드는 상태에서 시작
+        suggest._current.clear()
+        self.artist = Artist.objects.create(
+            user=User.objects.create_user(username='artist', password='artistpass123'),
+            name='김작가',
+            gender='남자',
+            birthday=date(1990, 1, 1),
+            email='painter@example.com',
+            phone_number='010-1234-5678'
+        )
+        Artwork.objects.create(artist=self.artist, title='푸른 바다의 노래', price=1000, size_number=10)
+        self.url = reverse('search:suggest')
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def test_suggest(self):
+        """작가 이름과 작품 제목 후보를 반환하는지 테스트"""
+        response = self.client.get(self.url, {'q': '김'})
+        self.assertEqual(response.json(), {'artists': ['김작가'], 'artworks': []})
+        
+        response = self.client.get(self.url, {'q': '바다', 'kind': 'artworks'})
+        self.assertEqual(response.json(), {'artworks': ['푸른 바다의 노래']})
+    
+    def test_no_database_queries_once_built(self):
+        """색인을 만든 뒤에는 요청마다 데이터베이스를 조회하지 않는지 테스트"""
+        self.client.get(self.url, {'q': '김'})
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {'q': '푸'})
+        self.assertEqual(response.json()['artworks'], ['푸른 바다의 노래'])
+        self.assertEqual(len(ctx.captured_queries), 0)
+    
+    def test_rebuilt_after_changes(self):
+        """작품이 추가되면 다음 요청에서 새 제목이 후보에 나오는지 테스트"""
+        self.client.get(self.url, {'q': '푸'})
+        with self.captureOnCommitCallbacks(execute=True):
+            Artwork.objects.create(artist=self.artist, title='푸른 하늘', price=1000, size_number=10)
+        
+        response = self.client.get(self.url, {'q': '푸', 'kind': 'artworks'})
+        self.assertEqual(response.json()['artworks'], ['푸른 바다의 노래', '푸른 하늘'])
+    
+    def test_only_stale_kind_is_rebuilt(self):
+        """작품만 바뀌면 작품 색인만 다시 만드는지 테스트"""
+        self.client.get(self.url, {'q': '푸'})
+        with self.captureOnCommitCallbacks(execute=True):
+            Artwork.objects.create(artist=self.artist, title='푸른 하늘', price=1000, size_number=10)
+        
+        with mock.patch.object(suggest, 'build', wraps=suggest.build) as build:
+            self.client.get(self.url, {'q': '푸'})
+        self.assertEqual([call.args for call in build.call_args_list], [('artworks',)])
+    
+    @override_settings(SUGGEST_BACKGROUND_REBUILD=True)
+    def test_rebuilt_outside_request(self):
+        """색인을 다시 만드는 동안 요청은 이전 색인으로 바로 응답하는지 테스트"""
+        self.client.get(self.url, {'q': '푸'})
+        with self.captureOnCommitCallbacks(execute=True):
+            Artwork.objects.create(artist=self.artist, title='푸른 하늘', price=1000, size_number=10)
+        
+        with mock.patch.object(suggest.threading, 'Thread') as thread:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(self.url, {'q': '푸', 'kind': 'artworks'})
+                self.client.get(self.url, {'q': '푸', 'kind': 'artworks'})
+        self.assertEqual(response.json()['artworks'], ['푸른 바다의 노래'])
+        self.assertEqual(len(ctx.captured_queries), 0)
+        # 이미 다시 만드는 중이면 스레드를 더 만들지 않음
+        self.assertEqual(thread.call_count, 1)
+        
+        # 백그라운드 작업이 끝나면 새 색인으로 교체
+        suggest.refresh(*thread.call_args.kwargs['args'])
+        response = self.client.get(self.url, {'q': '푸', 'kind': 'artworks'})
+        self.assertEqual(response.json()['artworks'], ['푸른 바다의 노래', '푸른 하늘'])
+    
+    def test_invalid_parameters(self):
+        """잘못된 kind/limit은 400, 범위를 벗어난 limit은 허용 범위로 조정되는지 테스트"""
+        self.assertEqual(self.client.get(self.url, {'q': '김', 'kind': 'users'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'q': '김', 'limit': 'many'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'q': '김', 'limit': '1000'}).status_code, 200)
+    
+    def test_list_pages_wire_suggestions(self):
+        """작가/작품 목록 검색창에 자동 완성 설정이 있는지 테스트"""
+        response = self.client.get(reverse('artworks:artwork_list'))
+        self.assertContains(response, f'data-suggest-url="{self.url}"')
+        self.assertContains(response, 'list="artworks-suggestions"')
@@ -0,0 +1,31 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from . import suggest as suggest_index
+
+SUGGEST_KINDS = ('artists', 'artworks')
+
+
+@require_GET
+def suggest(request):
+    """검색어 자동 완성 후보
+
+        GET /search/suggest/?q=푸른&kind=artworks&limit=5
+        {"artworks": ["푸른 바다의 노래", ...]}
+
+    kind를 생략하면 작가와 작품 후보를 모두 반환한다. 세션/사용자를 조회하지 않는다.
+    """
+    prefix = request.GET.get('q', '')[:100]
+    kind = request.GET.get('kind', '')
+    if kind and kind not in SUGGEST_KINDS:
+        return JsonResponse({'error': f'kind는 {", ".join(SUGGEST_KINDS)} 중 하나여야 합니다.'}, status=400)
+    try:
+        limit = int(request.GET.get('limit', suggest_index.DEFAULT_SUGGEST_LIMIT))
+    except ValueError:
+        return JsonResponse({'error': 'limit은 숫자여야 합니다.'}, status=400)
+    limit = max(1, min(limit, suggest_index.MAX_SUGGEST_LIMIT))
+    
+    kinds = (kind,) if kind else SUGGEST_KINDS
+    return JsonResponse(
+        suggest_index.suggest(prefix, limit, kinds),
+        json_dumps_params={'ensure_ascii': False},
+    )
@@ -125,6 +125,15 @@ document.addEventListener('DOMContentLoaded', function() {
         }, index * 100);
     });
     
+    // 테이블 헤더 클릭 정렬
+    setupTableSorting();
+    
+    // 목록 무한 스크롤
+    setupFeedScroll();
+    
+    // 검색어 자동 완성
+    setupSearchEnhancements();
+    
     // 뒤로 가기 버튼 이벤트
     const backButtons = document.querySelectorAll('[data-back]');
     backButtons.forEach(button => {
@@ -222,6 +231,16 @@ function setupTableSorting() {
 }
 
 function sortTable(table, column) {
+    // 서버 정렬 테이블은 현재 페이지만 정렬하면 안 되므로 정렬된 첫 페이지를 다시 요청
+    if (table.dataset.serverSort !== undefined) {
+        const current = table.dataset.sortCurrent || '';
+        const url = new URL(window.location.href);
+        url.searchParams.set('sort', current === column ? '-' + column : column);
+        url.searchParams.delete('page');
+        window.location.href = url.toString();
+        return;
+    }
+    
     // 테이블 정렬 로직 구현
     const tbody = table.querySelector('tbody');
     const rows = Array.from(tbody.querySelectorAll('tr'));
@@ -243,16 +262,47 @@ function sortTable(table, column) {
     rows.forEach(row => tbody.appendChild(row));
 }
 
-// 검색 기능 개선
+// 검색 기능 개선: 입력이 멈추면 자동 완성 후보를 datalist로 표시
+// <input data-search data-suggest-url="..." data-suggest-kind="artists" list="...">
 function setupSearchEnhancements() {
     const searchInputs = document.querySelectorAll('input[type="text"][data-search]');
     searchInputs.forEach(input => {
+        const datalist = input.list;
+        if (!input.dataset.suggestUrl || !datalist) return;
+        
         let timeout;
+        let controller;
         input.addEventListener('input', function() {
             clearTimeout(timeout);
             timeout = setTimeout(() => {
-                // 실시간 검색 구현 (필요시)
-            }, 500);
+                const query = input.value.trim();
+                if (!query) {
+                    datalist.innerHTML = '';
+                    return;
+                }
+                
+                // 이전 요청의 응답이 늦게 도착해 최신 후보를 덮어쓰지 않도록 취소
+                if (controller) controller.abort();
+                controller = new AbortController();
+                
+                const url = new URL(input.dataset.suggestUrl, window.location.origin);
+                url.searchParams.set('q', query);
+                if (input.dataset.suggestKind) url.searchParams.set('kind', input.dataset.suggestKind);
+                
+                fetch(url, { signal: controller.signal })
+                    .then(response => response.json())
+                    .then(data => {
+                        datalist.innerHTML = '';
+                        Object.values(data).flat().forEach(text => {
+                            const option = document.createElement('option');
+                            option.value = text;
+                            datalist.appendChild(option);
+                        });
+                    })
+                    .catch(error => {
+                        if (error.name !== 'AbortError') console.error('Error:', error);
+                    });
+            }, 150);
         });
     });
 }
@@ -275,6 +325,43 @@ function setupInfiniteScroll(loadMoreCallback) {
     });
 }
 
+// 서버 조각(JSON {html, next_cursor})을 이어 붙이는 무한 스크롤
+// <div data-infinite-scroll data-feed-url="..." data-next-cursor="..." data-search="...">
+function setupFeedScroll() {
+    document.querySelectorAll('[data-infinite-scroll]').forEach(container => {
+        if (!container.dataset.nextCursor) return;
+        
+        // 스크롤로 다음 카드를 불러오므로 페이지 링크는 숨김
+        const pagination = container.parentNode.querySelector('[data-pagination]');
+        if (pagination) pagination.style.display = 'none';
+        
+        setupInfiniteScroll(() => {
+            const cursor = container.dataset.nextCursor;
+            if (!cursor) return Promise.resolve();
+            
+            const url = new URL(container.dataset.feedUrl, window.location.origin);
+            url.searchParams.set('cursor', cursor);
+            if (container.dataset.search) url.searchParams.set('search', container.dataset.search);
+            
+            return fetch(url)
+                .then(response => {
+                    if (!response.ok) throw new Error(response.status);
+                    return response.json();
+                })
+                .then(data => {
+                    container.insertAdjacentHTML('beforeend', data.html);
+                    container.dataset.nextCursor = data.next_cursor || '';
+                })
+                .catch(error => {
+                    // 실패하면 페이지 링크로 계속 탐색할 수 있도록 다시 표시
+                    container.dataset.nextCursor = '';
+                    if (pagination) pagination.style.display = '';
+                    console.error('Error:', error);
+                });
+        });
+    });
+}
+
 // 로컬 스토리지 헬퍼
 const Storage = {
     set(key, value) {
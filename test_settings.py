@@ -20,6 +20,12 @@ CACHES = {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
     }
 }
+# 테스트는 CACHES의 default만 바꿔 끼우므로 용도별 캐시도 default를 사용
+GENERATION_CACHE_ALIAS = 'default'
+SESSION_CACHE_ALIAS = 'default'
+
+# 자동 완성 색인은 요청 안에서 바로 다시 만든다 (테스트 트랜잭션 밖의 스레드는 데이터를 볼 수 없음)
+SUGGEST_BACKGROUND_REBUILD = False
 
 # 테스트 시 로깅 레벨 조정
 LOGGING = {
@@ -41,6 +47,9 @@ LOGGING = {
 # 패스워드 검증 비활성화 (테스트 속도 향상)
 AUTH_PASSWORD_VALIDATORS = []
 
+# 빠른 해시 사용 (테스트 속도 향상)
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # 테스트 시 디버그 모드
 DEBUG = True
 